@@ -19,13 +19,19 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    device_registry,
+    entity_registry,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    async_preload_integrations,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -236,6 +242,8 @@ async def async_from_config_dict(
         )
         return None
 
+    await template.async_load_bytecode_cache(hass)
+
     await _async_set_up_integrations(hass, config)
 
     stop = monotonic()
@@ -527,6 +535,16 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
+    # Import the stage 1 integrations in the executor while the registries load
+    async_preload_integrations(
+        hass,
+        (
+            integration_cache[domain]
+            for domain in stage_1_domains
+            if domain in integration_cache
+        ),
+    )
+
     # Load the registries
     await asyncio.gather(
         device_registry.async_load(hass),
@@ -549,6 +567,14 @@ async def _async_set_up_integrations(
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
+        async_preload_integrations(
+            hass,
+            (
+                integration_cache[domain]
+                for domain in stage_2_domains
+                if domain in integration_cache
+            ),
+        )
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
             async with hass.timeout.async_timeout(
@@ -570,6 +596,14 @@ async def _async_set_up_integrations(
             )
         },
     )
+    import_time: dict[str, float] = hass.data.get(loader.DATA_IMPORT_TIME, {})
+    _LOGGER.debug(
+        "Integration import times: %s",
+        {
+            module: seconds
+            for module, seconds in sorted(import_time.items(), key=lambda item: item[1])
+        },
+    )
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
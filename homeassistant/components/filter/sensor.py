@@ -1,10 +1,10 @@
 """Allows the creation of a sensor that filters state property."""
 from __future__ import annotations
 
+import asyncio
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
-from functools import partial
 import logging
 from numbers import Number
 import statistics
@@ -13,7 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.input_number import DOMAIN as INPUT_NUMBER_DOMAIN
-from homeassistant.components.recorder import history
+from homeassistant.components.recorder import preload
 from homeassistant.components.sensor import (
     DEVICE_CLASSES as SENSOR_DEVICE_CLASSES,
     DOMAIN as SENSOR_DOMAIN,
@@ -260,7 +260,7 @@ class SensorFilter(SensorEntity):
         """Register callbacks."""
 
         if "recorder" in self.hass.config.components:
-            history_list = []
+            history_states = []
             largest_window_items = 0
             largest_window_time = timedelta(0)
 
@@ -278,38 +278,36 @@ class SensorFilter(SensorEntity):
                     largest_window_time = filt.window_size
 
             # Retrieve the largest window_size of each type
+            count_request = time_request = None
             if largest_window_items > 0:
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
-                        self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
-                    )
+                count_request = preload.async_get_states(
+                    self.hass, self._entity, number_of_states=largest_window_items
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
-                start = dt_util.utcnow() - largest_window_time
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                start_time = dt_util.utcnow() - largest_window_time
+                time_request = preload.async_get_states(
+                    self.hass,
+                    self._entity,
+                    start_time=start_time,
+                    include_start_state=True,
+                )
+
+            if count_request and time_request:
+                count_states, time_states = await asyncio.gather(
+                    count_request, time_request
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
+                # Both windows hold the most recent states. The one reaching
+                # further back contains the other, including the start state of
+                # the time window which is moved to its start.
+                if count_states and count_states[0].last_updated < start_time:
+                    history_states = count_states
+                else:
+                    history_states = time_states
+            elif count_request or time_request:
+                history_states = await (count_request or time_request)
 
             # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
+            history_list = sorted(history_states, key=lambda s: s.last_updated)
             _LOGGER.debug(
                 "Loading from history: %s",
                 [(s.state, s.last_updated) for s in history_list],
@@ -1,21 +1,29 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
+from functools import partial
+from itertools import chain
 import logging
 import time
-from typing import cast
 
 from aiohttp import web
+import async_timeout
 from sqlalchemy import not_, or_
 import voluptuous as vol
 
+from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.components import websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder import history, models as history_models
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
     list_statistic_ids,
+    pick_statistics_period,
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -24,9 +32,11 @@ from homeassistant.const import (
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.exceptions import Unauthorized
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
 from homeassistant.helpers.entityfilter import (
@@ -42,6 +52,11 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# Period of history sent in each message of a history stream
+STREAM_WINDOW = timedelta(days=1)
+# Seconds to wait for the recorder to commit the states before streaming
+STREAM_COMMIT_TIMEOUT = 30
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -109,6 +124,7 @@ async def async_setup(hass, config):
         ws_get_statistics_during_period
     )
     hass.components.websocket_api.async_register_command(ws_get_list_statistic_ids)
+    hass.components.websocket_api.async_register_command(ws_stream)
 
     return True
 
@@ -124,6 +140,7 @@ class LazyState(history_models.LazyState):
         vol.Required("start_time"): str,
         vol.Optional("end_time"): str,
         vol.Optional("statistic_ids"): [str],
+        vol.Optional("period"): vol.Any(PERIOD_5MINUTE, PERIOD_HOUR),
     }
 )
 @websocket_api.async_response
@@ -151,12 +168,17 @@ async def ws_get_statistics_during_period(
     else:
         end_time = None
 
+    # Pick the 5-minute or hourly statistics from the requested period,
+    # unless the client asks for one of them
+    period = msg.get("period") or pick_statistics_period(hass, start_time, end_time)
+
     statistics = await hass.async_add_executor_job(
         statistics_during_period,
         hass,
         start_time,
         end_time,
         msg.get("statistic_ids"),
+        period,
     )
     connection.send_result(msg["id"], statistics)
 
@@ -195,7 +217,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -244,10 +266,10 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await hass.async_add_executor_job(
-                self._sorted_significant_states_json,
+        return await self.json_stream(
+            request,
+            partial(
+                self._sorted_significant_states,
                 hass,
                 start_time,
                 end_time,
@@ -258,7 +280,7 @@ class HistoryPeriodView(HomeAssistantView):
             ),
         )
 
-    def _sorted_significant_states_json(
+    def _sorted_significant_states(
         self,
         hass,
         start_time,
@@ -268,43 +290,205 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only,
         minimal_response,
     ):
-        """Fetch significant stats from the database as json."""
+        """Yield the significant states of each entity from the database."""
         timer_start = time.perf_counter()
+        state_count = 0
 
         with session_scope(hass=hass) as session:
-            result = (
-                history._get_significant_states(  # pylint: disable=protected-access
-                    hass,
-                    session,
-                    start_time,
-                    end_time,
-                    entity_ids,
-                    self.filters,
-                    include_start_time_state,
-                    significant_changes_only,
-                    minimal_response,
-                )
+            result = history.stream_significant_states(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
             )
 
-        result = list(result.values())
+            # Optionally reorder the result to respect the ordering given
+            # by any entities explicitly included in the configuration.
+            # This needs every entity before the first one can be sent.
+            if self.filters and self.use_include_order:
+                by_entity = dict(result)
+                ordered = [
+                    by_entity.pop(order_entity)
+                    for order_entity in self.filters.included_entities
+                    if order_entity in by_entity
+                ]
+                ordered.extend(by_entity.values())
+                result = ((None, states) for states in ordered)
+
+            for _, states in result:
+                state_count += len(states)
+                yield states
+
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
-            _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
-
-        # Optionally reorder the result to respect the ordering given
-        # by any entities explicitly included in the configuration.
-        if self.filters and self.use_include_order:
-            sorted_result = []
-            for order_entity in self.filters.included_entities:
-                for state_list in result:
-                    if state_list[0].entity_id == order_entity:
-                        sorted_result.append(state_list)
-                        result.remove(state_list)
-                        break
-            sorted_result.extend(result)
-            result = sorted_result
-
-        return self.json(result)
+            _LOGGER.debug("Extracted %d states in %fs", state_count, elapsed)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream",
+        vol.Required("start_time"): str,
+        vol.Required("entity_ids"): cv.entity_ids,
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_stream(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Stream the history of entities followed by their state changes.
+
+    The history is sent in time ordered windows. Of the state changes that
+    happen while the history is sent, the latest state of each entity is
+    held back and sent right after it.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time:
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    entity_ids = msg["entity_ids"]
+    for entity_id in entity_ids:
+        if not connection.user.permissions.check_entity(entity_id, POLICY_READ):
+            raise Unauthorized(entity_id=entity_id)
+
+    msg_id = msg["id"]
+    significant_changes_only = msg["significant_changes_only"]
+    held_states: dict[str, State] = {}
+    sending_history = True
+
+    @callback
+    def _forward_state(event: Event) -> None:
+        """Forward a state change or hold it back until the history is sent."""
+        new_state = event.data["new_state"]
+        if new_state is None or (
+            significant_changes_only and not _is_significant(new_state)
+        ):
+            return
+        if sending_history:
+            held_states[new_state.entity_id] = new_state
+            return
+        connection.send_message(
+            websocket_api.event_message(
+                msg_id, {"states": {new_state.entity_id: [new_state]}}
+            )
+        )
+
+    # Everything before end_time comes from the database, everything after
+    # it from the state machine. Never await between these steps.
+    end_time = dt_util.utcnow()
+    current_states = [hass.states.get(entity_id) for entity_id in entity_ids]
+    connection.subscriptions[msg_id] = hass.bus.async_listen_entity(
+        EVENT_STATE_CHANGED, entity_ids, _forward_state
+    )
+    connection.send_result(msg_id)
+
+    # Make sure the states changed before end_time are in the database
+    try:
+        with async_timeout.timeout(STREAM_COMMIT_TIMEOUT):
+            await hass.data[DATA_INSTANCE].async_wait_committed()
+    except asyncio.TimeoutError:
+        unsub = connection.subscriptions.pop(msg_id, None)
+        if unsub is not None:
+            unsub()
+            connection.send_error(
+                msg_id,
+                websocket_api.const.ERR_TIMEOUT,
+                "Timed out waiting for the recorder to commit",
+            )
+        return
+    if msg_id not in connection.subscriptions:
+        return
+
+    last_updated: dict[str, dt] = {}
+    include_start_time_state = msg["include_start_time_state"]
+    window_start = start_time
+    while window_start < end_time:
+        window_end = min(window_start + STREAM_WINDOW, end_time)
+        message = await hass.async_add_executor_job(
+            _history_window_message,
+            hass,
+            msg_id,
+            window_start,
+            window_end,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            msg["minimal_response"],
+            last_updated,
+        )
+        if msg_id not in connection.subscriptions:
+            # Unsubscribed while the history was sent
+            return
+        connection.send_message(message)
+        include_start_time_state = False
+        window_start = window_end
+
+    # The current states cover entities without recorded history. Held
+    # back states may have been recorded already, since listeners are
+    # looked up when an event is dispatched.
+    tail: dict[str, list[State]] = {}
+    for state in chain(current_states, held_states.values()):
+        if state is None or state.last_updated < start_time:
+            continue
+        last_sent = last_updated.get(state.entity_id)
+        if (last_sent is not None and state.last_updated <= last_sent) or (
+            significant_changes_only and not _is_significant(state)
+        ):
+            continue
+        last_updated[state.entity_id] = state.last_updated
+        tail.setdefault(state.entity_id, []).append(state)
+    sending_history = False
+    if tail:
+        connection.send_message(websocket_api.event_message(msg_id, {"states": tail}))
+
+
+def _history_window_message(
+    hass,
+    msg_id,
+    start_time,
+    end_time,
+    entity_ids,
+    include_start_time_state,
+    significant_changes_only,
+    minimal_response,
+    last_updated,
+):
+    """Fetch a window of history and serialize it to a websocket message."""
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    )
+    for entity_id, entity_states in states.items():
+        last_updated[entity_id] = entity_states[-1].last_updated
+    return websocket_api.messages.message_to_json(
+        websocket_api.event_message(
+            msg_id, {"states": states, "start_time": start_time, "end_time": end_time}
+        )
+    )
+
+
+def _is_significant(state: State) -> bool:
+    """Return if a state change would be returned by significant history."""
+    return (
+        state.domain in history.SIGNIFICANT_DOMAINS
+        or state.last_changed == state.last_updated
+    )
 
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 import json
 import logging
 from typing import Any
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.typedefs import LooseHeaders
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
@@ -26,6 +26,9 @@ from .const import KEY_AUTHENTICATED, KEY_HASS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of bytes of JSON collected before a streamed chunk is written
+STREAM_CHUNK_SIZE = 65536
+
 
 class HomeAssistantView:
     """Base view for all views."""
@@ -66,6 +69,39 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    async def json_stream(
+        request: web.Request, items: Callable[[], Iterable[Any]]
+    ) -> web.StreamResponse:
+        """Stream a JSON list of the items generated by items.
+
+        items is called in the executor. Every item is encoded as soon as
+        it is generated and written in chunks, so the full result is never
+        held in memory.
+
+        The status is sent before the first item is generated. An error
+        while streaming can not change it anymore, so it is logged and the
+        connection is closed without ending the chunked body. Clients see
+        an incomplete response instead of a truncated JSON list.
+        """
+        hass = request.app[KEY_HASS]
+        response = web.StreamResponse(headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_chunked_encoding()
+        response.enable_compression()
+        await response.prepare(request)
+        try:
+            await hass.async_add_executor_job(
+                _write_json_stream, hass.loop, response, items
+            )
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while streaming %s", request.path)
+            response.force_close()
+            if request.transport is not None:
+                request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
     def json_message(
         self,
         message: str,
@@ -163,3 +199,33 @@ def request_handler_factory(
         return web.Response(body=bresult, status=status_code)
 
     return handle
+
+
+def _write_json_stream(
+    loop: asyncio.AbstractEventLoop,
+    response: web.StreamResponse,
+    items: Callable[[], Iterable[Any]],
+) -> None:
+    """Encode the items as a JSON list and write it to the response in chunks."""
+    encode = JSONEncoder(allow_nan=False).encode
+    chunk: list[str] = []
+    chunk_size = 0
+    separator = "["
+
+    for item in items():
+        data = encode(item)
+        chunk.append(separator)
+        chunk.append(data)
+        separator = ","
+        chunk_size += len(data)
+        if chunk_size >= STREAM_CHUNK_SIZE:
+            asyncio.run_coroutine_threadsafe(
+                response.write("".join(chunk).encode("UTF-8")), loop
+            ).result()
+            chunk.clear()
+            chunk_size = 0
+
+    chunk.append("[]" if separator == "[" else "]")
+    asyncio.run_coroutine_threadsafe(
+        response.write("".join(chunk).encode("UTF-8")), loop
+    ).result()
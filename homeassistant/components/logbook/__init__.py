@@ -1,6 +1,7 @@
 """Event parser and human readable log generator."""
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 from itertools import groupby
 import json
 import re
@@ -15,6 +16,7 @@ from homeassistant.components.history import sqlalchemy_filter_from_include_excl
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -238,22 +240,20 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTP_BAD_REQUEST
             )
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
-                    context_id,
-                )
-            )
-
-        return await hass.async_add_executor_job(json_events)
+        return await self.json_stream(
+            request,
+            partial(
+                _stream_events,
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
+            ),
+        )
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -421,6 +421,31 @@ def _get_events(
     context_id=None,
 ):
     """Get events for a period of time."""
+    return list(
+        _stream_events(
+            hass,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entities_filter,
+            entity_matches_only,
+            context_id,
+        )
+    )
+
+
+def _stream_events(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+):
+    """Yield events for a period of time as they are read from the database."""
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
@@ -481,8 +506,8 @@ def _get_events(
 
         query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        yield from humanify(
+            hass, yield_events(query), entity_attr_cache, context_lookup
         )
 
 
@@ -493,6 +518,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -503,6 +529,7 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
@@ -511,6 +538,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -525,6 +555,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -554,7 +587,11 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            sqlalchemy.func.coalesce(
+                StateAttributes.shared_attrs, States.attributes
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -714,7 +751,9 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.shared_attrs or self._row.attributes or EMPTY_JSON_OBJECT
+        )
         return result and result.group(1)
 
     @property
@@ -739,13 +778,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            source = self._row.shared_attrs or self._row.attributes
+            if source is None or source == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(source)
         return self._attributes
 
     @property
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -119,6 +120,9 @@ CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
 
+# The maximum number of queued messages handled per event loop iteration
+MAX_MESSAGES_PER_BATCH = 1000
+
 PLATFORMS = [
     "alarm_control_panel",
     "binary_sensor",
@@ -556,12 +560,81 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class SubscriptionTrie:
+    """Trie of subscriptions keyed by topic level, supporting wildcards.
+
+    Matching a topic walks the trie one topic level at a time, following both
+    the literal level and the + and # wildcards, so the cost depends on the
+    depth of the topic rather than on the number of subscriptions.
+    """
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize an empty trie node."""
+        self.children: dict[str, SubscriptionTrie] = {}
+        self.subscriptions: list[Subscription] = []
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = SubscriptionTrie()
+            node = child
+        node.subscriptions.append(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, and the nodes which are no longer needed."""
+        levels = subscription.topic.split("/")
+        path = [self]
+        for level in levels:
+            path.append(path[-1].children[level])
+        path[-1].subscriptions.remove(subscription)
+
+        for index in range(len(levels) - 1, -1, -1):
+            node = path[index + 1]
+            if node.subscriptions or node.children:
+                break
+            del path[index].children[levels[index]]
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        matches: list[Subscription] = []
+        # Wildcards at the first level don't match topics starting with $
+        _match_subscriptions(
+            self, topic.split("/"), 0, not topic.startswith("$"), matches
+        )
+        return matches
+
+
+def _match_subscriptions(
+    node: SubscriptionTrie,
+    levels: list[str],
+    index: int,
+    normal: bool,
+    matches: list[Subscription],
+) -> None:
+    """Collect the subscriptions matching levels[index:] below node."""
+    children = node.children
+    wildcards = normal or index > 0
+    if index == len(levels):
+        matches.extend(node.subscriptions)
+    else:
+        if (child := children.get(levels[index])) is not None:
+            _match_subscriptions(child, levels, index + 1, normal, matches)
+        if wildcards and (child := children.get("+")) is not None:
+            _match_subscriptions(child, levels, index + 1, normal, matches)
+    # A multi level wildcard also matches its parent level
+    if wildcards and (child := children.get("#")) is not None:
+        matches.extend(child.subscriptions)
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -580,6 +653,9 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscriptions_trie = SubscriptionTrie()
+        self._pending_messages: deque[Any] = deque()
+        self._handle_messages_scheduled = False
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -755,11 +831,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscriptions_trie.add(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -772,7 +846,7 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscriptions_trie.remove(subscription)
 
             if any(other.topic == topic for other in self.subscriptions):
                 # Other subscriptions on topic remaining - don't unsubscribe.
@@ -862,44 +936,70 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        Messages are queued and handled in batches, the event loop is only woken
+        up when the queue was drained since the last message.
+        """
+        self._pending_messages.append(msg)
+        if not self._handle_messages_scheduled:
+            self._handle_messages_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_handle_pending_messages)
+
+    @callback
+    def _async_handle_pending_messages(self) -> None:
+        """Handle the messages queued by the paho thread."""
+        # Reset before draining, messages queued from now on schedule a new run
+        self._handle_messages_scheduled = False
+        pending_messages = self._pending_messages
+        # Only handle the messages queued so far to not starve the event loop
+        # during a flood of messages, the rest is handled in the next run
+        for _ in range(min(len(pending_messages), MAX_MESSAGES_PER_BATCH)):
+            msg = pending_messages.popleft()
+            # A failing subscriber must not keep the other messages queued
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+        if pending_messages and not self._handle_messages_scheduled:
+            self._handle_messages_scheduled = True
+            self.hass.loop.call_soon(self._async_handle_pending_messages)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
-        _LOGGER.debug(
-            "Received message on %s%s: %s",
-            msg.topic,
-            " (retained)" if msg.retain else "",
-            msg.payload[0:8192],
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Received message on %s%s: %s",
+                msg.topic,
+                " (retained)" if msg.retain else "",
+                msg.payload[0:8192],
+            )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscriptions_trie.match(msg.topic)
+
+        # The payload is decoded once per encoding, None when it can't be decoded
+        decoded_payloads: dict[str, str | None] = {}
 
         for subscription in subscriptions:
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            if (encoding := subscription.encoding) is not None:
+                if encoding not in decoded_payloads:
+                    try:
+                        decoded_payloads[encoding] = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        decoded_payloads[encoding] = None
+                if (decoded_payload := decoded_payloads[encoding]) is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
                         msg.topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.job,
                     )
                     continue
+                payload = decoded_payload
 
             self.hass.async_run_hass_job(
                 subscription.job,
@@ -983,16 +1083,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -20,6 +20,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import async_template_cache_stats
 
 from .const import DOMAIN
 
@@ -30,6 +31,7 @@ SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_LOG_TEMPLATE_CACHE_STATS = "log_template_cache_stats"
 
 
 SERVICES = (
@@ -40,6 +42,7 @@ SERVICES = (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_TEMPLATE_CACHE_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -177,6 +180,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         schema=vol.Schema({vol.Required(CONF_TYPE): str}),
     )
 
+    async def _async_log_template_cache_stats(call: ServiceCall) -> None:
+        """Log the compiled template cache statistics."""
+        for name, stats in async_template_cache_stats(hass).items():
+            _LOGGER.critical(
+                "Template cache [%s]: %s hits, %s misses, %.3f seconds compiling, %s/%s cached (%s referenced)",
+                name,
+                stats["hits"],
+                stats["misses"],
+                stats["compile_time"],
+                stats["size"],
+                stats["max_size"],
+                stats["weak_size"],
+            )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -191,6 +208,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_TEMPLATE_CACHE_STATS,
+        _async_log_template_cache_stats,
+    )
+
     return True
 
 
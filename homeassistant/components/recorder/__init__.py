@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping
 import concurrent.futures
 from datetime import datetime, timedelta
 import logging
@@ -11,7 +13,7 @@ import threading
 import time
 from typing import Any, Callable, NamedTuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -25,7 +27,6 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -50,7 +51,7 @@ import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .pool import RecorderPool
 from .util import (
     dburl_to_path,
@@ -103,12 +104,21 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+DEFAULT_BULK_WRITE = False
+DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS = 10
 KEEPALIVE_TIME = 30
 
 # Controls how often we clean up
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of shared attributes whose attributes_id is kept in memory
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
+# Dialects where the recorder can assign the event_id and
+# state_id itself when writing rows in bulk
+BULK_WRITE_DIALECTS = ("sqlite", "mysql")
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -117,6 +127,8 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_WRITE = "bulk_write"
+CONF_SHORT_TERM_STATISTICS_KEEP_DAYS = "short_term_statistics_keep_days"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -140,11 +152,18 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
+                    vol.Optional(
+                        CONF_SHORT_TERM_STATISTICS_KEEP_DAYS,
+                        default=DEFAULT_SHORT_TERM_STATISTICS_KEEP_DAYS,
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): cv.string,
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_BULK_WRITE, default=DEFAULT_BULK_WRITE
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -221,7 +240,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = convert_include_exclude_filter(conf)
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
+    short_term_statistics_keep_days = conf[CONF_SHORT_TERM_STATISTICS_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_write = conf[CONF_BULK_WRITE]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -233,7 +254,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         auto_purge=auto_purge,
         keep_days=keep_days,
+        short_term_statistics_keep_days=short_term_statistics_keep_days,
         commit_interval=commit_interval,
+        bulk_write=bulk_write,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
@@ -303,6 +326,13 @@ def _async_register_services(hass, instance):
     )
 
 
+@callback
+def _async_resolve_future(future: asyncio.Future) -> None:
+    """Resolve a future unless the waiter gave up on it."""
+    if not future.done():
+        future.set_result(None)
+
+
 class PurgeTask(NamedTuple):
     """Object to store information about purge task."""
 
@@ -325,12 +355,31 @@ class StatisticsTask(NamedTuple):
     """An object to insert into the recorder queue to run a statistics task."""
 
     start: datetime
+    period: str = statistics.PERIOD_5MINUTE
+
+
+class CompileMissingStatisticsTask:
+    """An object to insert into the recorder queue to compile all statistics that are due."""
 
 
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class CommitTask:
+    """An object to insert into the recorder queue to commit the event session."""
+
+
+class WaitCommitTask(NamedTuple):
+    """An object to insert into the recorder queue to commit and resolve a future."""
+
+    future: asyncio.Future
+
+
+class KeepAliveTask:
+    """An object to insert into the recorder queue to keep the database connection open."""
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -339,7 +388,9 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         keep_days: int,
+        short_term_statistics_keep_days: int,
         commit_interval: int,
+        bulk_write: bool,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -352,7 +403,9 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.auto_purge = auto_purge
         self.keep_days = keep_days
+        self.short_term_statistics_keep_days = short_term_statistics_keep_days
         self.commit_interval = commit_interval
+        self.bulk_write = bulk_write
         self.queue: Any = queue.SimpleQueue()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
@@ -367,15 +420,24 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
         self._commits_without_expire = 0
-        self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
         self._pending_expunge: list[States] = []
+        self._pending_event_rows: list[dict[str, Any]] = []
+        self._pending_state_rows: list[dict[str, Any]] = []
+        self._last_state_ids: dict[str, int] = {}
+        self._next_event_id = 0
+        self._next_state_id = 0
+        self._next_attributes_id = 0
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._last_shared_attrs: dict[str, tuple[Mapping[str, Any], str]] = {}
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
+        self._commit_timer: asyncio.TimerHandle | None = None
+        self._keep_alive_timer: asyncio.TimerHandle | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
@@ -421,6 +483,12 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._commit_timer:
+            self._commit_timer.cancel()
+            self._commit_timer = None
+        if self._keep_alive_timer:
+            self._keep_alive_timer.cancel()
+            self._keep_alive_timer = None
 
     @callback
     def _async_event_filter(self, event) -> bool:
@@ -460,11 +528,19 @@ class Recorder(threading.Thread):
         self.queue.put(PurgeEntitiesTask(entity_filter))
 
     def do_adhoc_statistics(self, **kwargs):
-        """Trigger an adhoc statistics run."""
+        """Trigger an adhoc statistics run.
+
+        The period is either statistics.PERIOD_5MINUTE, the default, or
+        statistics.PERIOD_HOUR.
+        """
+        period = kwargs.get("period", statistics.PERIOD_5MINUTE)
         start = kwargs.get("start")
         if not start:
-            start = statistics.get_start_time()
-        self.queue.put(StatisticsTask(start))
+            if period == statistics.PERIOD_HOUR:
+                start = statistics.get_start_time(timedelta(hours=1))
+            else:
+                start = statistics.get_start_time()
+        self.queue.put(StatisticsTask(start, period))
 
     @callback
     def async_register(self, shutdown_task, hass_started):
@@ -545,20 +621,46 @@ class Recorder(threading.Thread):
             self.queue.put(PerodicCleanupTask())
 
     @callback
-    def async_hourly_statistics(self, now):
-        """Trigger the hourly statistics run."""
-        start = statistics.get_start_time()
-        self.queue.put(StatisticsTask(start))
+    def async_periodic_statistics(self, now):
+        """Trigger the 5-minute statistics runs, which also compile full hours."""
+        self.queue.put(CompileMissingStatisticsTask())
+
+    @callback
+    def _async_commit(self):
+        """Queue a commit of the event session and schedule the next one."""
+        self.queue.put(CommitTask())
+        self._commit_timer = self.hass.loop.call_later(
+            self.commit_interval, self._async_commit
+        )
+
+    @callback
+    def _async_keep_alive(self):
+        """Queue a keep alive of the database connection and schedule the next one."""
+        self.queue.put(KeepAliveTask())
+        self._keep_alive_timer = self.hass.loop.call_later(
+            KEEPALIVE_TIME, self._async_keep_alive
+        )
 
     def _async_setup_periodic_tasks(self):
         """Prepare periodic tasks."""
+        # Commits and keep alives follow the monotonic loop clock, like
+        # the time_changed ticks they were counted from before, so they are
+        # not affected by changes of the wall clock.
+        if self.commit_interval:
+            self._commit_timer = self.hass.loop.call_later(
+                self.commit_interval, self._async_commit
+            )
+        self._keep_alive_timer = self.hass.loop.call_later(
+            KEEPALIVE_TIME, self._async_keep_alive
+        )
+
         # Run nightly tasks at 4:12am
         async_track_time_change(
             self.hass, self.async_nightly_tasks, hour=4, minute=12, second=0
         )
-        # Compile hourly statistics every hour at *:12
+        # Compile short term statistics every 5 minutes
         async_track_time_change(
-            self.hass, self.async_hourly_statistics, minute=12, second=0
+            self.hass, self.async_periodic_statistics, minute=range(0, 60, 5), second=10
         )
 
     def run(self):
@@ -700,6 +802,9 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, purge_before, repack, apply_filter):
         """Purge the database."""
+        # Commit the pending states first so the purge sees
+        # all the states that are using the shared attributes
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, purge_before, repack, apply_filter):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -711,17 +816,35 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
         self.queue.put(PurgeEntitiesTask(entity_filter))
 
-    def _run_statistics(self, start):
+    def _run_statistics(self, start, period):
         """Run statistics task."""
-        if statistics.compile_statistics(self, start):
+        if period == statistics.PERIOD_HOUR:
+            if statistics.compile_hourly_statistics(self, start):
+                return
+        elif statistics.compile_statistics(self, start):
             return
         # Schedule a new statistics task if this one didn't finish
-        self.queue.put(StatisticsTask(start))
+        self.queue.put(StatisticsTask(start, period))
+
+    def _schedule_compile_missing_statistics(self):
+        """Queue a statistics task for every period that is not compiled yet."""
+        with session_scope(session=self.get_session()) as session:
+            # States older than keep_days are purged, there is nothing to compile
+            periods = statistics.get_missing_periods(
+                session, dt_util.utcnow() - timedelta(days=self.keep_days)
+            )
+        if len(periods) > 1:
+            _LOGGER.debug(
+                "Compiling missed statistics from %s to %s", periods[0], periods[-1]
+            )
+        for start in periods:
+            self.queue.put(StatisticsTask(start))
 
     def _process_one_event(self, event):
         """Process one event."""
@@ -735,26 +858,40 @@ class Recorder(threading.Thread):
             perodic_db_cleanups(self)
             return
         if isinstance(event, StatisticsTask):
-            self._run_statistics(event.start)
+            self._run_statistics(event.start, event.period)
+            return
+        if isinstance(event, CompileMissingStatisticsTask):
+            self._schedule_compile_missing_statistics()
             return
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
+        if isinstance(event, CommitTask):
+            self._commit_event_session_or_retry()
+            return
+        if isinstance(event, WaitCommitTask):
+            self._commit_event_session_or_retry()
+            self.hass.loop.call_soon_threadsafe(_async_resolve_future, event.future)
+            return
+        if isinstance(event, KeepAliveTask):
+            self._send_keep_alive()
             return
 
         if not self.enabled:
             return
 
+        if self.bulk_write:
+            self._process_event_into_rows(event)
+        else:
+            self._process_event_into_session(event)
+
+        # If they do not have a commit interval
+        # than we commit right away
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _process_event_into_session(self, event):
+        """Add the database objects for an event to the event session."""
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
@@ -768,7 +905,8 @@ class Recorder(threading.Thread):
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
+                dbstate = States(**States.row_from_event(event))
+                self._link_state_attributes(dbstate, event)
                 has_new_state = event.data.get("new_state")
                 if dbstate.entity_id in self._old_states:
                     old_state = self._old_states.pop(dbstate.entity_id)
@@ -790,10 +928,155 @@ class Recorder(threading.Thread):
                     event.data.get("new_state"),
                 )
 
-        # If they do not have a commit interval
-        # than we commit right away
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
+    def _process_event_into_rows(self, event):
+        """Collect the rows for an event to be inserted in bulk on commit.
+
+        The ids are assigned here so the state rows can reference their
+        event and old state without waiting for the database.
+        """
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                event_row = Events.row_from_event(event, event_data="{}")
+            else:
+                event_row = Events.row_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        event_id = event_row["event_id"] = self._next_event_id
+        self._next_event_id += 1
+        event_row["created"] = event.time_fired
+        self._pending_event_rows.append(event_row)
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            state_row = States.row_from_event(event)
+            state_row["attributes_id"] = self._shared_attributes_id(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+
+        entity_id = state_row["entity_id"]
+        state_id = state_row["state_id"] = self._next_state_id
+        self._next_state_id += 1
+        state_row["event_id"] = event_id
+        state_row["old_state_id"] = self._last_state_ids.pop(entity_id, None)
+        state_row["created"] = event.time_fired
+        if event.data.get("new_state"):
+            self._last_state_ids[entity_id] = state_id
+        else:
+            state_row["state"] = None
+        self._pending_state_rows.append(state_row)
+
+    def _shared_attrs_from_event(self, event):
+        """Serialize the attributes of the new state of a state_changed event.
+
+        The attributes of the previous state of the entity are
+        reused when they did not change to avoid serializing them again.
+        """
+        entity_id = event.data["entity_id"]
+        state = event.data.get("new_state")
+        if state is None:
+            self._last_shared_attrs.pop(entity_id, None)
+            return StateAttributes.shared_attrs_from_event(event)
+
+        if last := self._last_shared_attrs.get(entity_id):
+            last_attributes, shared_attrs = last
+            if (
+                last_attributes is state.attributes
+                or last_attributes == state.attributes
+            ):
+                return shared_attrs
+
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        self._last_shared_attrs[entity_id] = (state.attributes, shared_attrs)
+        return shared_attrs
+
+    def _find_shared_attributes_id(self, shared_attrs):
+        """Find the attributes_id of attributes that are already stored."""
+        if (attributes_id := self._state_attributes_ids.get(shared_attrs)) is not None:
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+
+        with self.event_session.no_autoflush:
+            attributes_id = (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(
+                    StateAttributes.hash
+                    == StateAttributes.hash_shared_attrs(shared_attrs)
+                )
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .limit(1)
+                .scalar()
+            )
+        if attributes_id is not None:
+            self._cache_shared_attributes_id(shared_attrs, attributes_id)
+        return attributes_id
+
+    def _cache_shared_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the attributes_id of stored attributes."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
+    def _link_state_attributes(self, dbstate, event):
+        """Link a state to its shared attributes, adding them if they are new."""
+        shared_attrs = self._shared_attrs_from_event(event)
+        if pending := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending
+        elif (
+            attributes_id := self._find_shared_attributes_id(shared_attrs)
+        ) is not None:
+            dbstate.attributes_id = attributes_id
+        else:
+            dbattrs = StateAttributes.from_shared_attrs(shared_attrs)
+            dbstate.state_attributes = dbattrs
+            self._pending_state_attributes[shared_attrs] = dbattrs
+
+    def _shared_attributes_id(self, event):
+        """Return the attributes_id for a state row, adding new attributes."""
+        shared_attrs = self._shared_attrs_from_event(event)
+        if pending := self._pending_state_attributes.get(shared_attrs):
+            return pending.attributes_id
+        if (attributes_id := self._find_shared_attributes_id(shared_attrs)) is not None:
+            return attributes_id
+
+        dbattrs = StateAttributes.from_shared_attrs(shared_attrs)
+        dbattrs.attributes_id = self._next_attributes_id
+        self._next_attributes_id += 1
+        self._pending_state_attributes[shared_attrs] = dbattrs
+        return dbattrs.attributes_id
+
+    def _load_next_bulk_ids(self):
+        """Load the next free ids for the bulk inserted rows from the database."""
+        self._next_event_id = (
+            self.event_session.query(func.max(Events.event_id)).scalar() or 0
+        ) + 1
+        self._next_state_id = (
+            self.event_session.query(func.max(States.state_id)).scalar() or 0
+        ) + 1
+        self._next_attributes_id = (
+            self.event_session.query(func.max(StateAttributes.attributes_id)).scalar()
+            or 0
+        ) + 1
+
+    def evict_purged_state_ids(self, state_ids: list[int]) -> None:
+        """Forget purged states so they are not used as an old_state_id."""
+        purged = set(state_ids)
+        for entity_id, state_id in list(self._last_state_ids.items()):
+            if state_id in purged:
+                del self._last_state_ids[entity_id]
+
+    def evict_purged_attributes_ids(self, attributes_ids: set[int]) -> None:
+        """Forget purged shared attributes so they are added again when used."""
+        for shared_attrs, attributes_id in list(self._state_attributes_ids.items()):
+            if attributes_id in attributes_ids:
+                del self._state_attributes_ids[shared_attrs]
 
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
@@ -807,7 +1090,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_event_rows
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -824,12 +1111,36 @@ class Recorder(threading.Thread):
                 if tries == self.db_max_retries:
                     raise
 
+                if self._pending_event_rows:
+                    # Discard the partially executed inserts since
+                    # the pending rows are inserted again on the next try
+                    self.event_session.rollback()
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
         self._commits_without_expire += 1
 
+        if self._pending_event_rows:
+            self.event_session.execute(
+                Events.__table__.insert(), self._pending_event_rows
+            )
+        if self.bulk_write and self._pending_state_attributes:
+            self.event_session.execute(
+                StateAttributes.__table__.insert(),
+                [
+                    {
+                        "attributes_id": dbattrs.attributes_id,
+                        "hash": dbattrs.hash,
+                        "shared_attrs": dbattrs.shared_attrs,
+                    }
+                    for dbattrs in self._pending_state_attributes.values()
+                ],
+            )
+        if self._pending_state_rows:
+            self.event_session.execute(
+                States.__table__.insert(), self._pending_state_rows
+            )
         if self._pending_expunge:
             self.event_session.flush()
             for dbstate in self._pending_expunge:
@@ -839,6 +1150,11 @@ class Recorder(threading.Thread):
                     self.event_session.expunge(dbstate)
             self._pending_expunge = []
         self.event_session.commit()
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        for shared_attrs, dbattrs in self._pending_state_attributes.items():
+            self._cache_shared_attributes_id(shared_attrs, dbattrs.attributes_id)
+        self._pending_state_attributes = {}
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -858,6 +1174,11 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._last_state_ids = {}
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        self._pending_state_attributes = {}
+        self._state_attributes_ids = OrderedDict()
 
         if not self.event_session:
             return
@@ -879,6 +1200,8 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        if self.bulk_write:
+            self._load_next_bulk_ids()
 
     def _send_keep_alive(self):
         """Send a keep alive to keep the db connection open."""
@@ -890,6 +1213,13 @@ class Recorder(threading.Thread):
         """Listen for new events and put them in the process queue."""
         self.queue.put(event)
 
+    async def async_wait_committed(self) -> None:
+        """Wait until the events fired so far are committed to the database."""
+        future = self.hass.loop.create_future()
+        # Queue behind the event listener calls that are already scheduled
+        self.hass.loop.call_soon(self.queue.put, WaitCommitTask(future))
+        await future
+
     def block_till_done(self):
         """Block till all events processed.
 
@@ -934,6 +1264,14 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs)
 
+        if self.bulk_write and self.engine.dialect.name not in BULK_WRITE_DIALECTS:
+            _LOGGER.warning(
+                "Bulk write is not supported for %s databases, "
+                "states and events will be written one by one",
+                self.engine.dialect.name,
+            )
+            self.bulk_write = False
+
         sqlalchemy_event.listen(self.engine, "connect", setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
@@ -963,6 +1301,11 @@ class Recorder(threading.Thread):
             session.flush()
             session.expunge(self.run_info)
 
+        # Catch up on the statistics of the periods missed while not running.
+        # They are queued right away, ahead of anything queued after the
+        # database is reported ready.
+        self._schedule_compile_missing_statistics()
+
         self._open_event_session()
 
     def _end_session(self):
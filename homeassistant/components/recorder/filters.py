@@ -0,0 +1,100 @@
+"""Translate entity filters into sql predicates."""
+from __future__ import annotations
+
+import re
+from typing import Any, Callable
+
+from sqlalchemy import and_, false, not_, or_
+from sqlalchemy.sql.elements import ClauseElement
+
+from homeassistant.helpers.entityfilter import EntityFilterSpec
+
+from .models import States
+
+# Values that have the same meaning for sql as for the entity filter,
+# independent of the collation of the database
+_SQL_SAFE_VALUE = re.compile(r"^[a-z0-9_.*?]*$")
+
+GLOB_TO_SQL_CHARS = {
+    42: "%",  # *
+    63: "_",  # ?
+    95: "\\_",  # _ is a literal in globs
+}
+
+
+def sqlalchemy_filter_from_entity_filter(
+    entity_filter: Callable[[str], bool], column: Any = States.entity_id
+) -> ClauseElement | None:
+    """Return a sql predicate on entity ids equivalent to an entity filter.
+
+    Returns None if the filter passes all entities or can not be expressed
+    in sql, the filter then has to be applied to the results instead.
+    """
+    spec: EntityFilterSpec | None = getattr(entity_filter, "spec", None)
+    if spec is None or not any(spec):
+        return None
+    if not all(_SQL_SAFE_VALUE.match(value) for values in spec for value in values):
+        return None
+
+    include_d = _like_any(column, (f"{domain}.*" for domain in spec.include_domains))
+    include_e = _in(column, spec.include_entities)
+    include_eg = _like_any(column, spec.include_entity_globs)
+    exclude_d = _like_any(column, (f"{domain}.*" for domain in spec.exclude_domains))
+    exclude_e = _in(column, spec.exclude_entities)
+    exclude_eg = _like_any(column, spec.exclude_entity_globs)
+
+    have_include = bool(
+        spec.include_domains or spec.include_entities or spec.include_entity_globs
+    )
+    have_exclude = bool(
+        spec.exclude_domains or spec.exclude_entities or spec.exclude_entity_globs
+    )
+
+    # The cases match the ones of homeassistant.helpers.entityfilter
+    # Case 2 - includes, no excludes - only include specified entities
+    if not have_exclude:
+        return or_(include_d, include_e, include_eg)
+
+    # Case 3 - excludes, no includes - only exclude specified entities
+    if not have_include:
+        return not_(or_(exclude_d, exclude_e, exclude_eg))
+
+    # Case 4a - include domain or glob specified
+    if spec.include_domains or spec.include_entity_globs:
+        return or_(
+            and_(include_d, not_(or_(exclude_e, exclude_eg))),
+            and_(
+                not_(include_d),
+                include_eg,
+                not_(or_(exclude_d, exclude_e, exclude_eg)),
+            ),
+            and_(not_(include_d), not_(include_eg), include_e),
+        )
+
+    # Case 4b - exclude domain or glob specified, include has no domain or glob
+    if spec.exclude_domains or spec.exclude_entity_globs:
+        return or_(
+            and_(or_(exclude_d, exclude_eg), include_e),
+            and_(not_(or_(exclude_d, exclude_eg)), not_(exclude_e)),
+        )
+
+    # Case 4c - neither include or exclude domain specified
+    return include_e
+
+
+def _in(column: Any, values: frozenset[str]) -> ClauseElement:
+    """Match the column against a set of values."""
+    if not values:
+        return false()
+    return column.in_(sorted(values))
+
+
+def _like_any(column: Any, globs: Any) -> ClauseElement:
+    """Match the column against any of the globs."""
+    clauses = [
+        column.like(glob.translate(GLOB_TO_SQL_CHARS), escape="\\")
+        for glob in sorted(globs)
+    ]
+    if not clauses:
+        return false()
+    return or_(*clauses)
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from datetime import datetime
 from itertools import groupby
 import logging
 import time
+from typing import NamedTuple
 
-from sqlalchemy import and_, bindparam, func
+from sqlalchemy import and_, bindparam, case, func, literal, select, union_all
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -48,18 +51,56 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
+QUERY_STATE_ROWS = [
+    States.entity_id,
+    States.state,
+    States.attributes,
+    StateAttributes.shared_attrs,
+    States.last_updated,
+]
+
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# Number of rows fetched at a time when streaming states
+STREAM_BATCH_SIZE = 1000
+
+# Number of state requests answered by a single query
+MAX_STATE_REQUESTS_PER_QUERY = 100
+
+
+class StateRequest(NamedTuple):
+    """Request for the recorded states of an entity.
+
+    Selects the states updated at or after start_time, limited to the most
+    recent number_of_states. With state_changes_only attribute only updates
+    are skipped and with include_start_state the state the entity had at
+    start_time is added as the first state.
+    """
+
+    entity_id: str
+    start_time: datetime | None = None
+    number_of_states: int | None = None
+    state_changes_only: bool = True
+    include_start_state: bool = False
+
 
 def async_setup(hass):
     """Set up the history hooks."""
     hass.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def query_states(session):
+    """Query the states with their shared attributes joined in."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(hass=hass) as session:
@@ -86,10 +127,137 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
     )
 
+
+def stream_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """Yield the significant states during a period one entity at a time.
+
+    This yields the same states as get_significant_states as
+    (entity_id, states) tuples, but the rows are fetched from the database
+    in batches and only the states of one entity are held in memory.
+    Entities are yielded in the order of entity_ids if it is given, which
+    the query sorts by so a single query is needed.
+    """
+    start_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_states[state.entity_id] = state
+
+    if entity_ids is None:
+        yield from _stream_entity_states(
+            _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                None,
+                filters,
+                significant_changes_only,
+            ),
+            start_states,
+            minimal_response,
+        )
+        for ent_id, state in start_states.items():
+            yield ent_id, [state]
+        return
+
+    order = {entity_id: index for index, entity_id in enumerate(entity_ids)}
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+        entity_order=order,
+    )
+
+    # Entities without any states in the period only have their start state
+    unqueried = iter(order)
+    for ent_id, ent_results in _stream_entity_states(
+        query, start_states, minimal_response
+    ):
+        for entity_id in unqueried:
+            if entity_id == ent_id:
+                break
+            if entity_id in start_states:
+                yield entity_id, [start_states.pop(entity_id)]
+        yield ent_id, ent_results
+    for entity_id in unqueried:
+        if entity_id in start_states:
+            yield entity_id, [start_states.pop(entity_id)]
+
+
+def _stream_entity_states(query, start_states, minimal_response):
+    """Yield the states of each entity in a query grouped by entity_id."""
+    rows = query.with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+    for ent_id, group in groupby(rows, lambda state: state.entity_id):
+        ent_results = []
+        if ent_id in start_states:
+            ent_results.append(start_states.pop(ent_id))
+        _extend_entity_states(ent_results, ent_id, group, minimal_response)
+        yield ent_id, ent_results
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+    entity_order=None,
+):
+    """Return the query of significant states sorted by entity_id.
+
+    With entity_order, a dict of entity_id to position, the entities are
+    sorted by their position instead.
+    """
+    baked_query = hass.data[HISTORY_BAKERY](query_states)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -113,36 +281,77 @@ def _get_significant_states(
     if end_time is not None:
         baked_query += lambda q: q.filter(States.last_updated < bindparam("end_time"))
 
-    baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
-
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+    if entity_order is None:
+        baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
+    else:
+        # The order is built for every query, so it can not be cached
+        baked_query.spoil()
+        baked_query += lambda q: q.order_by(
+            case(entity_order, value=States.entity_id), States.last_updated
         )
+
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
+
+def get_significant_state_rows(hass, start_time, end_time, entity_ids):
+    """Return significant state changes of entity_ids as raw rows.
+
+    This is a lean version of get_significant_states for bulk consumers such as
+    the statistics compiler. No State objects are created, instead the result is
+    {'entity_id': [(state, attributes, last_updated), ...]} where attributes is
+    the JSON string as stored in the database. The state at start_time is the
+    first row of each entity.
+    """
+    timer_start = time.perf_counter()
+    result = defaultdict(list)
+
+    with session_scope(hass=hass) as session:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run
+        ):
+            # pylint: disable=protected-access
+            row = state._row
+            result[state.entity_id].append(
+                (row.state, row.shared_attrs or row.attributes, start_time)
+            )
+
+        baked_query = hass.data[HISTORY_BAKERY](
+            lambda session: session.query(*QUERY_STATE_ROWS).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        baked_query += lambda q: q.filter(
+            (
+                States.domain.in_(SIGNIFICANT_DOMAINS)
+                | (States.last_changed == States.last_updated)
+            )
+            & (States.last_updated > bindparam("start_time"))
+            & (States.last_updated < bindparam("end_time"))
+            & States.entity_id.in_(bindparam("entity_ids", expanding=True))
+        )
+        baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
+
+        for entity_id, state, attributes, shared_attrs, last_updated in execute(
+            baked_query(session).params(
+                start_time=start_time, end_time=end_time, entity_ids=entity_ids
+            )
+        ):
+            result[entity_id].append((state, shared_attrs or attributes, last_updated))
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
+        _LOGGER.debug("get_significant_state_rows took %fs", elapsed)
 
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
-    )
+    return result
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -155,7 +364,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -176,13 +387,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -209,6 +420,76 @@ def get_last_state_changes(hass, number_of_states, entity_id):
         )
 
 
+def get_states_for_requests(hass, requests):
+    """Return the states of each request, oldest first.
+
+    The requests are answered with a single query per
+    MAX_STATE_REQUESTS_PER_QUERY requests.
+    """
+    results = [[] for _ in requests]
+    with session_scope(hass=hass) as session:
+        for offset in range(0, len(requests), MAX_STATE_REQUESTS_PER_QUERY):
+            batch = requests[offset : offset + MAX_STATE_REQUESTS_PER_QUERY]
+            query = union_all(
+                *(
+                    select(subquery)
+                    for index, request in enumerate(batch, offset)
+                    for subquery in _state_request_subqueries(index, request)
+                )
+            )
+            for row in session.execute(query):
+                request = requests[row.request_index]
+                state = LazyState(row)
+                if (
+                    request.include_start_state
+                    and request.start_time is not None
+                    and state.last_updated < request.start_time
+                ):
+                    state.last_changed = request.start_time
+                    state.last_updated = request.start_time
+                results[row.request_index].append(state)
+
+    for states in results:
+        states.sort(key=lambda state: state.last_updated)
+    return results
+
+
+def _state_request_subqueries(index, request):
+    """Return the subqueries selecting the states of a request."""
+    entity_id = request.entity_id.lower()
+    columns = [*QUERY_STATES, literal(index).label("request_index")]
+    states_join = States.__table__.outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+    query = select(*columns).select_from(states_join)
+    query = query.where(States.entity_id == entity_id)
+    if request.state_changes_only:
+        query = query.where(States.last_changed == States.last_updated)
+    if request.start_time is not None:
+        query = query.where(States.last_updated >= request.start_time)
+    if request.number_of_states is not None:
+        query = query.order_by(States.last_updated.desc()).limit(
+            request.number_of_states
+        )
+    subqueries = [query.subquery()]
+
+    if request.include_start_state and request.start_time is not None:
+        subqueries.append(
+            select(*columns)
+            .select_from(states_join)
+            .where(
+                States.entity_id == entity_id,
+                States.last_updated < request.start_time,
+            )
+            .order_by(States.last_updated.desc())
+            .limit(1)
+            .subquery()
+        )
+
+    return subqueries
+
+
 def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None):
     """Return the states at a specific point in time."""
     if run is None:
@@ -243,7 +524,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -291,9 +572,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -350,53 +629,57 @@ def _sorted_states_to_dict(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
-
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+        _extend_entity_states(result[ent_id], ent_id, group, minimal_response)
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
 
 
+def _extend_entity_states(ent_results, ent_id, group, minimal_response):
+    """Append the rows of one entity, sorted by last_updated, to its states."""
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
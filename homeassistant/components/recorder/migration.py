@@ -450,16 +450,13 @@ def _apply_update(engine, session, new_version, old_version):
             )
     elif new_version == 14:
         _modify_columns(connection, engine, "events", ["event_type VARCHAR(64)"])
-    elif new_version == 15:
+    elif new_version in (15, 17):
         # This dropped the statistics table, done again in version 18.
         pass
     elif new_version == 16:
         _drop_foreign_key_constraints(
             connection, engine, TABLE_STATES, ["old_state_id"]
         )
-    elif new_version == 17:
-        # This dropped the statistics table, done again in version 18.
-        pass
     elif new_version == 18:
         # Recreate the statistics and statistics meta tables.
         #
@@ -475,6 +472,18 @@ def _apply_update(engine, session, new_version, old_version):
 
         StatisticsMeta.__table__.create(engine)
         Statistics.__table__.create(engine)
+    elif new_version == 19:
+        # The state_attributes table is created with create_all on startup.
+        #
+        # The attributes of existing states are not moved since it would
+        # rewrite the whole states table; they are still read from the
+        # attributes column when attributes_id is not set.
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 20:
+        # The statistics_short_term and statistics_runs tables are created
+        # with create_all on startup.
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -1,12 +1,14 @@
 """Models for SQLAlchemy."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
-from typing import TypedDict
+from typing import TypedDict, overload
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -20,7 +22,7 @@ from sqlalchemy import (
     distinct,
 )
 from sqlalchemy.dialects import mysql
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.declarative import declarative_base, declared_attr
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
@@ -40,7 +42,7 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 18
+SCHEMA_VERSION = 20
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,18 +50,24 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
+TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_RUNS = "statistics_runs"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
+    TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_RUNS,
 ]
 
 DATETIME_TYPE = DateTime(timezone=True).with_variant(
@@ -99,16 +107,21 @@ class Events(Base):  # type: ignore
     @staticmethod
     def from_event(event, event_data=None):
         """Create an event database object from a native event."""
-        return Events(
-            event_type=event.event_type,
-            event_data=event_data
+        return Events(**Events.row_from_event(event, event_data))
+
+    @staticmethod
+    def row_from_event(event, event_data=None):
+        """Create the column values of an event row from a native event."""
+        return {
+            "event_type": event.event_type,
+            "event_data": event_data
             or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
-            origin=str(event.origin.value),
-            time_fired=event.time_fired,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-        )
+            "origin": str(event.origin.value),
+            "time_fired": event.time_fired,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+        }
 
     def to_native(self, validate_entity_id=True):
         """Convert to a natve HA Event."""
@@ -153,8 +166,12 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -169,37 +186,51 @@ class States(Base):  # type: ignore
 
     @staticmethod
     def from_event(event):
-        """Create object from a state_changed event."""
+        """Create object from a state_changed event.
+
+        The attributes are stored inline, the recorder links
+        the shared attributes instead.
+        """
+        return States(
+            **States.row_from_event(event),
+            attributes=StateAttributes.shared_attrs_from_event(event),
+        )
+
+    @staticmethod
+    def row_from_event(event):
+        """Create the column values of a state row without the attributes."""
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
-        dbstate = States(entity_id=entity_id)
-
         # State got deleted
         if state is None:
-            dbstate.state = ""
-            dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
-            dbstate.last_changed = event.time_fired
-            dbstate.last_updated = event.time_fired
-        else:
-            dbstate.domain = state.domain
-            dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
-            dbstate.last_changed = state.last_changed
-            dbstate.last_updated = state.last_updated
+            return {
+                "entity_id": entity_id,
+                "domain": split_entity_id(entity_id)[0],
+                "state": "",
+                "last_changed": event.time_fired,
+                "last_updated": event.time_fired,
+            }
 
-        return dbstate
+        return {
+            "entity_id": entity_id,
+            "domain": state.domain,
+            "state": state.state,
+            "last_changed": state.last_changed,
+            "last_updated": state.last_updated,
+        }
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        if self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
+        else:
+            attributes = self.attributes
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json.loads(attributes),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -213,6 +244,56 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attributes shared between states."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', "
+            f"attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_shared_attrs(shared_attrs: str) -> StateAttributes:
+        """Create object from the serialized attributes."""
+        return StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+
+    @staticmethod
+    def shared_attrs_from_event(event) -> str:
+        """Serialize the attributes of the new state of a state_changed event."""
+        state = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        try:
+            # Shared with the websocket API and earlier states of the entity
+            return state.attributes_json()
+        except ValueError:
+            # Attributes like NaN that are not valid JSON are stored anyway
+            return json.dumps(
+                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
+            )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of the serialized attributes."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+
 class StatisticData(TypedDict, total=False):
     """Statistic data class."""
 
@@ -222,23 +303,24 @@ class StatisticData(TypedDict, total=False):
     last_reset: datetime | None
     state: float
     sum: float
+    mean_duration: float
 
 
-class Statistics(Base):  # type: ignore
-    """Statistics."""
+class StatisticsBase:
+    """Statistics base class."""
 
-    __table_args__ = (
-        # Used for fetching statistics for a certain entity at a specific time
-        Index("ix_statistics_statistic_id_start", "metadata_id", "start"),
-    )
-    __tablename__ = TABLE_STATISTICS
     id = Column(Integer, primary_key=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
-    metadata_id = Column(
-        Integer,
-        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
-        index=True,
-    )
+
+    @declared_attr
+    def metadata_id(self):
+        """Define the metadata_id column for sub classes."""
+        return Column(
+            Integer,
+            ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+            index=True,
+        )
+
     start = Column(DATETIME_TYPE, index=True)
     mean = Column(Float())
     min = Column(Float())
@@ -247,13 +329,71 @@ class Statistics(Base):  # type: ignore
     state = Column(Float())
     sum = Column(Float())
 
+    # The length of the period covered by each row
+    duration: timedelta
+
     @staticmethod
-    def from_stats(metadata_id: str, start: datetime, stats: StatisticData):
-        """Create object from a statistics."""
-        return Statistics(
-            metadata_id=metadata_id,
-            start=start,
+    def row_from_stats(metadata_id: int, start: datetime, stats: StatisticData):
+        """Create a complete row dict from a statistics, for bulk inserts."""
+        return {
+            "metadata_id": metadata_id,
+            "start": start,
+            "mean": None,
+            "min": None,
+            "max": None,
+            "last_reset": None,
+            "state": None,
+            "sum": None,
             **stats,
+        }
+
+    @classmethod
+    def from_stats(cls, metadata_id: int, start: datetime, stats: StatisticData):
+        """Create object from a statistics."""
+        return cls(**cls.row_from_stats(metadata_id, start, stats))  # type: ignore
+
+
+class Statistics(Base, StatisticsBase):  # type: ignore
+    """Long term statistics, one row per hour."""
+
+    duration = timedelta(hours=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_statistic_id_start", "metadata_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS
+
+
+class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore
+    """Short term statistics, one row per 5 minutes."""
+
+    duration = timedelta(minutes=5)
+
+    # The seconds of the period covered by the mean, used to weight the mean
+    # when summarizing the hour
+    mean_duration = Column(Float())
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_short_term_statistic_id_start", "metadata_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS_SHORT_TERM
+
+
+class StatisticsRuns(Base):  # type: ignore
+    """Representation of a 5-minute period whose statistics are compiled."""
+
+    __tablename__ = TABLE_STATISTICS_RUNS
+    run_id = Column(Integer, Identity(), primary_key=True)
+    start = Column(DATETIME_TYPE, index=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatisticsRuns("
+            f"id={self.run_id}, start='{self.start.isoformat(sep=' ', timespec='seconds')}'"
+            f")>"
         )
 
 
@@ -362,7 +502,17 @@ class SchemaChanges(Base):  # type: ignore
         )
 
 
-def process_timestamp(ts):
+@overload
+def process_timestamp(ts: None) -> None:
+    ...
+
+
+@overload
+def process_timestamp(ts: datetime) -> datetime:
+    ...
+
+
+def process_timestamp(ts: datetime | None) -> datetime | None:
     """Process a timestamp into datetime object."""
     if ts is None:
         return None
@@ -397,7 +547,11 @@ class LazyState(State):
     ]
 
     def __init__(self, row):  # pylint: disable=super-init-not-called
-        """Init the lazy state."""
+        """Init the lazy state.
+
+        The row has the shared_attrs of the joined state attributes
+        and the attributes stored inline by older versions.
+        """
         self._row = row
         self.entity_id = self._row.entity_id
         self.state = self._row.state or ""
@@ -411,7 +565,9 @@ class LazyState(State):
         """State attributes."""
         if not self._attributes:
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(
+                    self._row.shared_attrs or self._row.attributes
+                )
             except ValueError:
                 # When json.loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
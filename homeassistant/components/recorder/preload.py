@@ -0,0 +1,92 @@
+"""Batch the recorded states entities load when they are added."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+
+from . import history
+from .models import LazyState
+
+DATA_PRELOADER = "recorder_state_preloader"
+
+# Seconds to wait for more requests before querying the database
+PRELOAD_DELAY = 0.1
+
+
+async def async_get_states(
+    hass: HomeAssistant,
+    entity_id: str,
+    *,
+    start_time: datetime | None = None,
+    number_of_states: int | None = None,
+    state_changes_only: bool = True,
+    include_start_state: bool = False,
+) -> list[LazyState]:
+    """Return the recorded states of an entity, oldest first.
+
+    Requests made around the same time, like by the entities set up during
+    startup, are answered together with a single database query. See
+    history.StateRequest for the arguments.
+    """
+    preloader = hass.data.get(DATA_PRELOADER)
+    if preloader is None:
+        preloader = hass.data[DATA_PRELOADER] = _StatePreloader(hass)
+    return await preloader.async_request(
+        history.StateRequest(
+            entity_id,
+            start_time,
+            number_of_states,
+            state_changes_only,
+            include_start_state,
+        )
+    )
+
+
+class _StatePreloader:
+    """Collect state requests and answer them in a batch."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the preloader."""
+        self.hass = hass
+        self._pending: list[tuple[history.StateRequest, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_request(self, request: history.StateRequest) -> asyncio.Future:
+        """Queue a request and return a future for its states."""
+        future = self.hass.loop.create_future()
+        self._pending.append((request, future))
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                PRELOAD_DELAY, self._async_flush
+            )
+        return future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Answer the queued requests."""
+        pending, self._pending = self._pending, []
+        self._flush_handle = None
+        self.hass.async_create_task(self._async_answer(pending))
+
+    async def _async_answer(
+        self, pending: list[tuple[history.StateRequest, asyncio.Future]]
+    ) -> None:
+        """Query the states of the requests and resolve their futures."""
+        try:
+            results = await self.hass.async_add_executor_job(
+                history.get_states_for_requests,
+                self.hass,
+                [request for request, _ in pending],
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for (_, future), states in zip(pending, results):
+            if not future.done():
+                future.set_result(states)
@@ -1,15 +1,26 @@
 """Purge old data helper."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 from typing import TYPE_CHECKING, Callable
 
+from sqlalchemy import func, not_
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
+import homeassistant.util.dt as dt_util
+
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .filters import sqlalchemy_filter_from_entity_filter
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -37,22 +48,51 @@ def purge_old_data(
         event_ids = _select_event_ids_to_purge(session, purge_before)
         state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
         if state_ids:
-            _purge_state_ids(session, state_ids)
+            _purge_state_ids(instance, session, state_ids)
         if event_ids:
             _purge_event_ids(session, event_ids)
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
+        short_term_purge_before = dt_util.utcnow() - timedelta(
+            days=instance.short_term_statistics_keep_days
+        )
+        if not _purge_short_term_statistics(session, short_term_purge_before):
+            _LOGGER.debug("Purging short term statistics hasn't fully completed yet")
+            return False
         if apply_filter and _purge_filtered_data(instance, session) is False:
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
             return False
         _purge_old_recorder_runs(instance, session, purge_before)
+        _purge_old_statistics_runs(session, purge_before)
     if repack:
         repack_database(instance)
     return True
 
 
+def _purge_short_term_statistics(session: Session, purge_before: datetime) -> bool:
+    """Purge short term statistics older than purge_before, return True when done.
+
+    Short term statistics have their own retention, independent of purge_before
+    used for states and events.
+    """
+    statistic_ids = [
+        statistic.id
+        for statistic in session.query(StatisticsShortTerm.id)
+        .filter(StatisticsShortTerm.start < purge_before)
+        .limit(MAX_ROWS_TO_PURGE)
+    ]
+    if statistic_ids:
+        deleted_rows = (
+            session.query(StatisticsShortTerm)
+            .filter(StatisticsShortTerm.id.in_(statistic_ids))
+            .delete(synchronize_session=False)
+        )
+        _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+    return len(statistic_ids) < MAX_ROWS_TO_PURGE
+
+
 def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
     """Return a list of event ids to purge."""
     events = (
@@ -81,8 +121,17 @@ def _select_state_ids_to_purge(
     return [state.state_id for state in states]
 
 
-def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
+def _purge_state_ids(
+    instance: Recorder, session: Session, state_ids: list[int]
+) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(States.attributes_id)
+        .filter(States.state_id.in_(state_ids))
+        .distinct()
+        if attributes_id is not None
+    }
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -102,6 +151,38 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     )
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
+    # Ensure the next state of these entities is not linked to a deleted state
+    instance.evict_purged_state_ids(state_ids)
+
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the shared attributes that are no longer used by any state."""
+    if not attributes_ids:
+        return
+
+    used_attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(States.attributes_id)
+        .filter(States.attributes_id.in_(attributes_ids))
+        .distinct()
+    }
+    unused_attributes_ids = attributes_ids - used_attributes_ids
+    if not unused_attributes_ids:
+        return
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute rows", deleted_rows)
+
+    instance.evict_purged_attributes_ids(unused_attributes_ids)
+
 
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
@@ -127,18 +208,37 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _purge_old_statistics_runs(session: Session, purge_before: datetime) -> None:
+    """Purge all old statistics runs, but the last one."""
+    # Statistics runs is small, no need to batch run it
+    last_run = session.query(func.max(StatisticsRuns.start)).scalar()
+    if last_run is None:
+        return
+    deleted_rows = (
+        session.query(StatisticsRuns)
+        .filter(StatisticsRuns.start < purge_before)
+        .filter(StatisticsRuns.start < last_run)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s statistics_runs", deleted_rows)
+
+
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     """Remove filtered states and events that shouldn't be in the database."""
     _LOGGER.debug("Cleanup filtered data")
 
     # Check if excluded entity_ids are in database
+    query = session.query(distinct(States.entity_id))
+    predicate = sqlalchemy_filter_from_entity_filter(instance.entity_filter)
+    if predicate is not None:
+        query = query.filter(not_(predicate))
     excluded_entity_ids: list[str] = [
         entity_id
-        for (entity_id,) in session.query(distinct(States.entity_id)).all()
+        for (entity_id,) in query.all()
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(session, excluded_entity_ids)
+        _purge_filtered_states(instance, session, excluded_entity_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -148,13 +248,15 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(session, excluded_event_types)
+        _purge_filtered_events(instance, session, excluded_event_types)
         return False
 
     return True
 
 
-def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) -> None:
+def _purge_filtered_states(
+    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
@@ -170,11 +272,13 @@ def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) ->
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
 
 
-def _purge_filtered_events(session: Session, excluded_event_types: list[str]) -> None:
+def _purge_filtered_events(
+    instance: Recorder, session: Session, excluded_event_types: list[str]
+) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
         session.query(Events.event_id)
@@ -190,7 +294,7 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
         session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
     )
     state_ids: list[int] = [state.state_id for state in states]
-    _purge_state_ids(session, state_ids)
+    _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
 
 
@@ -198,15 +302,17 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
 def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool]) -> bool:
     """Purge states and events of specified entities."""
     with session_scope(session=instance.get_session()) as session:  # type: ignore
+        query = session.query(distinct(States.entity_id))
+        predicate = sqlalchemy_filter_from_entity_filter(entity_filter)
+        if predicate is not None:
+            query = query.filter(predicate)
         selected_entity_ids: list[str] = [
-            entity_id
-            for (entity_id,) in session.query(distinct(States.entity_id)).all()
-            if entity_filter(entity_id)
+            entity_id for (entity_id,) in query.all() if entity_filter(entity_id)
         ]
         _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
         if len(selected_entity_ids) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(session, selected_entity_ids)
+            _purge_filtered_states(instance, session, selected_entity_ids)
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
@@ -7,7 +7,7 @@ from itertools import groupby
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 
-from sqlalchemy import bindparam
+from sqlalchemy import bindparam, func
 from sqlalchemy.ext import baked
 from sqlalchemy.orm.scoping import scoped_session
 
@@ -19,11 +19,16 @@ import homeassistant.util.pressure as pressure_util
 import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 
-from .const import DOMAIN
+from .const import DATA_INSTANCE, DOMAIN
 from .models import (
+    StatisticData,
     StatisticMetaData,
     Statistics,
+    StatisticsBase,
     StatisticsMeta,
+    StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from .util import execute, retryable_database_job, session_scope
@@ -42,6 +47,31 @@ QUERY_STATISTICS = [
     Statistics.sum,
 ]
 
+QUERY_STATISTICS_SHORT_TERM = [
+    StatisticsShortTerm.metadata_id,
+    StatisticsShortTerm.start,
+    StatisticsShortTerm.mean,
+    StatisticsShortTerm.min,
+    StatisticsShortTerm.max,
+    StatisticsShortTerm.last_reset,
+    StatisticsShortTerm.state,
+    StatisticsShortTerm.sum,
+]
+
+# The hourly mean weights each 5-minute mean by the seconds it covers, rows
+# compiled before the duration was recorded count as complete periods
+_MEAN_DURATION = func.coalesce(
+    StatisticsShortTerm.mean_duration,
+    StatisticsShortTerm.duration.total_seconds(),
+)
+
+QUERY_STATISTICS_SUMMARY_MEAN = [
+    StatisticsShortTerm.metadata_id,
+    func.sum(StatisticsShortTerm.mean * _MEAN_DURATION) / func.sum(_MEAN_DURATION),
+    func.min(StatisticsShortTerm.min),
+    func.max(StatisticsShortTerm.max),
+]
+
 QUERY_STATISTIC_META = [
     StatisticsMeta.id,
     StatisticsMeta.statistic_id,
@@ -51,6 +81,23 @@ QUERY_STATISTIC_META = [
 STATISTICS_BAKERY = "recorder_statistics_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_bakery"
 
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+
+STATISTICS_TABLES: dict[str, type[StatisticsBase]] = {
+    PERIOD_5MINUTE: StatisticsShortTerm,
+    PERIOD_HOUR: Statistics,
+}
+
+QUERY_STATISTICS_TABLES = {
+    PERIOD_5MINUTE: QUERY_STATISTICS_SHORT_TERM,
+    PERIOD_HOUR: QUERY_STATISTICS,
+}
+
+# Requests for statistics spanning at most this long are answered with the
+# short term statistics, if they are still kept for the requested period
+SHORT_TERM_STATISTICS_MAX_SPAN = timedelta(days=1)
+
 # Convert pressure and temperature statistics from the native unit used for statistics
 # to the units configured by the user
 UNIT_CONVERSIONS = {
@@ -100,69 +147,225 @@ def async_setup(hass: HomeAssistant) -> None:
         )
 
 
-def get_start_time() -> datetime:
-    """Return start time."""
-    last_hour = dt_util.utcnow() - timedelta(hours=1)
-    start = last_hour.replace(minute=0, second=0, microsecond=0)
-    return start
+def get_start_time(duration: timedelta = StatisticsShortTerm.duration) -> datetime:
+    """Return the start time of the last complete period of duration."""
+    now = dt_util.utcnow()
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    current_period = now - (now - midnight) % duration
+    return current_period - duration
 
 
-def _get_metadata_ids(
-    hass: HomeAssistant, session: scoped_session, statistic_ids: list[str]
-) -> list[str]:
-    """Resolve metadata_id for a list of statistic_ids."""
+def get_missing_periods(session: scoped_session, oldest: datetime) -> list[datetime]:
+    """Return the starts of the 5-minute periods that are not compiled yet.
+
+    These are the periods after the last compiled one, but not before oldest,
+    up to and including the last complete period. Without any compiled
+    period only the last complete period is returned.
+    """
+    last_period = get_start_time()
+    last_run = session.query(func.max(StatisticsRuns.start)).scalar()
+    if last_run is None:
+        return [last_period]
+
+    start = max(
+        process_timestamp(last_run) + StatisticsShortTerm.duration,
+        oldest - (oldest - last_period) % StatisticsShortTerm.duration,
+    )
+    periods = []
+    while start <= last_period:
+        periods.append(start)
+        start += StatisticsShortTerm.duration
+    return periods
+
+
+def _statistics_query(hass: HomeAssistant, period: str) -> Any:
+    """Return a baked query of the statistics of period."""
+    # The period is part of the cache key since the criteria added to the query
+    # refer to the table of the period
+    return hass.data[STATISTICS_BAKERY](
+        lambda session: session.query(*QUERY_STATISTICS_TABLES[period]), period
+    )
+
+
+def _get_or_add_metadata_ids(
+    hass: HomeAssistant,
+    session: scoped_session,
+    metadata: dict[str, StatisticMetaData],
+) -> dict[str, int]:
+    """Get metadata_id for each statistic_id, add the ones which don't exist."""
     baked_query = hass.data[STATISTICS_META_BAKERY](
         lambda session: session.query(*QUERY_STATISTIC_META)
     )
     baked_query += lambda q: q.filter(
         StatisticsMeta.statistic_id.in_(bindparam("statistic_ids"))
     )
-    result = execute(baked_query(session).params(statistic_ids=statistic_ids))
 
-    return [id for id, _, _ in result] if result else []
+    def _query_metadata_ids(statistic_ids: list[str]) -> dict[str, int]:
+        result = execute(baked_query(session).params(statistic_ids=statistic_ids))
+        return {statistic_id: id for id, statistic_id, _ in result or []}
+
+    metadata_ids = _query_metadata_ids(list(metadata))
+    if missing := [
+        statistic_id for statistic_id in metadata if statistic_id not in metadata_ids
+    ]:
+        session.add_all(
+            StatisticsMeta.from_meta(
+                DOMAIN,
+                statistic_id,
+                metadata[statistic_id]["unit_of_measurement"],
+                metadata[statistic_id]["has_mean"],
+                metadata[statistic_id]["has_sum"],
+            )
+            for statistic_id in missing
+        )
+        metadata_ids.update(_query_metadata_ids(missing))
+    return metadata_ids
 
 
-def _get_or_add_metadata_id(
-    hass: HomeAssistant,
-    session: scoped_session,
-    statistic_id: str,
-    metadata: StatisticMetaData,
-) -> str:
-    """Get metadata_id for a statistic_id, add if it doesn't exist."""
-    metadata_id = _get_metadata_ids(hass, session, [statistic_id])
-    if not metadata_id:
-        unit = metadata["unit_of_measurement"]
-        has_mean = metadata["has_mean"]
-        has_sum = metadata["has_sum"]
-        session.add(
-            StatisticsMeta.from_meta(DOMAIN, statistic_id, unit, has_mean, has_sum)
-        )
-        metadata_id = _get_metadata_ids(hass, session, [statistic_id])
-    return metadata_id[0]
+def _compile_short_term_statistics(
+    instance: Recorder, start: datetime, hour_start: datetime
+) -> None:
+    """Compile 5-minute statistics for the period starting at start.
 
+    hour_start is the start of the hour the period belongs to.
+    """
+    end = start + StatisticsShortTerm.duration
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        if session.query(StatisticsShortTerm.id).filter_by(start=start).first():
+            # The statistics were already compiled by an earlier attempt
+            return
 
-@retryable_database_job("statistics")
-def compile_statistics(instance: Recorder, start: datetime) -> bool:
-    """Compile statistics."""
-    start = dt_util.as_utc(start)
-    end = start + timedelta(hours=1)
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
-    platform_stats = []
+    platform_stats: dict[str, dict] = {}
     for domain, platform in instance.hass.data[DOMAIN].items():
         if not hasattr(platform, "compile_statistics"):
             continue
-        platform_stats.append(platform.compile_statistics(instance.hass, start, end))
+        compiled = platform.compile_statistics(instance.hass, start, end, hour_start)
         _LOGGER.debug(
-            "Statistics for %s during %s-%s: %s", domain, start, end, platform_stats[-1]
+            "Statistics for %s during %s-%s: %s", domain, start, end, compiled
         )
+        platform_stats.update(compiled)
+
+    if not platform_stats:
+        return
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        for stats in platform_stats:
-            for entity_id, stat in stats.items():
-                metadata_id = _get_or_add_metadata_id(
-                    instance.hass, session, entity_id, stat["meta"]
+        metadata_ids = _get_or_add_metadata_ids(
+            instance.hass,
+            session,
+            {entity_id: stat["meta"] for entity_id, stat in platform_stats.items()},
+        )
+        # Insert the statistics of all entities with a single executemany
+        session.execute(
+            StatisticsShortTerm.__table__.insert(),
+            [
+                StatisticsShortTerm.row_from_stats(
+                    metadata_ids[entity_id], start, stat["stat"]
                 )
-                session.add(Statistics.from_stats(metadata_id, start, stat["stat"]))
+                for entity_id, stat in platform_stats.items()
+            ],
+        )
+
+
+def _compile_hourly_statistics(instance: Recorder, start: datetime) -> None:
+    """Compile hourly statistics by summarizing the short term statistics of the hour.
+
+    The mean is the average of the 5-minute means weighted by the seconds they
+    cover, min and max are the extremes of the 5-minute min and max. The sum,
+    state and last_reset are taken from the last 5-minute statistics of the hour.
+    """
+    end = start + Statistics.duration
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        if session.query(Statistics.id).filter_by(start=start).first():
+            # The statistics were already compiled by an earlier attempt
+            return
+
+        _LOGGER.debug("Compiling hourly statistics for %s-%s", start, end)
+        summary: dict[int, StatisticData] = {}
+
+        stats = execute(
+            session.query(*QUERY_STATISTICS_SUMMARY_MEAN)
+            .filter(StatisticsShortTerm.start >= start)
+            .filter(StatisticsShortTerm.start < end)
+            .filter(StatisticsShortTerm.mean.isnot(None))
+            .group_by(StatisticsShortTerm.metadata_id)
+        )
+        for metadata_id, _mean, _min, _max in stats or []:
+            summary[metadata_id] = {"mean": _mean, "min": _min, "max": _max}
+
+        most_recent_starts = (
+            session.query(
+                StatisticsShortTerm.metadata_id.label("max_metadata_id"),
+                func.max(StatisticsShortTerm.start).label("max_start"),
+            )
+            .filter(StatisticsShortTerm.start >= start)
+            .filter(StatisticsShortTerm.start < end)
+            .filter(StatisticsShortTerm.sum.isnot(None))
+            .group_by(StatisticsShortTerm.metadata_id)
+            .subquery()
+        )
+        stats = execute(
+            session.query(*QUERY_STATISTICS_SHORT_TERM).join(
+                most_recent_starts,
+                (
+                    StatisticsShortTerm.metadata_id  # pylint: disable=comparison-with-callable
+                    == most_recent_starts.c.max_metadata_id
+                )
+                & (StatisticsShortTerm.start == most_recent_starts.c.max_start),
+            )
+        )
+        for stat in stats or []:
+            summary.setdefault(stat.metadata_id, {}).update(
+                {"last_reset": stat.last_reset, "state": stat.state, "sum": stat.sum}
+            )
+
+        if summary:
+            session.execute(
+                Statistics.__table__.insert(),
+                [
+                    Statistics.row_from_stats(metadata_id, start, stat)
+                    for metadata_id, stat in summary.items()
+                ],
+            )
+
+
+@retryable_database_job("statistics")
+def compile_statistics(instance: Recorder, start: datetime) -> bool:
+    """Compile 5-minute statistics, and hourly statistics when an hour is complete.
+
+    Compiled periods are recorded as statistics runs, so the recorder can
+    compile the periods it missed while it was not running.
+    """
+    start = dt_util.as_utc(start)
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        if session.query(StatisticsRuns.run_id).filter_by(start=start).first():
+            _LOGGER.debug("Statistics already compiled for %s", start)
+            return True
+
+    _compile_short_term_statistics(
+        instance, start, start.replace(minute=0, second=0, microsecond=0)
+    )
+
+    end = start + StatisticsShortTerm.duration
+    if end.minute == 0:
+        # The last 5-minute period of the hour is compiled, summarize the hour
+        _compile_hourly_statistics(instance, end - Statistics.duration)
+
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        session.add(StatisticsRuns(start=start))
+
+    return True
+
+
+@retryable_database_job("statistics")
+def compile_hourly_statistics(instance: Recorder, start: datetime) -> bool:
+    """Compile all 5-minute statistics of the hour starting at start and summarize them."""
+    start = dt_util.as_utc(start)
+    period_start = start
+    while period_start < start + Statistics.duration:
+        _compile_short_term_statistics(instance, period_start, start)
+        period_start += StatisticsShortTerm.duration
+    _compile_hourly_statistics(instance, start)
 
     return True
 
@@ -252,36 +455,53 @@ def list_statistic_ids(
     ]
 
 
+def pick_statistics_period(
+    hass: HomeAssistant, start_time: datetime, end_time: datetime | None = None
+) -> str:
+    """Return the period of the statistics best suited for start_time - end_time.
+
+    Short spans are answered with the 5-minute statistics as long as those are
+    still kept for start_time, anything else with the hourly statistics.
+    """
+    now = dt_util.utcnow()
+    keep_days = hass.data[DATA_INSTANCE].short_term_statistics_keep_days
+    if (end_time or now) - start_time <= SHORT_TERM_STATISTICS_MAX_SPAN and (
+        start_time >= now - timedelta(days=keep_days)
+    ):
+        return PERIOD_5MINUTE
+    return PERIOD_HOUR
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
     end_time: datetime | None = None,
     statistic_ids: list[str] | None = None,
+    period: str = PERIOD_HOUR,
 ) -> dict[str, list[dict[str, str]]]:
     """Return states changes during UTC period start_time - end_time."""
     metadata = None
+    table = STATISTICS_TABLES[period]
     with session_scope(hass=hass) as session:
         metadata = _get_metadata(hass, session, statistic_ids, None)
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+        baked_query = _statistics_query(hass, period)
 
-        baked_query += lambda q: q.filter(Statistics.start >= bindparam("start_time"))
+        baked_query += lambda q: q.filter(table.start >= bindparam("start_time"))
 
         if end_time is not None:
-            baked_query += lambda q: q.filter(Statistics.start < bindparam("end_time"))
+            baked_query += lambda q: q.filter(table.start < bindparam("end_time"))
 
         metadata_ids = None
         if statistic_ids is not None:
             baked_query += lambda q: q.filter(
-                Statistics.metadata_id.in_(bindparam("metadata_ids"))
+                table.metadata_id.in_(bindparam("metadata_ids"))
             )
             metadata_ids = list(metadata.keys())
 
-        baked_query += lambda q: q.order_by(Statistics.metadata_id, Statistics.start)
+        baked_query += lambda q: q.order_by(table.metadata_id, table.start)
 
         stats = execute(
             baked_query(session).params(
@@ -303,9 +523,7 @@ def get_last_statistics(
         if not metadata:
             return {}
 
-        baked_query = hass.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
-        )
+        baked_query = _statistics_query(hass, PERIOD_HOUR)
 
         baked_query += lambda q: q.filter_by(metadata_id=bindparam("metadata_id"))
         metadata_id = next(iter(metadata.keys()))
@@ -327,6 +545,42 @@ def get_last_statistics(
         return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
 
 
+def get_latest_statistics(
+    hass: HomeAssistant, statistic_ids: list[str], period: str = PERIOD_HOUR
+) -> dict[str, list[dict]]:
+    """Return the last statistics of each of statistic_ids, using a single query."""
+    table = STATISTICS_TABLES[period]
+    with session_scope(hass=hass) as session:
+        metadata = _get_metadata(hass, session, statistic_ids, None)
+        if not metadata:
+            return {}
+
+        most_recent_starts = (
+            session.query(
+                table.metadata_id.label("max_metadata_id"),
+                func.max(table.start).label("max_start"),
+            )
+            .filter(table.metadata_id.in_(list(metadata)))
+            .group_by(table.metadata_id)
+            .subquery()
+        )
+        query = (
+            session.query(*QUERY_STATISTICS_TABLES[period])
+            .join(
+                most_recent_starts,
+                (table.metadata_id == most_recent_starts.c.max_metadata_id)
+                & (table.start == most_recent_starts.c.max_start),
+            )
+            .order_by(table.metadata_id)
+        )
+
+        stats = execute(query)
+        if not stats:
+            return {}
+
+        return _sorted_statistics_to_dict(hass, stats, statistic_ids, metadata)
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     stats: list,
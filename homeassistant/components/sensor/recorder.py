@@ -1,12 +1,19 @@
 """Statistics helper for sensor."""
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
 import datetime
+from functools import lru_cache
 import itertools
+import json
 import logging
-from typing import Callable
+import math
+import operator
+from typing import Callable, cast
 
 from homeassistant.components.recorder import history, statistics
+from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
     DEVICE_CLASS_BATTERY,
@@ -36,7 +43,7 @@ from homeassistant.const import (
     TEMP_FAHRENHEIT,
     TEMP_KELVIN,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant
 import homeassistant.util.dt as dt_util
 import homeassistant.util.pressure as pressure_util
 import homeassistant.util.temperature as temperature_util
@@ -128,103 +135,154 @@ def _is_number(s: str) -> bool:  # pylint: disable=invalid-name
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    fstates: Sequence[float],
+    offsets: Sequence[float],
+    start: datetime.datetime,
+    end: datetime.datetime,
 ) -> float:
     """Calculate a time weighted average.
 
     The average is calculated by, weighting the states by duration in seconds between
-    state changes.
+    state changes. The offsets are the seconds from start at which each state was set,
+    the recorder gives us the last known state which may be well before start so
+    offsets are clamped to 0.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    return accumulated / (end - start).total_seconds()
+    times = array("d", (max(offset, 0.0) for offset in offsets))
+    times.append((end - start).total_seconds())
+    # Weight each state by the duration until the next state change, or until the
+    # end of the period for the last state
+    durations = map(operator.sub, itertools.islice(times, 1, None), times)
+    accumulated = math.fsum(map(operator.mul, fstates, durations))
+    # Adjust start time, if there was no last known state
+    return accumulated / (times[-1] - times[0])
 
 
 def _normalize_states(
-    entity_history: list[State], key: str, entity_id: str
-) -> tuple[str | None, list[tuple[float, State]]]:
-    """Normalize units."""
+    entity_rows: list[tuple[str, str, datetime.datetime]],
+    key: str,
+    entity_id: str,
+    start: datetime.datetime,
+    decode_attributes: Callable[[str], dict],
+) -> tuple[str | None, array, array, list[dict]]:
+    """Normalize units and convert the rows of an entity to columns.
+
+    Returns the unit and the numerical states, their offsets in seconds from start
+    and their attributes.
+    """
     unit = None
+    convert = UNIT_CONVERSIONS.get(key)
+    fstates = array("d")
+    offsets = array("d")
+    attributes = []
 
-    if key not in UNIT_CONVERSIONS:
-        # We're not normalizing this device class, return the state as they are
-        fstates = [
-            (float(el.state), el) for el in entity_history if _is_number(el.state)
-        ]
-        if fstates:
-            unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-        return unit, fstates
-
-    fstates = []
-
-    for state in entity_history:
+    for state, attrs, last_updated in entity_rows:
         # Exclude non numerical states from statistics
-        if not _is_number(state.state):
+        if not state or not _is_number(state):
             continue
 
-        fstate = float(state.state)
-        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-        # Exclude unsupported units from statistics
-        if unit not in UNIT_CONVERSIONS[key]:
-            if entity_id not in WARN_UNSUPPORTED_UNIT:
-                WARN_UNSUPPORTED_UNIT.add(entity_id)
-                _LOGGER.warning("%s has unknown unit %s", entity_id, unit)
-            continue
+        state_attributes = decode_attributes(attrs)
+        fstate = float(state)
 
-        fstates.append((UNIT_CONVERSIONS[key][unit](fstate), state))
+        if convert is None:
+            # We're not normalizing this device class, keep the state as it is
+            if unit is None:
+                unit = state_attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        else:
+            unit = state_attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            # Exclude unsupported units from statistics
+            if unit not in convert:
+                if entity_id not in WARN_UNSUPPORTED_UNIT:
+                    WARN_UNSUPPORTED_UNIT.add(entity_id)
+                    _LOGGER.warning("%s has unknown unit %s", entity_id, unit)
+                continue
+            fstate = convert[unit](fstate)
 
-    return DEVICE_CLASS_UNITS[key], fstates
+        fstates.append(fstate)
+        offsets.append((process_timestamp(last_updated) - start).total_seconds())
+        attributes.append(state_attributes)
+
+    if convert is not None:
+        unit = DEVICE_CLASS_UNITS[key]
+    return unit, fstates, offsets, attributes
 
 
 def compile_statistics(
-    hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
+    hass: HomeAssistant,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    hour_start: datetime.datetime | None = None,
 ) -> dict:
     """Compile statistics for all entities during start-end.
 
+    Unavailable or unknown states are skipped, the last numerical state since
+    hour_start is the value of a sensor until its next numerical state.
+
+    The states of all entities are fetched with a single query as raw rows, and
+    the statistics are calculated on columns of floats per entity.
+
     Note: This will query the database and must not be run in the event loop
     """
     result: dict = {}
 
     entities = _get_entities(hass)
+    if not entities:
+        return result
 
     # Get history between start and end
-    history_list = history.get_significant_states(  # type: ignore
+    history_rows = history.get_significant_state_rows(  # type: ignore
         hass, start - datetime.timedelta.resolution, end, [i[0] for i in entities]
     )
 
+    # Look up the last numerical state of sensors which start the period without
+    # one, so the statistics of the hour match the statistics of its periods
+    if hour_start is not None and hour_start < start and (
+        carry_entity_ids := [
+            entity_id
+            for entity_id, rows in history_rows.items()
+            if not rows[0][0] or not _is_number(rows[0][0])
+        ]
+    ):
+        carry_rows = history.get_significant_state_rows(  # type: ignore
+            hass, hour_start - datetime.timedelta.resolution, start, carry_entity_ids
+        )
+        for entity_id, rows in carry_rows.items():
+            for row in reversed(rows):
+                if row[0] and _is_number(row[0]):
+                    history_rows[entity_id].insert(0, row)
+                    break
+
+    # Attributes are shared between states, only decode each of them once
+    @lru_cache(maxsize=None)
+    def decode_attributes(attrs: str) -> dict:
+        try:
+            return cast(dict, json.loads(attrs))
+        except ValueError:
+            _LOGGER.exception("Error converting attributes %s", attrs)
+            return {}
+
+    # Fetch the last statistics of all sensors which have a sum, sensors without
+    # short term statistics continue from their hourly statistics
+    sum_entity_ids = [
+        entity_id
+        for entity_id, key in entities
+        if "sum" in DEVICE_CLASS_OR_UNIT_STATISTICS[key] and entity_id in history_rows
+    ]
+    last_stats = statistics.get_latest_statistics(
+        hass, sum_entity_ids, statistics.PERIOD_5MINUTE
+    )
+    if missing := [i for i in sum_entity_ids if i not in last_stats]:
+        last_stats.update(statistics.get_latest_statistics(hass, missing))
+
     for entity_id, key in entities:
         wanted_statistics = DEVICE_CLASS_OR_UNIT_STATISTICS[key]
 
-        if entity_id not in history_list:
+        if entity_id not in history_rows:
             continue
 
-        entity_history = history_list[entity_id]
-        unit, fstates = _normalize_states(entity_history, key, entity_id)
+        unit, fstates, offsets, attributes = _normalize_states(
+            history_rows[entity_id], key, entity_id, start, decode_attributes
+        )
 
         if not fstates:
             continue
@@ -241,29 +299,32 @@ def compile_statistics(
         # Make calculations
         stat: dict = {}
         if "max" in wanted_statistics:
-            stat["max"] = max(*itertools.islice(zip(*fstates), 1))
+            stat["max"] = max(fstates)
         if "min" in wanted_statistics:
-            stat["min"] = min(*itertools.islice(zip(*fstates), 1))
+            stat["min"] = min(fstates)
 
         if "mean" in wanted_statistics:
-            stat["mean"] = _time_weighted_average(fstates, start, end)
+            stat["mean"] = _time_weighted_average(fstates, offsets, start, end)
+            # The mean only covers the period from the first known state
+            stat["mean_duration"] = (end - start).total_seconds() - max(
+                offsets[0], 0.0
+            )
 
         if "sum" in wanted_statistics:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0
-            last_stats = statistics.get_last_statistics(hass, 1, entity_id)
             if entity_id in last_stats:
                 # We have compiled history for this sensor before, use that as a starting point
                 last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
                 new_state = old_state = last_stats[entity_id][0]["state"]
                 _sum = last_stats[entity_id][0]["sum"]
 
-            for fstate, state in fstates:
+            for fstate, state_attributes in zip(fstates, attributes):
 
-                if "last_reset" not in state.attributes:
+                if "last_reset" not in state_attributes:
                     continue
-                if (last_reset := state.attributes["last_reset"]) != old_last_reset:
+                if (last_reset := state_attributes["last_reset"]) != old_last_reset:
                     # The sensor has been reset, update the sum
                     if old_state is not None:
                         _sum += new_state - old_state
@@ -0,0 +1,136 @@
+"""Incrementally updated statistics over a window of samples."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import math
+from statistics import StatisticsError
+
+
+class RollingStatistics:
+    """Statistics over a window of samples that enter and leave it.
+
+    Mean and variance are kept as running sums with Welford's algorithm and
+    the samples are kept sorted for the median, quantiles, min and max. The
+    running sums are recomputed once as many samples left the window as it
+    holds, to keep the floating point error from accumulating.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self._sorted: list[float] = []
+        self._total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._sorted)
+
+    def add(self, value: float) -> None:
+        """Add a sample to the window."""
+        insort(self._sorted, value)
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._sorted)
+        self._m2 += delta * (value - self._mean)
+
+    def remove(self, value: float) -> None:
+        """Remove a sample from the window."""
+        index = bisect_left(self._sorted, value)
+        if index < len(self._sorted) and self._sorted[index] == value:
+            del self._sorted[index]
+        else:
+            # Values like NaN are not ordered
+            self._sorted.remove(value)
+        count = len(self._sorted)
+        self._removed += 1
+        if self._removed >= count:
+            self._recompute()
+            return
+        self._total -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._m2 -= delta * (value - self._mean)
+
+    def _recompute(self) -> None:
+        """Recompute the running sums from the samples."""
+        self._removed = 0
+        if not self._sorted:
+            self._total = self._mean = self._m2 = 0.0
+            return
+        self._total = math.fsum(self._sorted)
+        self._mean = self._total / len(self._sorted)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._sorted)
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the samples."""
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        if not self._sorted:
+            raise StatisticsError("mean requires at least one data point")
+        return self._mean
+
+    @property
+    def median(self) -> float:
+        """Return the median of the samples."""
+        count = len(self._sorted)
+        if count == 0:
+            raise StatisticsError("no median for empty data")
+        if count % 2 == 1:
+            return self._sorted[count // 2]
+        return (self._sorted[count // 2 - 1] + self._sorted[count // 2]) / 2
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the samples."""
+        if len(self._sorted) < 2:
+            raise StatisticsError("variance requires at least two data points")
+        return max(self._m2, 0.0) / (len(self._sorted) - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation of the samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """Return the smallest sample."""
+        return self._sorted[0]
+
+    @property
+    def max(self) -> float:
+        """Return the largest sample."""
+        return self._sorted[-1]
+
+    def quantiles(self, intervals: int, method: str) -> list[float]:
+        """Return the cut points dividing the samples in equal intervals.
+
+        Matches statistics.quantiles without sorting the samples again.
+        """
+        data = self._sorted
+        count = len(data)
+        if count < 2:
+            raise StatisticsError("must have at least two data points")
+        result = []
+        if method == "inclusive":
+            scale = count - 1
+            for idx in range(1, intervals):
+                pos, delta = divmod(idx * scale, intervals)
+                result.append(
+                    (data[pos] * (intervals - delta) + data[pos + 1] * delta)
+                    / intervals
+                )
+            return result
+        scale = count + 1
+        for idx in range(1, intervals):
+            pos = min(max(idx * scale // intervals, 1), count - 1)
+            delta = idx * scale - pos * intervals
+            result.append(
+                (data[pos - 1] * (intervals - delta) + data[pos] * delta) / intervals
+            )
+        return result
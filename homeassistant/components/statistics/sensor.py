@@ -5,8 +5,7 @@ import statistics
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
-from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.recorder import preload
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
@@ -26,6 +25,7 @@ from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .rolling import RollingStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -133,6 +133,7 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._rolling = RollingStatistics()
 
         self.count = 0
         self.mean = self.median = self.quantiles = self.stdev = self.variance = None
@@ -185,17 +186,31 @@ class StatisticsSensor(SensorEntity):
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                value = new_state.state
             else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
                 new_state.state,
             )
+            return
+
+        if len(self.states) == self._sampling_size:
+            self._remove_oldest_state()
+
+        self.states.append(value)
+        self.ages.append(new_state.last_updated)
+        if not self.is_binary:
+            self._rolling.add(value)
+
+    def _remove_oldest_state(self):
+        """Remove the oldest state from the queue."""
+        self.ages.popleft()
+        value = self.states.popleft()
+        if not self.is_binary:
+            self._rolling.remove(value)
 
     @property
     def name(self):
@@ -262,8 +277,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_state()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -283,23 +297,22 @@ class StatisticsSensor(SensorEntity):
         self.count = len(self.states)
 
         if not self.is_binary:
+            rolling = self._rolling
             try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
+                self.mean = round(rolling.mean, self._precision)
+                self.median = round(rolling.median, self._precision)
             except statistics.StatisticsError as err:
                 _LOGGER.debug("%s: %s", self.entity_id, err)
                 self.mean = self.median = STATE_UNKNOWN
 
             try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
+                self.stdev = round(rolling.stdev, self._precision)
+                self.variance = round(rolling.variance, self._precision)
                 if self._quantile_intervals < self.count:
                     self.quantiles = [
                         round(quantile, self._precision)
-                        for quantile in statistics.quantiles(
-                            self.states,
-                            n=self._quantile_intervals,
-                            method=self._quantile_method,
+                        for quantile in rolling.quantiles(
+                            self._quantile_intervals, self._quantile_method
                         )
                     ]
             except statistics.StatisticsError as err:
@@ -307,9 +320,9 @@ class StatisticsSensor(SensorEntity):
                 self.stdev = self.variance = self.quantiles = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(rolling.total, self._precision)
+                self.min = round(rolling.min, self._precision)
+                self.max = round(rolling.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -359,38 +372,33 @@ class StatisticsSensor(SensorEntity):
     async def _async_initialize_from_database(self):
         """Initialize the list of states from the database.
 
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
+        Loads the last self._sampling_size states, oldest first. If MaxAge is
+        provided then only entries younger then current datetime - MaxAge
+        are loaded.
         """
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
-        with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
-            )
-
-            if self._max_age is not None:
-                records_older_then = dt_util.utcnow() - self._max_age
-                _LOGGER.debug(
-                    "%s: retrieve records not older then %s",
-                    self.entity_id,
-                    records_older_then,
-                )
-                query = query.filter(States.last_updated >= records_older_then)
-            else:
-                _LOGGER.debug("%s: retrieving all records", self.entity_id)
-
-            query = query.order_by(States.last_updated.desc()).limit(
-                self._sampling_size
+        records_older_then = None
+        if self._max_age is not None:
+            records_older_then = dt_util.utcnow() - self._max_age
+            _LOGGER.debug(
+                "%s: retrieve records not older then %s",
+                self.entity_id,
+                records_older_then,
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+        else:
+            _LOGGER.debug("%s: retrieving all records", self.entity_id)
+
+        states = await preload.async_get_states(
+            self.hass,
+            self._entity_id,
+            start_time=records_older_then,
+            number_of_states=self._sampling_size,
+            state_changes_only=False,
+        )
 
-        for state in reversed(states):
+        for state in states:
             self._add_state_to_queue(state)
 
         self.async_schedule_update_ha_state(True)
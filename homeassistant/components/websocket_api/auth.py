@@ -14,6 +14,7 @@ from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant
 
 from .connection import ActiveConnection
+from .const import FEATURE_COALESCE_MESSAGES
 from .error import Disconnect
 
 if TYPE_CHECKING:
@@ -30,6 +31,9 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("supported_features", default={}): vol.Schema(
+            {vol.Optional(FEATURE_COALESCE_MESSAGES): int}, extra=vol.ALLOW_EXTRA
+        ),
     }
 )
 
@@ -65,7 +69,7 @@ class AuthPhase:
         self._logger = logger
         self._request = request
 
-    async def async_handle(self, msg: dict[str, str]) -> ActiveConnection:
+    async def async_handle(self, msg: dict[str, Any]) -> ActiveConnection:
         """Handle authentication."""
         try:
             msg = AUTH_MESSAGE_SCHEMA(msg)
@@ -83,19 +87,29 @@ class AuthPhase:
                 msg["access_token"]
             )
             if refresh_token is not None:
-                return await self._async_finish_auth(refresh_token.user, refresh_token)
+                return await self._async_finish_auth(
+                    refresh_token.user, refresh_token, msg["supported_features"]
+                )
 
         self._send_message(auth_invalid_message("Invalid access token or password"))
         await process_wrong_login(self._request)
         raise Disconnect
 
     async def _async_finish_auth(
-        self, user: User, refresh_token: RefreshToken
+        self,
+        user: User,
+        refresh_token: RefreshToken,
+        supported_features: dict[str, int],
     ) -> ActiveConnection:
         """Create an active connection."""
         self._logger.debug("Auth OK")
         await process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            supported_features,
         )
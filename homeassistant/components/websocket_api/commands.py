@@ -12,7 +12,7 @@ from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -28,7 +28,11 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import (
+    DATA_IMPORT_TIME,
+    IntegrationNotFound,
+    async_get_integration,
+)
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 
 from . import const, decorators, messages
@@ -53,6 +57,7 @@ def async_register_commands(
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -228,17 +233,79 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    connection.send_message(
+        messages.result_message(msg["id"], _async_get_allowed_states(hass, connection))
+    )
+
+
+def _async_get_allowed_states(
+    hass: HomeAssistant, connection: ActiveConnection
+) -> list[State]:
+    """Return the states the user of the connection is allowed to read."""
     if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
+        return hass.states.async_all()
+    entity_perm = connection.user.permissions.check_entity
+    return [
+        state
+        for state in hass.states.async_all()
+        if entity_perm(state.entity_id, "read")
+    ]
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compressed states of all entities first, followed by
+    only the fields that changed whenever an entity changes.
+    """
+    entity_ids = msg.get("entity_ids")
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward entity state changed events to websocket."""
+        if not connection.user.permissions.check_entity(
+            event.data["entity_id"], POLICY_READ
+        ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    # Never await between collecting the states and listening for
+    # state changed events, or changes in between would be missed
+    states = _async_get_allowed_states(hass, connection)
+    if entity_ids is None:
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, forward_entity_changes)
     else:
-        entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in hass.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
+        unsub = hass.bus.async_listen_entity(
+            EVENT_STATE_CHANGED, entity_ids, forward_entity_changes
+        )
+        wanted = set(entity_ids)
+        states = [state for state in states if state.entity_id in wanted]
+    connection.subscriptions[msg["id"]] = unsub
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    connection.send_message(messages.result_message(msg["id"]))
+    connection.send_message(
+        messages.message_to_json(
+            messages.event_message(
+                msg["id"],
+                {
+                    messages.ENTITY_EVENT_ADD: {
+                        state.entity_id: messages.compressed_state_dict(state)
+                        for state in states
+                    }
+                },
+            )
+        )
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -296,10 +363,19 @@ async def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_time: dict[str, float] = {}
+    for module, seconds in list(hass.data.get(DATA_IMPORT_TIME, {}).items()):
+        integration = module.split(".", 1)[0]
+        import_time[integration] = import_time.get(integration, 0) + seconds
+
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "import_seconds": import_time.get(integration, 0),
+            }
             for integration, timedelta in hass.data[DATA_SETUP_TIME].items()
         ],
     )
@@ -27,6 +27,7 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        supported_features: dict[str, int] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -36,6 +37,7 @@ class ActiveConnection:
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
+        self.supported_features = supported_features or {}
 
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
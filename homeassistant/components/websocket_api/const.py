@@ -27,6 +27,9 @@ PENDING_MSG_PEAK: Final = 512
 PENDING_MSG_PEAK_TIME: Final = 5
 MAX_PENDING_MSG: Final = 2048
 
+# Features a client can ask for in its auth message
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_FOUND: Final = "not_found"
@@ -20,6 +20,7 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -66,19 +67,38 @@ class WebSocketHandler:
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._coalesce_messages = False
+        self._peak_pending = 0
 
     async def _writer(self) -> None:
         """Write outgoing messages."""
         # Exceptions if Socket disconnected or cancelled by connection handler
         assert self.wsock is not None
+        to_write = self._to_write
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                message = await self._to_write.get()
+                message = await to_write.get()
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                if not self._coalesce_messages or to_write.empty():
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    continue
+
+                # Send everything that is pending in a single frame
+                messages = [message]
+                while not to_write.empty():
+                    message = to_write.get_nowait()
+                    if message is None:
+                        break
+                    messages.append(message)
+
+                coalesced = f"[{','.join(messages)}]"
+                self._logger.debug("Sending %s", coalesced)
+                await self.wsock.send_str(coalesced)
+                if message is None:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -105,13 +125,20 @@ class WebSocketHandler:
 
             self._cancel()
 
-        if self._to_write.qsize() < PENDING_MSG_PEAK:
+        pending = self._to_write.qsize()
+        if pending > self._peak_pending:
+            self._peak_pending = pending
+
+        if pending < PENDING_MSG_PEAK:
             if self._peak_checker_unsub:
                 self._peak_checker_unsub()
                 self._peak_checker_unsub = None
             return
 
         if self._peak_checker_unsub is None:
+            self._logger.warning(
+                "Client is falling behind with %s pending messages", pending
+            )
             self._peak_checker_unsub = async_call_later(
                 self.hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
@@ -190,6 +217,9 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self._coalesce_messages = bool(
+                connection.supported_features.get(FEATURE_COALESCE_MESSAGES)
+            )
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -242,9 +272,16 @@ class WebSocketHandler:
 
             finally:
                 if disconnect_warn is None:
-                    self._logger.debug("Disconnected")
+                    self._logger.debug(
+                        "Disconnected, peak of %s pending messages",
+                        self._peak_pending,
+                    )
                 else:
-                    self._logger.warning("Disconnected: %s", disconnect_warn)
+                    self._logger.warning(
+                        "Disconnected: %s, peak of %s pending messages",
+                        disconnect_warn,
+                        self._peak_pending,
+                    )
 
                 if connection is not None:
                     self.hass.data[DATA_CONNECTIONS] -= 1
@@ -7,7 +7,8 @@ from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -31,6 +32,22 @@ BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive
 IDEN_TEMPLATE: Final = "__IDEN__"
 IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
 
+# Keys of compressed states
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+# Keys of entity events
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_REMOVE: Final = "r"
+ENTITY_EVENT_CHANGE: Final = "c"
+
+# Keys of state diffs
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -71,9 +88,125 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
+    if event.event_type == EVENT_STATE_CHANGED and event.data.keys() == {
+        "entity_id",
+        "old_state",
+        "new_state",
+    }:
+        try:
+            return _state_changed_event_json(event)
+        except (ValueError, TypeError):
+            # Let message_to_json report the invalid data
+            pass
     return message_to_json(event_message(IDEN_TEMPLATE, event))
 
 
+def _state_changed_event_json(event: Event) -> str:
+    """Serialize a state changed event message reusing the JSON of the states.
+
+    The new state of one event is the old state of the next one of the same
+    entity, so every state is only serialized once.
+    """
+    event_dict = event.as_dict()
+    del event_dict["data"]
+    old_state: State | None = event.data["old_state"]
+    new_state: State | None = event.data["new_state"]
+    data_json = (
+        f'{{"entity_id": {const.JSON_DUMP(event.data["entity_id"])}, '
+        f'"old_state": {old_state.as_dict_json() if old_state else "null"}, '
+        f'"new_state": {new_state.as_dict_json() if new_state else "null"}}}'
+    )
+    return (
+        f'{{"id": {IDEN_JSON_TEMPLATE}, "type": "event", '
+        f'"event": {const.JSON_DUMP(event_dict)[:-1]}, "data": {data_json}}}}}'
+    )
+
+
+def cached_state_diff_message(iden: int, event: Event) -> str:
+    """Return an event message with the compressed diff of a state change.
+
+    Serialize to json once per message.
+    """
+    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_message(event: Event) -> str:
+    """Cache and serialize the state diff of the event to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_state_diff_message
+    """
+    return message_to_json(event_message(IDEN_TEMPLATE, _state_diff_event(event)))
+
+
+def _state_diff_event(event: Event) -> dict[str, Any]:
+    """Convert a state changed event to the minimal entity event."""
+    new_state: State | None = event.data["new_state"]
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    old_state: State | None = event.data["old_state"]
+    if old_state is None:
+        return {
+            ENTITY_EVENT_ADD: {new_state.entity_id: compressed_state_dict(new_state)}
+        }
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return the fields of new_state that differ from old_state."""
+    additions: dict[str, Any] = {}
+    diff: dict[str, Any] = {STATE_DIFF_ADDITIONS: additions}
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    elif old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context != new_state.context:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state)
+    old_attributes = old_state.attributes
+    changed_attributes = {
+        key: value
+        for key, value in new_state.attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }
+    if changed_attributes:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+    removed_attributes = [
+        key for key in old_attributes if key not in new_state.attributes
+    ]
+    if removed_attributes:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed_attributes}
+    return diff
+
+
+def _compressed_context(state: State) -> str | dict[str, Any]:
+    """Return the context of a state, as only its id if that is all it has."""
+    context = state.context
+    if context.parent_id is None and not context.user_id:
+        return context.id
+    return context.as_dict()
+
+
+def compressed_state_dict(state: State) -> dict[str, Any]:
+    """Return a compact dict of a state with short keys.
+
+    last_updated is left out when it is the same as last_changed.
+    """
+    compressed = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_changed != state.last_updated:
+        compressed[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
@@ -11,6 +11,7 @@ from collections.abc import Awaitable, Collection, Coroutine, Iterable, Mapping
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -18,7 +19,7 @@ import re
 import threading
 from time import monotonic
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, TypeVar, cast
 
 import attr
 import voluptuous as vol
@@ -27,9 +28,9 @@ import yarl
 from homeassistant import block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
-    ATTR_SECONDS,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
     CONF_UNIT_SYSTEM_IMPERIAL,
@@ -44,7 +45,6 @@ from homeassistant.const import (
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
     EVENT_TIME_CHANGED,
-    EVENT_TIMER_OUT_OF_SYNC,
     LENGTH_METERS,
     MATCH_ALL,
     MAX_LENGTH_EVENT_EVENT_TYPE,
@@ -655,12 +655,25 @@ class Event:
         )
 
 
+_FilterableJob = Tuple[HassJob, Optional[Callable[["Event"], bool]]]
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self._listeners: dict[str, list[_FilterableJob]] = {}
+        # Listeners indexed by the entity_id or the domain of the entity_id
+        # in the event data, keyed by event type
+        self._entity_listeners: dict[str, dict[str, list[_FilterableJob]]] = {}
+        self._domain_listeners: dict[str, dict[str, list[_FilterableJob]]] = {}
+        self._indexed_listener_count: dict[str, int] = {}
+        # Per event type snapshot of the MATCH_ALL and event type listeners
+        self._listener_snapshots: dict[str, tuple[_FilterableJob, ...]] = {}
+        # Called with whether EVENT_TIME_CHANGED has listeners when they are
+        # added or removed, so the timer only ticks while it has listeners
+        self._time_changed_listeners_updated: Callable[[bool], None] | None = None
         self._hass = hass
 
     @callback
@@ -669,7 +682,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, count in self._indexed_listener_count.items():
+            listeners[event_type] = listeners.get(event_type, 0) + count
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -706,21 +722,29 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listeners = self._listener_snapshots.get(event_type)
+        if listeners is None:
+            listeners = self._async_snapshot_listeners(event_type)
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        has_indexed_listeners = (
+            event_data is not None
+            and event_type in self._indexed_listener_count
+            and self._async_has_indexed_listeners(event_type, event_data)
+        )
+
+        if (
+            not listeners
+            and not has_indexed_listeners
+            and not _LOGGER.isEnabledFor(logging.DEBUG)
+        ):
+            # Nobody is interested, skip creating the event
+            return
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
-
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -731,6 +755,94 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+        if has_indexed_listeners:
+            self._hass.loop.call_soon(self._async_run_indexed_listeners, event)
+
+    @callback
+    def _async_run_indexed_listeners(self, event: Event) -> None:
+        """Run the indexed listeners of an event.
+
+        The listeners are looked up when they run, so listeners added by
+        an earlier event are called as well. They run in a single job and
+        errors are logged per listener so one failing listener does not
+        prevent the others from running.
+        """
+        listeners = self._async_indexed_listeners(event.event_type, event.data)
+        for job, event_filter in listeners:
+            try:
+                if event_filter is None or event_filter(event):
+                    self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing %s for %s",
+                    event.event_type,
+                    event.data[ATTR_ENTITY_ID],
+                )
+
+    @callback
+    def _async_snapshot_listeners(self, event_type: str) -> tuple[_FilterableJob, ...]:
+        """Build and store the listeners to call for an event type."""
+        listeners = tuple(self._listeners.get(event_type, ()))
+
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners and the
+        # per second EVENT_TIME_CHANGED only to listeners that subscribe to it
+        match_all_listeners = self._listeners.get(MATCH_ALL)
+        if match_all_listeners is not None and event_type not in (
+            EVENT_HOMEASSISTANT_CLOSE,
+            EVENT_TIME_CHANGED,
+        ):
+            listeners = tuple(match_all_listeners) + listeners
+
+        self._listener_snapshots[event_type] = listeners
+        return listeners
+
+    @callback
+    def _async_has_indexed_listeners(
+        self, event_type: str, event_data: dict[str, Any]
+    ) -> bool:
+        """Return if there are indexed listeners for the entity_id in the event data.
+
+        The listeners themselves are only collected when they run.
+        """
+        entity_id = event_data.get(ATTR_ENTITY_ID)
+        if not isinstance(entity_id, str):
+            return False
+
+        entity_listeners = self._entity_listeners.get(event_type)
+        if entity_listeners is not None and entity_id in entity_listeners:
+            return True
+
+        domain_listeners = self._domain_listeners.get(event_type)
+        return domain_listeners is not None and (
+            entity_id.partition(".")[0] in domain_listeners
+            or MATCH_ALL in domain_listeners
+        )
+
+    @callback
+    def _async_indexed_listeners(
+        self, event_type: str, event_data: dict[str, Any]
+    ) -> tuple[_FilterableJob, ...]:
+        """Return the indexed listeners for the entity_id in the event data."""
+        entity_id = event_data.get(ATTR_ENTITY_ID)
+        if not isinstance(entity_id, str):
+            return ()
+
+        listeners: tuple[_FilterableJob, ...] = ()
+
+        entity_listeners = self._entity_listeners.get(event_type)
+        if entity_listeners is not None and entity_id in entity_listeners:
+            listeners = tuple(entity_listeners[entity_id])
+
+        domain_listeners = self._domain_listeners.get(event_type)
+        if domain_listeners is not None:
+            domain = entity_id.partition(".")[0]
+            if domain in domain_listeners:
+                listeners += tuple(domain_listeners[domain])
+            if MATCH_ALL in domain_listeners:
+                listeners += tuple(domain_listeners[MATCH_ALL])
+
+        return listeners
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -773,9 +885,15 @@ class EventBus:
 
     @callback
     def _async_listen_filterable_job(
-        self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
+        self, event_type: str, filterable_job: _FilterableJob
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_snapshots(event_type)
+        if (
+            event_type == EVENT_TIME_CHANGED
+            and self._time_changed_listeners_updated is not None
+        ):
+            self._time_changed_listeners_updated(True)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -783,6 +901,79 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_entity(
+        self,
+        event_type: str,
+        entity_ids: Iterable[str],
+        listener: Callable,
+        event_filter: Callable | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type about specific entities.
+
+        The listener only runs for events that have one of the entity_ids
+        as the ``entity_id`` in their event data. Unlike a listener with an
+        event_filter, other events never reach the listener.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        return self._async_listen_indexed(
+            self._entity_listeners,
+            event_type,
+            entity_ids,
+            (HassJob(listener), event_filter),
+        )
+
+    @callback
+    def async_listen_domain(
+        self,
+        event_type: str,
+        domains: Iterable[str],
+        listener: Callable,
+        event_filter: Callable | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type about entities of domains.
+
+        The listener only runs for events that have an ``entity_id`` of one
+        of the domains in their event data. To listen to events about
+        entities of all domains specify the constant ``MATCH_ALL`` as domain.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        return self._async_listen_indexed(
+            self._domain_listeners,
+            event_type,
+            domains,
+            (HassJob(listener), event_filter),
+        )
+
+    @callback
+    def _async_listen_indexed(
+        self,
+        index: dict[str, dict[str, list[_FilterableJob]]],
+        event_type: str,
+        keys: Iterable[str],
+        filterable_job: _FilterableJob,
+    ) -> CALLBACK_TYPE:
+        keys = set(keys)
+        event_index = index.setdefault(event_type, {})
+        for key in keys:
+            event_index.setdefault(key, []).append(filterable_job)
+        self._indexed_listener_count[event_type] = (
+            self._indexed_listener_count.get(event_type, 0) + 1
+        )
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_indexed_listener(index, event_type, keys, filterable_job)
+
+        return remove_listener
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None]
     ) -> CALLBACK_TYPE:
@@ -814,7 +1005,7 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        filterable_job: tuple[HassJob, Callable | None] | None = None
+        filterable_job: _FilterableJob | None = None
 
         @callback
         def _onetime_listener(event: Event) -> None:
@@ -836,9 +1027,17 @@ class EventBus:
 
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def _async_invalidate_snapshots(self, event_type: str) -> None:
+        """Drop the listener snapshots affected by a change to event_type."""
+        if event_type == MATCH_ALL:
+            self._listener_snapshots.clear()
+        else:
+            self._listener_snapshots.pop(event_type, None)
+
     @callback
     def _async_remove_listener(
-        self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
+        self, event_type: str, filterable_job: _FilterableJob
     ) -> None:
         """Remove a listener of a specific event_type.
 
@@ -856,6 +1055,45 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+
+        self._async_invalidate_snapshots(event_type)
+        if (
+            event_type == EVENT_TIME_CHANGED
+            and self._time_changed_listeners_updated is not None
+        ):
+            self._time_changed_listeners_updated(event_type in self._listeners)
+
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        index: dict[str, dict[str, list[_FilterableJob]]],
+        event_type: str,
+        keys: Iterable[str],
+        filterable_job: _FilterableJob,
+    ) -> None:
+        """Remove an indexed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            event_index = index[event_type]
+            for key in keys:
+                event_index[key].remove(filterable_job)
+                if not event_index[key]:
+                    del event_index[key]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        if not event_index:
+            del index[event_type]
+
+        self._indexed_listener_count[event_type] -= 1
+        if not self._indexed_listener_count[event_type]:
+            del self._indexed_listener_count[event_type]
 
 
 class State:
@@ -881,6 +1119,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -910,12 +1150,19 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        # Attributes of a previous state are shared instead of wrapped again
+        self.attributes = (
+            attributes
+            if isinstance(attributes, MappingProxyType)
+            else MappingProxyType(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._attributes_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -948,6 +1195,44 @@ class State:
             }
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return the JSON representation of the State.
+
+        Async friendly.
+
+        The result is cached and only encodes the attributes again when
+        they are not shared with the previous state of the entity.
+        """
+        if self._as_dict_json is None:
+            as_dict = self.as_dict()
+            head = _json_dumps(
+                {"entity_id": as_dict["entity_id"], "state": as_dict["state"]}
+            )
+            tail = _json_dumps(
+                {
+                    "last_changed": as_dict["last_changed"],
+                    "last_updated": as_dict["last_updated"],
+                    "context": as_dict["context"],
+                }
+            )
+            self._as_dict_json = (
+                f'{head[:-1]}, "attributes": {self.attributes_json()}, {tail[1:]}'
+            )
+        return self._as_dict_json
+
+    def attributes_json(self) -> str:
+        """Return the compact JSON representation of the attributes.
+
+        Async friendly.
+
+        Raises ValueError for attributes that are not valid JSON, like NaN.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = _json_dumps(
+                dict(self.attributes), separators=(",", ":")
+            )
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1002,6 +1287,27 @@ class State:
         )
 
 
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, "as_dict"):
+            return o.as_dict()
+
+        return json.JSONEncoder.default(self, o)
+
+
+_json_dumps = functools.partial(json.dumps, cls=JSONEncoder, allow_nan=False)
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
@@ -1218,12 +1524,15 @@ class StateMachine:
         state = State(
             entity_id,
             new_state,
-            attributes,
+            old_state.attributes if old_state is not None and same_attr else attributes,
             last_changed,
             now,
             context,
             old_state is None,
         )
+        if old_state is not None and same_attr:
+            # pylint: disable=protected-access
+            state._attributes_json = old_state._attributes_json
         self._states[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1752,8 +2061,12 @@ class Config:
 
 
 def _async_create_timer(hass: HomeAssistant) -> None:
-    """Create a timer that will start on HOMEASSISTANT_START."""
-    handle = None
+    """Create a timer that will start on HOMEASSISTANT_START.
+
+    The timer only ticks while something listens to EVENT_TIME_CHANGED.
+    """
+    # pylint: disable=protected-access
+    handle: asyncio.TimerHandle | None = None
     timer_context = Context()
 
     def schedule_tick(now: datetime.datetime) -> None:
@@ -1761,11 +2074,10 @@ def _async_create_timer(hass: HomeAssistant) -> None:
         nonlocal handle
 
         slp_seconds = 1 - (now.microsecond / 10 ** 6)
-        target = monotonic() + slp_seconds
-        handle = hass.loop.call_later(slp_seconds, fire_time_event, target)
+        handle = hass.loop.call_later(slp_seconds, fire_time_event)
 
     @callback
-    def fire_time_event(target: float) -> None:
+    def fire_time_event() -> None:
         """Fire next time event."""
         now = dt_util.utcnow()
 
@@ -1773,25 +2085,29 @@ def _async_create_timer(hass: HomeAssistant) -> None:
             EVENT_TIME_CHANGED, {ATTR_NOW: now}, time_fired=now, context=timer_context
         )
 
-        # If we are more than a second late, a tick was missed
-        late = monotonic() - target
-        if late > 1:
-            hass.bus.async_fire(
-                EVENT_TIMER_OUT_OF_SYNC,
-                {ATTR_SECONDS: late},
-                time_fired=now,
-                context=timer_context,
-            )
-
         schedule_tick(now)
 
+    @callback
+    def listeners_updated(has_listeners: bool) -> None:
+        """Start or stop ticking when the first or last listener comes or goes."""
+        nonlocal handle
+
+        if not has_listeners:
+            if handle is not None:
+                handle.cancel()
+                handle = None
+        elif handle is None:
+            schedule_tick(dt_util.utcnow())
+
     @callback
     def stop_timer(_: Event) -> None:
         """Stop the timer."""
+        hass.bus._time_changed_listeners_updated = None
         if handle is not None:
             handle.cancel()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_timer)
 
     _LOGGER.info("Timer:starting")
-    schedule_tick(dt_util.utcnow())
+    hass.bus._time_changed_listeners_updated = listeners_updated
+    listeners_updated(EVENT_TIME_CHANGED in hass.bus.async_listeners())
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
@@ -150,6 +151,38 @@ def _async_get_device_id_from_index(
     return None
 
 
+class _RegistryEncoder(json.JSONEncoder):
+    """Encoder that converts device registry entries to their stored form."""
+
+    def default(self, o: Any) -> Any:
+        """Convert device registry entries."""
+        if isinstance(o, DeviceEntry):
+            return {
+                "config_entries": list(o.config_entries),
+                "connections": list(o.connections),
+                "identifiers": list(o.identifiers),
+                "manufacturer": o.manufacturer,
+                "model": o.model,
+                "name": o.name,
+                "sw_version": o.sw_version,
+                "entry_type": o.entry_type,
+                "id": o.id,
+                "via_device_id": o.via_device_id,
+                "area_id": o.area_id,
+                "name_by_user": o.name_by_user,
+                "disabled_by": o.disabled_by,
+            }
+        if isinstance(o, DeletedDeviceEntry):
+            return {
+                "config_entries": list(o.config_entries),
+                "connections": list(o.connections),
+                "identifiers": list(o.identifiers),
+                "id": o.id,
+                "orphaned_timestamp": o.orphaned_timestamp,
+            }
+        return super().default(o)
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
@@ -157,11 +190,15 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    _area_index: dict[str, dict[str, None]]
+    _config_entry_index: dict[str, dict[str, None]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.JournaledStore(
+            STORAGE_VERSION, STORAGE_KEY, "id", encoder=_RegistryEncoder
+        )
         self._clear_index()
 
     @callback
@@ -169,6 +206,16 @@ class DeviceRegistry:
         """Get device."""
         return self.devices.get(device_id)
 
+    @callback
+    def async_device_ids_for_area(self, area_id: str) -> list[str]:
+        """Return ids of the devices assigned to an area."""
+        return list(self._area_index.get(area_id, ()))
+
+    @callback
+    def async_device_ids_for_config_entry(self, config_entry_id: str) -> list[str]:
+        """Return ids of the devices belonging to a config entry."""
+        return list(self._config_entry_index.get(config_entry_id, ()))
+
     @callback
     def async_get_device(
         self,
@@ -200,10 +247,12 @@ class DeviceRegistry:
         """Add a device and index it."""
         if isinstance(device, DeletedDeviceEntry):
             devices_index = self._deleted_index
-            self.deleted_devices[device.id] = device
+            self._set_deleted_device(device)
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._store.async_record_change("devices", device.id, device)
+            self._add_reverse_index(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -212,30 +261,60 @@ class DeviceRegistry:
         if isinstance(device, DeletedDeviceEntry):
             devices_index = self._deleted_index
             self.deleted_devices.pop(device.id)
+            self._store.async_record_change("deleted_devices", device.id, None)
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._store.async_record_change("devices", device.id, None)
+            self._remove_reverse_index(device)
 
         _remove_device_from_index(devices_index, device)
 
+    def _set_deleted_device(self, device: DeletedDeviceEntry) -> None:
+        """Add or replace a deleted device without indexing it."""
+        self.deleted_devices[device.id] = device
+        self._store.async_record_change("deleted_devices", device.id, device)
+
     def _update_device(self, old_device: DeviceEntry, new_device: DeviceEntry) -> None:
         """Update a device and the index."""
         self.devices[new_device.id] = new_device
+        self._store.async_record_change("devices", new_device.id, new_device)
 
         devices_index = self._registered_index
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
+        self._remove_reverse_index(old_device)
+        self._add_reverse_index(new_device)
+
+    def _add_reverse_index(self, device: DeviceEntry) -> None:
+        """Index a registered device by area and config entries."""
+        if device.area_id is not None:
+            self._area_index.setdefault(device.area_id, {})[device.id] = None
+        for config_entry_id in device.config_entries:
+            self._config_entry_index.setdefault(config_entry_id, {})[device.id] = None
+
+    def _remove_reverse_index(self, device: DeviceEntry) -> None:
+        """Remove a registered device from the area and config entry index."""
+        if device.area_id is not None:
+            _remove_from_reverse_index(self._area_index, device.area_id, device.id)
+        for config_entry_id in device.config_entries:
+            _remove_from_reverse_index(
+                self._config_entry_index, config_entry_id, device.id
+            )
 
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._area_index = {}
+        self._config_entry_index = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            self._add_reverse_index(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -535,62 +614,42 @@ class DeviceRegistry:
         self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
-        """Return data of device registry to store in a file."""
-        data = {}
+    def _data_to_save(self) -> dict[str, list[Any]]:
+        """Return data of device registry to store in a file.
 
-        data["devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "entry_type": entry.entry_type,
-                "id": entry.id,
-                "via_device_id": entry.via_device_id,
-                "area_id": entry.area_id,
-                "name_by_user": entry.name_by_user,
-                "disabled_by": entry.disabled_by,
-            }
-            for entry in self.devices.values()
-        ]
-        data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-            }
-            for entry in self.deleted_devices.values()
-        ]
-
-        return data
+        The entries are immutable and converted by the store encoder in the
+        executor, so only a shallow copy is made in the event loop.
+        """
+        return {
+            "devices": list(self.devices.values()),
+            "deleted_devices": list(self.deleted_devices.values()),
+        }
 
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for device_id in self.async_device_ids_for_config_entry(config_entry_id):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
             if config_entry_id not in config_entries:
                 continue
             if config_entries == {config_entry_id}:
                 # Add a time stamp when the deleted device became orphaned
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, orphaned_timestamp=now_time, config_entries=set()
+                self._set_deleted_device(
+                    attr.evolve(
+                        deleted_device,
+                        orphaned_timestamp=now_time,
+                        config_entries=set(),
+                    )
                 )
             else:
                 config_entries = config_entries - {config_entry_id}
                 # No need to reindex here since we currently
                 # do not have a lookup by config entry
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, config_entries=config_entries
+                self._set_deleted_device(
+                    attr.evolve(deleted_device, config_entries=config_entries)
                 )
             self.async_schedule_save()
 
@@ -615,9 +674,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in self.async_device_ids_for_area(area_id):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -645,7 +703,10 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return [
+        registry.devices[device_id]
+        for device_id in registry.async_device_ids_for_area(area_id)
+    ]
 
 
 @callback
@@ -654,9 +715,8 @@ def async_entries_for_config_entry(
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
     return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
+        registry.devices[device_id]
+        for device_id in registry.async_device_ids_for_config_entry(config_entry_id)
     ]
 
 
@@ -805,3 +865,14 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+
+
+def _remove_from_reverse_index(
+    index: dict[str, dict[str, None]], key: str, device_id: str
+) -> None:
+    """Remove a device id from a reverse index, dropping empty keys."""
+    if (device_ids := index.get(key)) is None:
+        return
+    device_ids.pop(device_id, None)
+    if not device_ids:
+        del index[key]
@@ -238,6 +238,13 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # Assemble the attributes that rarely change only once, see
+    # async_invalidate_static_attributes
+    _cache_static_attributes = False
+    _static_attributes: tuple[
+        RegistryEntry | None, dict[str, Any], dict[str, Any]
+    ] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_available: bool = True
@@ -477,6 +484,52 @@ class Entity(ABC):
         return str(state)
 
     @callback
+    def _build_static_attributes(
+        self,
+    ) -> tuple[RegistryEntry | None, dict[str, Any], dict[str, Any]]:
+        """Assemble the attributes that do not depend on the state.
+
+        Returns the registry entry they were built for, the capability
+        attributes and the attributes that override the state attributes.
+        """
+        capability_attr = self.capability_attributes
+        attr: dict[str, Any] = {}
+
+        unit_of_measurement = self.unit_of_measurement
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        entry = self.registry_entry
+        # pylint: disable=consider-using-ternary
+        name = (entry and entry.name) or self.name
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        icon = (entry and entry.icon) or self.icon
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        supported_features = self.supported_features
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        device_class = self.device_class
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        return entry, dict(capability_attr) if capability_attr else {}, attr
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Assemble the static attributes again on the next state write.
+
+        Entities that set _cache_static_attributes have to call this when
+        their capability attributes, unit of measurement, name, icon,
+        supported features or device class change. Registry updates are
+        picked up automatically.
+        """
+        self._static_attributes = None
+
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
         if self.registry_entry and self.registry_entry.disabled_by:
@@ -492,8 +545,14 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        static = self._static_attributes
+        if static is None or static[0] is not self.registry_entry:
+            static = self._build_static_attributes()
+            if self._cache_static_attributes:
+                self._static_attributes = static
+        _, capability_attr, static_attr = static
+
+        attr = dict(capability_attr)
 
         state = self._stringify_state()
         if self.available:
@@ -505,19 +564,7 @@ class Entity(ABC):
                 extra_state_attributes = self.device_state_attributes
             attr.update(extra_state_attributes or {})
 
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
+        attr.update(static_attr)
 
         entity_picture = self.entity_picture
         if entity_picture is not None:
@@ -527,14 +574,6 @@ class Entity(ABC):
         if assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
-
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
         end = timer()
 
         if end - start > 0.4 and not self._slow_reported:
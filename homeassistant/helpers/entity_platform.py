@@ -57,6 +57,7 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_DOMAIN_ENTITIES = "domain_entities"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = logging.getLogger(__name__)
@@ -95,6 +96,10 @@ class EntityPlatform:
         self.entity_namespace = entity_namespace
         self.config_entry: config_entries.ConfigEntry | None = None
         self.entities: dict[str, Entity] = {}
+        # Entities of all platforms of this domain, indexed by entity id
+        self.domain_entities: dict[str, Entity] = hass.data.setdefault(
+            DATA_DOMAIN_ENTITIES, {}
+        ).setdefault(domain, {})
         self._tasks: list[asyncio.Future] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
@@ -569,6 +574,7 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
+        self.domain_entities[entity_id] = entity
 
         if not restored:
             # Reserve the state in the state machine
@@ -581,6 +587,7 @@ class EntityPlatform:
         def remove_entity_cb() -> None:
             """Remove entity from entities list."""
             self.entities.pop(entity_id)
+            self.domain_entities.pop(entity_id, None)
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Iterable, Mapping
+import json
 import logging
 from typing import TYPE_CHECKING, Any, Callable, cast
 
@@ -146,6 +147,32 @@ class RegistryEntry:
         hass.states.async_set(self.entity_id, STATE_UNAVAILABLE, attrs)
 
 
+class _RegistryEncoder(json.JSONEncoder):
+    """Encoder that converts registry entries to their stored form."""
+
+    def default(self, o: Any) -> Any:
+        """Convert registry entries."""
+        if isinstance(o, RegistryEntry):
+            return {
+                "entity_id": o.entity_id,
+                "config_entry_id": o.config_entry_id,
+                "device_id": o.device_id,
+                "area_id": o.area_id,
+                "unique_id": o.unique_id,
+                "platform": o.platform,
+                "name": o.name,
+                "icon": o.icon,
+                "disabled_by": o.disabled_by,
+                "capabilities": o.capabilities,
+                "supported_features": o.supported_features,
+                "device_class": o.device_class,
+                "unit_of_measurement": o.unit_of_measurement,
+                "original_name": o.original_name,
+                "original_icon": o.original_icon,
+            }
+        return super().default(o)
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
@@ -154,7 +181,13 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        # Reverse indexes from area, device and config entry to entity ids
+        self._area_index: dict[str, dict[str, None]] = {}
+        self._device_index: dict[str, dict[str, None]] = {}
+        self._config_entry_index: dict[str, dict[str, None]] = {}
+        self._store = hass.helpers.storage.JournaledStore(
+            STORAGE_VERSION, STORAGE_KEY, "entity_id", encoder=_RegistryEncoder
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -198,6 +231,21 @@ class EntityRegistry:
         """Check if an entity_id is currently registered."""
         return self._index.get((domain, platform, unique_id))
 
+    @callback
+    def async_entity_ids_for_area(self, area_id: str) -> list[str]:
+        """Return entity ids of the entries assigned to an area."""
+        return list(self._area_index.get(area_id, ()))
+
+    @callback
+    def async_entity_ids_for_device(self, device_id: str) -> list[str]:
+        """Return entity ids of the entries belonging to a device."""
+        return list(self._device_index.get(device_id, ()))
+
+    @callback
+    def async_entity_ids_for_config_entry(self, config_entry_id: str) -> list[str]:
+        """Return entity ids of the entries belonging to a config entry."""
+        return list(self._config_entry_index.get(config_entry_id, ()))
+
     @callback
     def async_generate_entity_id(
         self,
@@ -452,6 +500,7 @@ class EntityRegistry:
                 raise ValueError("New entity ID should be same domain")
 
             self.entities.pop(entity_id)
+            self._store.async_record_change("entities", entity_id, None)
             entity_id = new_values["entity_id"] = new_entity_id
             old_values["entity_id"] = old.entity_id
 
@@ -533,69 +582,75 @@ class EntityRegistry:
 
     @callback
     def _data_to_save(self) -> dict[str, Any]:
-        """Return data of entity registry to store in a file."""
-        data = {}
-
-        data["entities"] = [
-            {
-                "entity_id": entry.entity_id,
-                "config_entry_id": entry.config_entry_id,
-                "device_id": entry.device_id,
-                "area_id": entry.area_id,
-                "unique_id": entry.unique_id,
-                "platform": entry.platform,
-                "name": entry.name,
-                "icon": entry.icon,
-                "disabled_by": entry.disabled_by,
-                "capabilities": entry.capabilities,
-                "supported_features": entry.supported_features,
-                "device_class": entry.device_class,
-                "unit_of_measurement": entry.unit_of_measurement,
-                "original_name": entry.original_name,
-                "original_icon": entry.original_icon,
-            }
-            for entry in self.entities.values()
-        ]
+        """Return data of entity registry to store in a file.
 
-        return data
+        The entries are immutable and converted by the store encoder in the
+        executor, so only a shallow copy is made in the event loop.
+        """
+        return {"entities": list(self.entities.values())}
 
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in self.async_entity_ids_for_config_entry(config_entry):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in self.async_entity_ids_for_area(area_id):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
         self._add_index(entry)
+        self._store.async_record_change("entities", entry.entity_id, entry)
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        entity_id = entry.entity_id
+        if entry.area_id is not None:
+            self._area_index.setdefault(entry.area_id, {})[entity_id] = None
+        if entry.device_id is not None:
+            self._device_index.setdefault(entry.device_id, {})[entity_id] = None
+        if entry.config_entry_id is not None:
+            self._config_entry_index.setdefault(entry.config_entry_id, {})[
+                entity_id
+            ] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
         del self.entities[entry.entity_id]
+        self._store.async_record_change("entities", entry.entity_id, None)
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        _remove_from_reverse_index(self._area_index, entry.area_id, entry.entity_id)
+        _remove_from_reverse_index(self._device_index, entry.device_id, entry.entity_id)
+        _remove_from_reverse_index(
+            self._config_entry_index, entry.config_entry_id, entry.entity_id
+        )
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._area_index = {}
+        self._device_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
 
+def _remove_from_reverse_index(
+    index: dict[str, dict[str, None]], key: str | None, entity_id: str
+) -> None:
+    """Remove an entity id from a reverse index, dropping empty keys."""
+    if key is None or (entity_ids := index.get(key)) is None:
+        return
+    entity_ids.pop(entity_id, None)
+    if not entity_ids:
+        del index[key]
+
+
 @callback
 def async_get(hass: HomeAssistant) -> EntityRegistry:
     """Get entity registry."""
@@ -623,12 +678,13 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+    entries = [
+        registry.entities[entity_id]
+        for entity_id in registry.async_entity_ids_for_device(device_id)
     ]
+    if include_disabled_entities:
+        return entries
+    return [entry for entry in entries if not entry.disabled_by]
 
 
 @callback
@@ -636,7 +692,10 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return [
+        registry.entities[entity_id]
+        for entity_id in registry.async_entity_ids_for_area(area_id)
+    ]
 
 
 @callback
@@ -645,9 +704,8 @@ def async_entries_for_config_entry(
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
     return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
+        registry.entities[entity_id]
+        for entity_id in registry.async_entity_ids_for_config_entry(config_entry_id)
     ]
 
 
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import fnmatch
+from functools import lru_cache
 import re
-from typing import Callable
+from typing import Callable, NamedTuple
 
 import voluptuous as vol
 
@@ -20,6 +21,20 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Decisions remembered per filter, entity ids are a finite set in practice
+FILTER_CACHE_SIZE = 8192
+
+
+class EntityFilterSpec(NamedTuple):
+    """Include and exclude sets an entity filter is generated from."""
+
+    include_domains: frozenset[str]
+    include_entities: frozenset[str]
+    exclude_domains: frozenset[str]
+    exclude_entities: frozenset[str]
+    include_entity_globs: frozenset[str]
+    exclude_entity_globs: frozenset[str]
+
 
 def convert_filter(config: dict[str, list[str]]) -> Callable[[str], bool]:
     """Convert the filter schema into a filter."""
@@ -104,18 +119,13 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _glob_to_re(glob: str) -> re.Pattern[str]:
-    """Translate and compile glob string into pattern."""
-    return re.compile(fnmatch.translate(glob))
-
-
-def _test_against_patterns(patterns: list[re.Pattern[str]], entity_id: str) -> bool:
-    """Test entity against list of patterns, true if any match."""
-    for pattern in patterns:
-        if pattern.match(entity_id):
-            return True
-
-    return False
+def _convert_globs_to_pattern(globs: list[str]) -> re.Pattern[str] | None:
+    """Translate and compile glob strings into a single pattern."""
+    if not globs:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(glob)})" for glob in sorted(set(globs)))
+    )
 
 
 # It's safe since we don't modify it. And None causes typing warnings
@@ -128,16 +138,42 @@ def generate_filter(
     include_entity_globs: list[str] = [],
     exclude_entity_globs: list[str] = [],
 ) -> Callable[[str], bool]:
-    """Return a function that will filter entities based on the args."""
-    include_d = set(include_domains)
-    include_e = set(include_entities)
-    exclude_d = set(exclude_domains)
-    exclude_e = set(exclude_entities)
-    include_eg_set = set(include_entity_globs)
-    exclude_eg_set = set(exclude_entity_globs)
-    include_eg = list(map(_glob_to_re, include_eg_set))
-    exclude_eg = list(map(_glob_to_re, exclude_eg_set))
-
+    """Return a function that will filter entities based on the args.
+
+    Decisions are memoized per entity id, bounded by FILTER_CACHE_SIZE. The
+    args are available as the spec attribute of the returned function.
+    """
+    spec = EntityFilterSpec(
+        frozenset(include_domains),
+        frozenset(include_entities),
+        frozenset(exclude_domains),
+        frozenset(exclude_entities),
+        frozenset(include_entity_globs),
+        frozenset(exclude_entity_globs),
+    )
+    entity_filter = _generate_filter(
+        set(include_domains),
+        set(include_entities),
+        set(exclude_domains),
+        set(exclude_entities),
+        _convert_globs_to_pattern(include_entity_globs),
+        _convert_globs_to_pattern(exclude_entity_globs),
+    )
+    if any(spec):
+        entity_filter = lru_cache(maxsize=FILTER_CACHE_SIZE)(entity_filter)
+    setattr(entity_filter, "spec", spec)
+    return entity_filter
+
+
+def _generate_filter(
+    include_d: set[str],
+    include_e: set[str],
+    exclude_d: set[str],
+    exclude_e: set[str],
+    include_eg: re.Pattern[str] | None,
+    exclude_eg: re.Pattern[str] | None,
+) -> Callable[[str], bool]:
+    """Return the uncached filter function for the preprocessed args."""
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
     have_include = bool(include_e or include_d or include_eg)
 
@@ -146,7 +182,7 @@ def generate_filter(
         return (
             entity_id in include_e
             or domain in include_d
-            or bool(include_eg and _test_against_patterns(include_eg, entity_id))
+            or bool(include_eg and include_eg.match(entity_id))
         )
 
     def entity_excluded(domain: str, entity_id: str) -> bool:
@@ -154,7 +190,7 @@ def generate_filter(
         return (
             entity_id in exclude_e
             or domain in exclude_d
-            or bool(exclude_eg and _test_against_patterns(exclude_eg, entity_id))
+            or bool(exclude_eg and exclude_eg.match(entity_id))
         )
 
     # Case 1 - no includes or excludes - pass all entities
@@ -196,11 +232,9 @@ def generate_filter(
             if domain in include_d:
                 return not (
                     entity_id in exclude_e
-                    or bool(
-                        exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-                    )
+                    or bool(exclude_eg and exclude_eg.match(entity_id))
                 )
-            if _test_against_patterns(include_eg, entity_id):
+            if include_eg and include_eg.match(entity_id):
                 return not entity_excluded(domain, entity_id)
             return entity_id in include_e
 
@@ -218,9 +252,7 @@ def generate_filter(
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or (
-                exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-            ):
+            if domain in exclude_d or (exclude_eg and exclude_eg.match(entity_id)):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
@@ -7,6 +7,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+from heapq import heapify, heappop, heappush
 import logging
 import time
 from typing import Any, Callable, List, cast
@@ -16,9 +17,11 @@ import attr
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NOW,
+    ATTR_SECONDS,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
     EVENT_TIME_CHANGED,
+    EVENT_TIMER_OUT_OF_SYNC,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -30,7 +33,6 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
@@ -42,14 +44,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
-TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
-TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
-
-TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
-TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
+TRACK_TIME_PATTERN_SCHEDULER = "track_time_pattern_scheduler"
 
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
@@ -242,62 +237,15 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    for each one, the event bus keeps a dict of entity
+    ids that care about the state change events so it
+    can do a fast dict lookup to route events.
     """
     entity_ids = _async_string_to_lower_list(entity_ids)
     if not entity_ids:
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = HassJob(action)
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
-
-    return remove_listener
+    return hass.bus.async_listen_entity(EVENT_STATE_CHANGED, entity_ids, action)
 
 
 @callback
@@ -393,23 +341,15 @@ def async_track_entity_registry_updated_event(
 
 
 @callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant, event: Event, callbacks: dict[str, list]
-) -> None:
-    domain = split_entity_id(event.data["entity_id"])[0]
-
-    if domain not in callbacks and MATCH_ALL not in callbacks:
-        return
+def _async_state_added_filter(event: Event) -> bool:
+    """Filter state changes for entities being added."""
+    return event.data.get("old_state") is None
 
-    listeners = callbacks.get(domain, []) + callbacks.get(MATCH_ALL, [])
 
-    for job in listeners:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
+@callback
+def _async_state_removed_filter(event: Event) -> bool:
+    """Filter state changes for entities being removed."""
+    return event.data.get("new_state") is None
 
 
 @bind_hass
@@ -423,46 +363,12 @@ def async_track_state_added_domain(
     if not domains:
         return _remove_empty_listener
 
-    domain_callbacks = hass.data.setdefault(TRACK_STATE_ADDED_DOMAIN_CALLBACKS, {})
-
-    if TRACK_STATE_ADDED_DOMAIN_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("old_state") is None
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            if event.data.get("old_state") is not None:
-                return
-
-            _async_dispatch_domain_event(hass, event, domain_callbacks)
-
-        hass.data[TRACK_STATE_ADDED_DOMAIN_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = HassJob(action)
-
-    for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_ADDED_DOMAIN_CALLBACKS,
-            TRACK_STATE_ADDED_DOMAIN_LISTENER,
-            domains,
-            job,
-        )
-
-    return remove_listener
+    return hass.bus.async_listen_domain(
+        EVENT_STATE_CHANGED,
+        domains,
+        action,
+        event_filter=_async_state_added_filter,
+    )
 
 
 @bind_hass
@@ -476,46 +382,12 @@ def async_track_state_removed_domain(
     if not domains:
         return _remove_empty_listener
 
-    domain_callbacks = hass.data.setdefault(TRACK_STATE_REMOVED_DOMAIN_CALLBACKS, {})
-
-    if TRACK_STATE_REMOVED_DOMAIN_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("new_state") is None
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            if event.data.get("new_state") is not None:
-                return
-
-            _async_dispatch_domain_event(hass, event, domain_callbacks)
-
-        hass.data[TRACK_STATE_REMOVED_DOMAIN_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = HassJob(action)
-
-    for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_REMOVED_DOMAIN_CALLBACKS,
-            TRACK_STATE_REMOVED_DOMAIN_LISTENER,
-            domains,
-            job,
-        )
-
-    return remove_listener
+    return hass.bus.async_listen_domain(
+        EVENT_STATE_CHANGED,
+        domains,
+        action,
+        event_filter=_async_state_removed_filter,
+    )
 
 
 @callback
@@ -1358,6 +1230,134 @@ track_sunset = threaded_listener_factory(async_track_sunset)
 time_tracker_utcnow = dt_util.utcnow
 
 
+@dataclass
+class _TimePatternTracker:
+    """A time pattern listener scheduled by the _TimePatternScheduler."""
+
+    job: HassJob
+    calculate_next: Callable[[datetime], datetime]
+    local: bool
+
+
+class _TimePatternScheduler:
+    """Schedule all time pattern listeners with a single timer.
+
+    The next time each listener is due is kept in a heap and only the
+    earliest one is armed in the event loop, so listeners that are due at
+    the same time share a single wakeup. EVENT_TIMER_OUT_OF_SYNC is fired
+    when the loop wakes up more than a second after the armed time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: list[tuple[datetime, int]] = []
+        self._trackers: dict[int, _TimePatternTracker] = {}
+        self._next_tracker_id = 0
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_due: datetime | None = None
+        # The loop time the timer is armed for
+        self._timer_target = 0.0
+        self._running = False
+
+    @callback
+    def async_add(self, tracker: _TimePatternTracker, due: datetime) -> CALLBACK_TYPE:
+        """Schedule a time pattern listener and return a function to remove it."""
+        tracker_id = self._next_tracker_id
+        self._next_tracker_id += 1
+        self._trackers[tracker_id] = tracker
+        heappush(self._heap, (due, tracker_id))
+        self._async_arm_timer()
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the time pattern listener."""
+            if self._trackers.pop(tracker_id, None) is None:
+                return
+            heap = self._heap
+            if not self._trackers:
+                heap.clear()
+                self._async_cancel_timer()
+            elif len(heap) > 2 * len(self._trackers):
+                # Drop the heap entries of removed listeners once they are
+                # the majority, instead of keeping them until they are due
+                heap[:] = [entry for entry in heap if entry[1] in self._trackers]
+                heapify(heap)
+                self._async_cancel_timer()
+                self._async_arm_timer()
+            elif heap[0][1] == tracker_id:
+                # Don't wake up for the removed listener
+                self._async_cancel_timer()
+                self._async_arm_timer()
+
+        return remove_listener
+
+    @callback
+    def _async_arm_timer(self) -> None:
+        """Arm the timer for the earliest due listener."""
+        if self._running:
+            return
+        heap = self._heap
+        # Drop the entries of removed listeners
+        while heap and heap[0][1] not in self._trackers:
+            heappop(heap)
+        if not heap:
+            return
+        due = heap[0][0]
+        if self._timer_due is not None and self._timer_due <= due:
+            return
+        self._async_cancel_timer()
+        self._timer_due = due
+        self._timer_target = self.hass.loop.time() + due.timestamp() - time.time()
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self._async_run_due, due
+        )
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel the timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+            self._timer_due = None
+
+    @callback
+    def _async_run_due(self, _: datetime) -> None:
+        """Run the listeners that are due and schedule their next run."""
+        self._unsub_timer = None
+        self._timer_due = None
+
+        # If we are more than a second late, a time pattern was missed
+        late = self.hass.loop.time() - self._timer_target
+        if late > 1:
+            self.hass.bus.async_fire(EVENT_TIMER_OUT_OF_SYNC, {ATTR_SECONDS: late})
+
+        now = time_tracker_utcnow()
+        next_run = now + timedelta(seconds=1)
+        heap = self._heap
+        due_tracker_ids = []
+        while heap and heap[0][0] <= now:
+            due_tracker_ids.append(heappop(heap)[1])
+
+        self._running = True
+        try:
+            for tracker_id in due_tracker_ids:
+                tracker = self._trackers.get(tracker_id)
+                if tracker is None:
+                    continue
+                heappush(heap, (tracker.calculate_next(next_run), tracker_id))
+                try:
+                    self.hass.async_run_hass_job(
+                        tracker.job, dt_util.as_local(now) if tracker.local else now
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error while processing time pattern change")
+        finally:
+            self._running = False
+
+        self._async_arm_timer()
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1392,34 +1392,19 @@ def async_track_utc_time_change(
             localized_now, matching_seconds, matching_minutes, matching_hours
         )
 
-    time_listener: CALLBACK_TYPE | None = None
-
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener,
-            calculate_next(now + timedelta(seconds=1)),
+    scheduler: _TimePatternScheduler | None = hass.data.get(
+        TRACK_TIME_PATTERN_SCHEDULER
+    )
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_PATTERN_SCHEDULER] = _TimePatternScheduler(
+            hass
         )
 
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener, calculate_next(dt_util.utcnow())
+    return scheduler.async_add(
+        _TimePatternTracker(job, calculate_next, local),
+        calculate_next(dt_util.utcnow()),
     )
 
-    @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
-
-    return unsub_pattern_time_change_listener
-
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
 
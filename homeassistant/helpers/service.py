@@ -355,26 +355,27 @@ async def async_extract_referenced_entity_ids(
 
     # Find devices for this area
     selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    for area_id in selector.area_ids:
+        selected.referenced_devices.update(dev_reg.async_device_ids_for_area(area_id))
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+    # Entities whose area matches the target area
+    for area_id in selector.area_ids:
+        selected.indirectly_referenced.update(
+            ent_reg.async_entity_ids_for_area(area_id)
+        )
+
+    for device_id in selected.referenced_devices:
+        for entity_id in ent_reg.async_entity_ids_for_device(device_id):
+            if (
+                # when device matches a referenced devices with no explicitly set area
+                not ent_reg.entities[entity_id].area_id
+                # when device matches target device
+                or device_id in selector.device_ids
+            ):
+                selected.indirectly_referenced.add(entity_id)
 
     return selected
 
@@ -519,14 +520,15 @@ def async_set_service_schema(
 @bind_hass
 async def entity_service_call(
     hass: HomeAssistant,
-    platforms: Iterable[EntityPlatform],
+    platforms: Iterable[EntityPlatform] | dict[str, Entity],
     func: str | Callable[..., Any],
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
 ) -> None:
     """Handle an entity service call.
 
-    Calls all platforms simultaneously.
+    Entities are selected from the given platforms, or looked up by entity id
+    when a dict of entities is passed. Calls all entities simultaneously.
     """
     if call.context.user_id:
         user = await hass.auth.async_get_user(call.context.user_id)
@@ -559,12 +561,21 @@ async def entity_service_call(
     else:
         data = call
 
-    # Check the permissions
-
     # A list with entities to call the service on.
     entity_candidates: list[Entity] = []
 
-    if entity_perms is None:
+    if isinstance(platforms, dict):
+        # Entities indexed by entity id, only look up the referenced ones
+        if target_all_entities:
+            entity_candidates = list(platforms.values())
+        else:
+            assert all_referenced is not None
+            entity_candidates = [
+                platforms[entity_id]
+                for entity_id in all_referenced
+                if entity_id in platforms
+            ]
+    else:
         for platform in platforms:
             if target_all_entities:
                 entity_candidates.extend(platform.entities.values())
@@ -578,28 +589,19 @@ async def entity_service_call(
                     ]
                 )
 
-    elif target_all_entities:
-        # If we target all entities, we will select all entities the user
-        # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
-
-    else:
-        assert all_referenced is not None
-
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
+    # Check the permissions
+    if entity_perms is not None:
+        if target_all_entities:
+            # If we target all entities, we will select all entities the user
+            # is allowed to control.
+            entity_candidates = [
+                entity
+                for entity in entity_candidates
+                if entity_perms(entity.entity_id, POLICY_CONTROL)
+            ]
 
+        else:
+            for entity in entity_candidates:
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
                         context=call.context,
@@ -607,10 +609,6 @@ async def entity_service_call(
                         permission=POLICY_CONTROL,
                     )
 
-                platform_entities.append(entity)
-
-            entity_candidates.extend(platform_entities)
-
     if not target_all_entities:
         assert referenced is not None
 
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from contextlib import suppress
+import json
 from json import JSONEncoder
 import logging
 import os
@@ -18,6 +20,8 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+# Number of journaled changes after which a journal is folded into its store
+JOURNAL_COMPACT_SIZE = 1000
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -124,9 +128,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data, self.path)
 
             if data == {}:
                 return None
@@ -227,6 +229,10 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self, path: str) -> dict | list:  # pylint: disable=no-self-use
+        """Load the data."""
+        return json_util.load_json(path)
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
@@ -246,3 +252,209 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+@bind_hass
+class JournaledStore(Store):
+    """Store that appends changed items to a journal between full writes.
+
+    The data is a dict of lists of items, each identified by its item_key
+    value. Changes recorded with async_record_change are appended as JSON
+    lines to a journal next to the store file, so a save only writes the
+    changed items. The journal is folded into the store file once it holds
+    JOURNAL_COMPACT_SIZE changes, on the first save after loading an old
+    version and on every async_save.
+
+    Items are converted to JSON in the executor, so they have to be
+    immutable and supported by the encoder.
+
+    Every full write starts a new journal generation, which is stored in
+    the store file and in every journal line. Lines of older generations
+    are ignored, so a journal left behind by a crash between writing the
+    store file and removing the journal is never applied twice.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        version: int,
+        key: str,
+        item_key: str,
+        private: bool = False,
+        *,
+        encoder: type[JSONEncoder] | None = None,
+    ) -> None:
+        """Initialize journaled storage class."""
+        super().__init__(hass, version, key, private, encoder=encoder)
+        self._item_key = item_key
+        self._changes: dict[tuple[str, str], Any] = {}
+        self._journal_size = 0
+        self._generation = 0
+        # A full write is needed until the store file is known to be current
+        self._compact = True
+
+    @property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}.journal"
+
+    @callback
+    def async_record_change(self, collection: str, item_id: str, item: Any) -> None:
+        """Record a changed item, or a removed one if item is None.
+
+        The change is written by the next save.
+        """
+        self._changes[(collection, item_id)] = item
+
+    async def _async_handle_write_data(self, *_args):
+        """Handle writing the journal or the full data."""
+        async with self._write_lock:
+            self._async_cleanup_delay_listener()
+            self._async_cleanup_final_write_listener()
+
+            if self._data is None:
+                # Another write already consumed the data
+                return
+
+            data = self._data
+            changes = self._changes
+            self._data = None
+            self._changes = {}
+
+            if (
+                "data_func" in data
+                and changes
+                and not self._compact
+                and self._journal_size + len(changes) <= JOURNAL_COMPACT_SIZE
+            ):
+                try:
+                    await self.hass.async_add_executor_job(
+                        self._write_journal, self.journal_path, list(changes.items())
+                    )
+                except (json_util.SerializationError, json_util.WriteError) as err:
+                    _LOGGER.error("Error writing journal for %s: %s", self.key, err)
+                else:
+                    self._journal_size += len(changes)
+                    return
+
+            if "data_func" in data:
+                data["data"] = data.pop("data_func")()
+
+            try:
+                await self.hass.async_add_executor_job(
+                    self._write_compacted, self.path, data
+                )
+            except (json_util.SerializationError, json_util.WriteError) as err:
+                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+            else:
+                self._compact = False
+                self._journal_size = 0
+
+    def _load_data(self, path: str) -> dict | list:
+        """Load the data and apply the journal."""
+        data = super()._load_data(path)
+        if not isinstance(data, dict) or not data:
+            return data
+
+        generation = data.get("journal_generation", 0)
+        changes = []
+        invalid = stale = False
+        try:
+            with open(self.journal_path, encoding="utf-8") as fil:
+                for line in fil:
+                    try:
+                        change = json.loads(line)
+                    except ValueError:
+                        # Most likely a write interrupted by a crash
+                        _LOGGER.warning(
+                            "Ignoring invalid journal line for %s", self.key
+                        )
+                        invalid = True
+                        continue
+                    if change.get("generation", 0) != generation:
+                        # Already part of the store file
+                        stale = True
+                        continue
+                    changes.append(change)
+        except FileNotFoundError:
+            pass
+
+        if stale:
+            _LOGGER.debug("Ignoring stale journal lines for %s", self.key)
+
+        self._apply_changes(data["data"], changes)
+        self._generation = generation
+        self._journal_size = len(changes)
+        self._compact = invalid or stale or data["version"] != self.version
+        return data
+
+    def _apply_changes(self, data: dict, changes: Iterable[dict]) -> None:
+        """Apply journaled changes to the data."""
+        collections: dict[str, dict[str, Any]] = {}
+        for change in changes:
+            name = change["collection"]
+            items = collections.get(name)
+            if items is None:
+                items = collections[name] = {
+                    item[self._item_key]: item for item in data.get(name, [])
+                }
+            if change["item"] is None:
+                items.pop(change["id"], None)
+            else:
+                items[change["id"]] = change["item"]
+
+        for name, items in collections.items():
+            data[name] = list(items.values())
+
+    def _encode_changes(self, changes: list[tuple[tuple[str, str], Any]]) -> str:
+        """Encode changes as journal lines."""
+        try:
+            return "".join(
+                json.dumps(
+                    {
+                        "generation": self._generation,
+                        "collection": collection,
+                        "id": item_id,
+                        "item": item,
+                    },
+                    cls=self._encoder,
+                )
+                + "\n"
+                for (collection, item_id), item in changes
+            )
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize journal for {self.key}: {err}"
+            ) from err
+
+    def _write_journal(
+        self, path: str, changes: list[tuple[tuple[str, str], Any]]
+    ) -> None:
+        """Append changes to the journal."""
+        lines = self._encode_changes(changes)
+        _LOGGER.debug("Writing %s changes for %s to %s", len(changes), self.key, path)
+        try:
+            journal_fd = os.open(
+                path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(journal_fd, "a", encoding="utf-8") as fdesc:
+                fdesc.write(lines)
+        except OSError as err:
+            raise json_util.WriteError(err) from err
+
+    def _write_compacted(self, path: str, data: dict) -> None:
+        """Write the full data and drop the journal it replaces."""
+        generation = self._generation + 1
+        self._write_data(path, {**data, "journal_generation": generation})
+        self._generation = generation
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+
+    async def async_remove(self) -> None:
+        """Remove all data and the journal."""
+        await super().async_remove()
+        self._changes = {}
+        with suppress(FileNotFoundError):
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
@@ -10,19 +10,26 @@ from contextlib import suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import partial, wraps
+import hashlib
 import json
 import logging
+import marshal
 import math
 from operator import attrgetter
+import os
 import random
 import re
 import sys
+import tempfile
+import time
+from types import CodeType
 from typing import Any, Callable, cast
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
 import jinja2
 from jinja2 import contextfunction, pass_context
+from jinja2.bccache import bc_magic
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
 import voluptuous as vol
@@ -32,10 +39,14 @@ from homeassistant.const import (
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
     LENGTH_METERS,
     STATE_UNKNOWN,
+    __version__,
 )
 from homeassistant.core import (
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -61,6 +72,8 @@ _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
+_RENDER_INFO_CACHE = "template.render_info_cache"
+_BYTECODE_CACHE = "template.bytecode_cache"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
@@ -73,6 +86,13 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# Maximum number of template render results kept for reuse
+RENDER_INFO_CACHE_SIZE = 1024
+# Maximum number of compiled templates kept alive by each environment
+TEMPLATE_CACHE_SIZE = 512
+# File in the storage directory holding compiled templates across restarts
+BYTECODE_CACHE_FILE = "core.template_bytecode"
+
 _COLLECTABLE_STATE_ATTRIBUTES = {
     "state",
     "attributes",
@@ -225,6 +245,8 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Set by functions whose result does not only depend on the states read
+        self.is_volatile = False
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -250,6 +272,29 @@ class RenderInfo:
             raise self.exception
         return cast(str, self._result)
 
+    def _cacheable(self) -> bool:
+        """Return if the result only depends on the entities that were read."""
+        return (
+            self.exception is None
+            and not self.all_states
+            and not self.all_states_lifecycle
+            and not self.domains
+            and not self.domains_lifecycle
+            and not self.has_time
+            and not self.is_volatile
+            and isinstance(self._result, (str, int, float, bool, type(None)))
+        )
+
+    def _copy_for_template(self, template: Template) -> RenderInfo:
+        """Return a frozen copy of a cached render for another template."""
+        # pylint: disable=protected-access
+        render_info = RenderInfo(template)
+        render_info._result = self._result
+        render_info.entities = self.entities
+        render_info.rate_limit = self.rate_limit
+        render_info._freeze()
+        return render_info
+
     def _freeze_static(self) -> None:
         self.is_static = True
         self._freeze_sets()
@@ -289,6 +334,177 @@ class RenderInfo:
             self.filter = _false
 
 
+class _RenderInfoCache:
+    """Least recently used cache of template renders.
+
+    A render is reused as long as every state it read is still the
+    current state of its entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._renders: collections.OrderedDict[
+            str, tuple[tuple[str, ...], tuple[State | None, ...], RenderInfo]
+        ] = collections.OrderedDict()
+
+    @callback
+    def async_get(self, template: str) -> RenderInfo | None:
+        """Return the cached render of a template if its states did not change."""
+        cached = self._renders.get(template)
+        if cached is None:
+            return None
+        entity_ids, states, render_info = cached
+        get_state = self._hass.states.get
+        for entity_id, state in zip(entity_ids, states):
+            if get_state(entity_id) is not state:
+                return None
+        self._renders.move_to_end(template)
+        return render_info
+
+    @callback
+    def async_set(self, template: str, render_info: RenderInfo) -> None:
+        """Store the render of a template."""
+        # pylint: disable=protected-access
+        if not render_info._cacheable():
+            self._renders.pop(template, None)
+            return
+        entity_ids = tuple(render_info.entities)
+        self._renders[template] = (
+            entity_ids,
+            tuple(map(self._hass.states.get, entity_ids)),
+            render_info,
+        )
+        self._renders.move_to_end(template)
+        if len(self._renders) > RENDER_INFO_CACHE_SIZE:
+            self._renders.popitem(last=False)
+
+
+@callback
+def _render_info_cache(hass: HomeAssistant) -> _RenderInfoCache:
+    """Return the render cache of a Home Assistant instance."""
+    cache: _RenderInfoCache | None = hass.data.get(_RENDER_INFO_CACHE)
+    if cache is None:
+        cache = hass.data[_RENDER_INFO_CACHE] = _RenderInfoCache(hass)
+    return cache
+
+
+class _BytecodeCache:
+    """Compiled template code persisted across restarts.
+
+    The file starts with the Jinja bytecode magic, which covers the Jinja and
+    Python versions, followed by the Home Assistant version. A file written
+    by any other version is ignored. Only code used since the start is
+    written back, so templates that were removed from the config age out.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self._path = path
+        self._header = bc_magic + __version__.encode() + b"\n"
+        self._code: dict[str, CodeType] = {}
+        self._used: set[str] = set()
+        self._dirty = False
+
+    @staticmethod
+    def key(kind: str, source: str) -> str:
+        """Return the cache key of a template source."""
+        return hashlib.sha1(f"{kind}\n{source}".encode()).hexdigest()
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the cached code of a template."""
+        code = self._code.get(key)
+        if code is not None:
+            self._used.add(key)
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the code of a template."""
+        self._code[key] = code
+        self._used.add(key)
+        self._dirty = True
+
+    def load(self) -> None:
+        """Load the cache file."""
+        try:
+            with open(self._path, "rb") as fil:
+                data = fil.read()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.warning("Unable to read template cache %s: %s", self._path, err)
+            return
+
+        if not data.startswith(self._header):
+            _LOGGER.debug("Ignoring template cache from another version")
+            return
+
+        try:
+            code = marshal.loads(data[len(self._header) :])
+        except (EOFError, ValueError, TypeError) as err:
+            _LOGGER.warning("Ignoring corrupt template cache %s: %s", self._path, err)
+            return
+
+        if isinstance(code, dict):
+            self._code = code
+
+    def save(self) -> None:
+        """Write the used code to the cache file if it changed."""
+        used = list(self._used)
+        if not self._dirty and len(used) == len(self._code):
+            return
+        self._dirty = False
+        data = self._header + marshal.dumps({key: self._code[key] for key in used})
+
+        tmp_filename = ""
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(self._path), delete=False
+            ) as fdesc:
+                fdesc.write(data)
+                tmp_filename = fdesc.name
+            os.replace(tmp_filename, self._path)
+        except OSError as err:
+            _LOGGER.warning("Unable to write template cache %s: %s", self._path, err)
+        finally:
+            if tmp_filename and os.path.exists(tmp_filename):
+                with suppress(OSError):
+                    os.remove(tmp_filename)
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load compiled templates of the previous run and save them on stop."""
+    # Circular dep
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import STORAGE_DIR
+
+    cache = _BytecodeCache(hass.config.path(STORAGE_DIR, BYTECODE_CACHE_FILE))
+    await hass.async_add_executor_job(cache.load)
+    hass.data[_BYTECODE_CACHE] = cache
+
+    async def async_save_cache(_: Event) -> None:
+        """Save the cache once started and again on stop."""
+        await hass.async_add_executor_job(cache.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, async_save_cache)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, async_save_cache)
+
+
+@callback
+def async_template_cache_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return compiled template cache statistics per template environment."""
+    return {
+        name: env.cache_stats()
+        for name, env in (
+            ("default", hass.data.get(_ENVIRONMENT)),
+            ("limited", hass.data.get(_ENVIRONMENT_LIMITED)),
+            ("strict", hass.data.get(_ENVIRONMENT_STRICT)),
+        )
+        if env is not None
+    }
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -504,6 +720,16 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        # Renders without variables only depend on the states they read, so
+        # the result is shared by identical templates until one of those
+        # states changes
+        cache: _RenderInfoCache | None = None
+        if not variables and not kwargs and not strict:
+            cache = _render_info_cache(self.hass)
+            cached_render_info = cache.async_get(self.template)
+            if cached_render_info is not None:
+                return cached_render_info._copy_for_template(self)
+
         self.hass.data[_RENDER_INFO] = render_info
         try:
             render_info._result = self.async_render(variables, strict=strict, **kwargs)
@@ -513,6 +739,10 @@ class Template:
             del self.hass.data[_RENDER_INFO]
 
         render_info._freeze()
+
+        if cache is not None:
+            cache.async_set(self.template, render_info)
+
         return render_info
 
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
@@ -1448,7 +1678,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
+        self._kind = "limited" if limited else "strict" if strict else "default"
         self.template_cache = weakref.WeakValueDictionary()
+        self.template_lru: collections.OrderedDict[str, Any] = collections.OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.compile_time = 0.0
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1523,13 +1758,31 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
             return contextfunction(wrapper)
 
-        self.globals["device_entities"] = hassfunction(device_entities)
+        # The result of these functions does not only depend on the states
+        # they read, so renders that call them are not cached.
+        def volatile(func):
+            """Wrap function that marks the render as volatile."""
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                render_info = hass.data.get(_RENDER_INFO)
+                if render_info is not None:
+                    render_info.is_volatile = True
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        self.filters["random"] = volatile(self.filters["random"])
+        self.globals["lipsum"] = volatile(self.globals["lipsum"])
+        self.globals["relative_time"] = volatile(self.globals["relative_time"])
+
+        self.globals["device_entities"] = volatile(hassfunction(device_entities))
         self.filters["device_entities"] = pass_context(self.globals["device_entities"])
 
-        self.globals["device_attr"] = hassfunction(device_attr)
-        self.globals["is_device_attr"] = hassfunction(is_device_attr)
+        self.globals["device_attr"] = volatile(hassfunction(device_attr))
+        self.globals["is_device_attr"] = volatile(hassfunction(is_device_attr))
 
-        self.globals["device_id"] = hassfunction(device_id)
+        self.globals["device_id"] = volatile(hassfunction(device_id))
         self.filters["device_id"] = pass_context(self.globals["device_id"])
 
         if limited:
@@ -1566,9 +1819,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         self.globals["expand"] = hassfunction(expand)
         self.filters["expand"] = pass_context(self.globals["expand"])
-        self.globals["closest"] = hassfunction(closest)
-        self.filters["closest"] = pass_context(hassfunction(closest_filter))
-        self.globals["distance"] = hassfunction(distance)
+        self.globals["closest"] = volatile(hassfunction(closest))
+        self.filters["closest"] = pass_context(volatile(hassfunction(closest_filter)))
+        self.globals["distance"] = volatile(hassfunction(distance))
         self.globals["is_state"] = hassfunction(is_state)
         self.globals["is_state_attr"] = hassfunction(is_state_attr)
         self.globals["state_attr"] = hassfunction(state_attr)
@@ -1603,12 +1856,55 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
-
+        lru = self.template_lru
+        cached = lru.get(source)
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache.get(source)
+        if cached is None:
+            self.cache_misses += 1
+            cached = self.template_cache[source] = self._compile_code(source)
+        else:
+            self.cache_hits += 1
+
+        # Keep recently used code alive even when no Template holds it,
+        # so one-off renders do not recompile every time.
+        lru[source] = cached
+        lru.move_to_end(source)
+        while len(lru) > TEMPLATE_CACHE_SIZE:
+            lru.popitem(last=False)
 
         return cached
 
+    def _compile_code(self, source: str) -> CodeType:
+        """Compile a template, using code from a previous run if available."""
+        bytecode_cache: _BytecodeCache | None = None
+        if self.hass is not None:
+            bytecode_cache = self.hass.data.get(_BYTECODE_CACHE)
+
+        if bytecode_cache is not None:
+            key = bytecode_cache.key(self._kind, source)
+            code = bytecode_cache.get(key)
+            if code is not None:
+                return code
+
+        start = time.perf_counter()
+        code = super().compile(source)
+        self.compile_time += time.perf_counter() - start
+
+        if bytecode_cache is not None:
+            bytecode_cache.set(key, code)
+        return code
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return statistics about the compiled template cache."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "compile_time": self.compile_time,
+            "size": len(self.template_lru),
+            "max_size": TEMPLATE_CACHE_SIZE,
+            "weak_size": len(self.template_cache),
+        }
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
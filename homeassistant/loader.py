@@ -14,6 +14,7 @@ import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -27,7 +28,6 @@ from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
-from homeassistant.util.async_ import gather_with_concurrency
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -44,6 +44,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_BUILTIN_MANIFESTS = "builtin_manifests"
+DATA_IMPORT_TIME = "import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -57,6 +59,12 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+# Manifests of all built-in integrations, generated by hassfest
+BUILTIN_MANIFESTS_PATH = pathlib.Path(__file__).parent / "generated" / "manifests.json"
+
+CUSTOM_COMPONENTS_INDEX_KEY = "core.custom_components"
+CUSTOM_COMPONENTS_INDEX_VERSION = 1
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -110,34 +118,69 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # Circular dep
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
+
+    store = Store(hass, CUSTOM_COMPONENTS_INDEX_VERSION, CUSTOM_COMPONENTS_INDEX_KEY)
+    index = await store.async_load() or {}
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    integrations, new_index = await hass.async_add_executor_job(
+        _resolve_custom_components, hass, custom_components, index
     )
 
-    integrations = await gather_with_concurrency(
-        MAX_LOAD_CONCURRENTLY,
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+    if new_index != index:
+        await store.async_save(new_index)
+
+    return integrations
+
+
+def _resolve_custom_components(
+    hass: HomeAssistant, root_module: ModuleType, index: dict[str, Any]
+) -> tuple[dict[str, Integration], dict[str, Any]]:
+    """Resolve all custom integrations.
+
+    Manifests are only read when their modification time differs from the
+    one in the index. Returns the integrations and the updated index.
+    """
+    integrations: dict[str, Integration] = {}
+    new_index: dict[str, Any] = {}
+
+    for base in root_module.__path__:  # type: ignore
+        for entry in pathlib.Path(base).iterdir():
+            if entry.name in integrations:
+                continue
+
+            manifest_path = entry / "manifest.json"
+            try:
+                mtime = manifest_path.stat().st_mtime
+            except OSError:
+                continue
+
+            cached = index.get(str(manifest_path))
+            if cached is not None and cached["mtime"] == mtime:
+                manifest = cached["manifest"]
+            else:
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+            new_index[str(manifest_path)] = {"mtime": mtime, "manifest": manifest}
+
+            integration = Integration.from_manifest(
+                hass,
+                root_module,
+                entry.name,
+                manifest_path,
+                cast(Manifest, dict(manifest)),
             )
-            for comp in dirs
-        ),
-    )
+            if integration is not None:
+                integrations[integration.domain] = integration
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    return integrations, new_index
 
 
 async def async_get_custom_components(
@@ -290,40 +333,52 @@ class Integration:
                 )
                 continue
 
-            integration = cls(
-                hass,
-                f"{root_module.__name__}.{domain}",
-                manifest_path.parent,
-                manifest,
-            )
+            return cls.from_manifest(hass, root_module, domain, manifest_path, manifest)
 
-            if integration.is_built_in:
-                return integration
+        return None
 
-            _LOGGER.warning(CUSTOM_WARNING, integration.domain)
-            try:
-                AwesomeVersion(
-                    integration.version,
-                    [
-                        AwesomeVersionStrategy.CALVER,
-                        AwesomeVersionStrategy.SEMVER,
-                        AwesomeVersionStrategy.SIMPLEVER,
-                        AwesomeVersionStrategy.BUILDVER,
-                        AwesomeVersionStrategy.PEP440,
-                    ],
-                )
-            except AwesomeVersionException:
-                _LOGGER.error(
-                    "The custom integration '%s' does not have a "
-                    "valid version key (%s) in the manifest file and was blocked from loading. "
-                    "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
-                    integration.domain,
-                    integration.version,
-                )
-                return None
+    @classmethod
+    def from_manifest(
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_path: pathlib.Path,
+        manifest: Manifest,
+    ) -> Integration | None:
+        """Create an integration from its manifest in a root module."""
+        integration = cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            manifest_path.parent,
+            manifest,
+        )
+
+        if integration.is_built_in:
             return integration
 
-        return None
+        _LOGGER.warning(CUSTOM_WARNING, integration.domain)
+        try:
+            AwesomeVersion(
+                integration.version,
+                [
+                    AwesomeVersionStrategy.CALVER,
+                    AwesomeVersionStrategy.SEMVER,
+                    AwesomeVersionStrategy.SIMPLEVER,
+                    AwesomeVersionStrategy.BUILDVER,
+                    AwesomeVersionStrategy.PEP440,
+                ],
+            )
+        except AwesomeVersionException:
+            _LOGGER.error(
+                "The custom integration '%s' does not have a "
+                "valid version key (%s) in the manifest file and was blocked from loading. "
+                "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
+                integration.domain,
+                integration.version,
+            )
+            return None
+        return integration
 
     def __init__(
         self,
@@ -487,7 +542,9 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            start = timer()
+            cache[self.domain] = _import_module(self.pkg_path)
+            self._record_import_time(self.domain, timer() - start)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -495,12 +552,18 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
+            start = timer()
             cache[full_name] = self._import_platform(platform_name)
+            self._record_import_time(full_name, timer() - start)
         return cache[full_name]  # type: ignore
 
+    def _record_import_time(self, name: str, seconds: float) -> None:
+        """Record how long importing a module of this integration took."""
+        self.hass.data.setdefault(DATA_IMPORT_TIME, {})[name] = seconds
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module(f"{self.pkg_path}.{platform_name}")
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -553,6 +616,14 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    if manifest := (await _async_get_builtin_manifests(hass)).get(domain):
+        return Integration(
+            hass,
+            f"{components.__name__}.{domain}",
+            pathlib.Path(components.__file__).parent / domain,
+            cast(Manifest, dict(manifest)),
+        )
+
     if integration := await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     ):
@@ -561,6 +632,44 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
     raise IntegrationNotFound(domain)
 
 
+def _import_module(name: str) -> ModuleType:
+    """Import a module, retrying once if the import deadlocked.
+
+    Preloads import modules in the executor, which can make two threads
+    import the same modules in a different order. Python detects this and
+    fails one of the imports, which succeeds once the other one is done.
+    """
+    try:
+        return importlib.import_module(name)
+    except RuntimeError as err:
+        if "deadlock detected" not in str(err):
+            raise
+        _LOGGER.debug("Retrying import of %s after deadlock: %s", name, err)
+        return importlib.import_module(name)
+
+
+async def _async_get_builtin_manifests(hass: HomeAssistant) -> dict[str, Manifest]:
+    """Return the manifests of all built-in integrations."""
+    # The executor job future is shared by everyone asking during startup
+    manifests = hass.data.get(DATA_BUILTIN_MANIFESTS)
+    if manifests is None:
+        manifests = hass.data[DATA_BUILTIN_MANIFESTS] = hass.async_add_executor_job(
+            _load_builtin_manifests
+        )
+    return cast(Dict[str, Manifest], await manifests)
+
+
+def _load_builtin_manifests() -> dict[str, Manifest]:
+    """Load the manifests of all built-in integrations in one read."""
+    try:
+        return cast(
+            Dict[str, Manifest], json.loads(BUILTIN_MANIFESTS_PATH.read_bytes())
+        )
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Unable to load the built-in manifest index: %s", err)
+        return {}
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
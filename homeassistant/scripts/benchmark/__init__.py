@@ -8,6 +8,7 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, TypeVar
 
@@ -106,11 +107,11 @@ async def fire_events_with_filter(hass):
 
     hass.bus.async_listen(event_name, listener, event_filter=event_filter)
 
+    start = timer()
+
     for _ in range(events_to_fire):
         hass.bus.async_fire(event_name)
 
-    start = timer()
-
     await hass.async_block_till_done()
 
     assert count == 0
@@ -240,11 +241,11 @@ async def state_changed_event_filter_helper(hass):
         "new_state": core.State(entity_id, "on"),
     }
 
+    start = timer()
+
     for _ in range(events_to_fire):
         hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
 
-    start = timer()
-
     await hass.async_block_till_done()
 
     assert count == 0
@@ -390,6 +391,247 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_write_states(hass):
+    """Write 100k state changes of 3000 entities with the recorder."""
+    return _recorder_write_states(hass, bulk_write=False)
+
+
+@benchmark
+async def recorder_bulk_write_states(hass):
+    """Write 100k state changes of 3000 entities with recorder bulk write."""
+    return _recorder_write_states(hass, bulk_write=True)
+
+
+def _recorder_write_states(hass, bulk_write):
+    # pylint: disable=import-outside-toplevel,protected-access
+    from homeassistant.components import recorder
+
+    entity_count = 3000
+    states_to_write = 10 ** 5
+    attributes = {
+        "unit_of_measurement": "kWh",
+        "device_class": "energy",
+        "friendly_name": "Energy meter",
+    }
+    time_fired = dt_util.utcnow()
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": f"sensor.energy_{idx % entity_count}",
+                "new_state": core.State(
+                    f"sensor.energy_{idx % entity_count}",
+                    str(idx),
+                    attributes,
+                    last_changed=time_fired,
+                    last_updated=time_fired,
+                ),
+            },
+            time_fired=time_fired,
+        )
+        for idx in range(states_to_write)
+    ]
+
+    instance = recorder.Recorder(
+        hass,
+        auto_purge=False,
+        keep_days=1,
+        short_term_statistics_keep_days=1,
+        commit_interval=1,
+        bulk_write=bulk_write,
+        uri="sqlite://",
+        db_max_retries=1,
+        db_retry_wait=0,
+        entity_filter=lambda entity_id: True,
+        exclude_t=[],
+    )
+    instance._setup_connection()
+    instance._setup_run()
+
+    start = timer()
+
+    # Commit once every entity has reported, like a burst
+    # of meters reporting within one commit interval
+    for idx, event in enumerate(events, 1):
+        instance._process_one_event(event)
+        if idx % entity_count == 0:
+            instance._commit_event_session_or_retry()
+    instance._commit_event_session_or_retry()
+
+    runtime = timer() - start
+    print(f"Recorded {states_to_write / runtime:.0f} state changes/s")
+
+    instance._close_event_session()
+    instance._close_connection()
+
+    return runtime
+
+
+@benchmark
+async def mqtt_dispatch_messages(hass):
+    """Dispatch 100k MQTT messages on 10k topics to 4000 subscriptions."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant import config_entries
+    from homeassistant.components import mqtt
+
+    device_count = 1000
+    messages_to_dispatch = 10 ** 5
+    count = 0
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    conf = mqtt.CONFIG_SCHEMA({mqtt.DOMAIN: {mqtt.CONF_BROKER: "localhost"}})
+    entry = config_entries.ConfigEntry(1, mqtt.DOMAIN, "", {}, "user")
+    mqtt_client = mqtt.MQTT(hass, entry, conf[mqtt.DOMAIN])
+
+    # Subscriptions similar to zigbee2mqtt and Tasmota devices
+    for idx in range(device_count // 2):
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"zigbee2mqtt/device_{idx}/availability",
+            f"tele/tasmota_{idx}/+",
+            f"stat/tasmota_{idx}/RESULT",
+            f"cmnd/tasmota_{idx}/POWER",
+            f"tasmota/discovery/{idx}/config",
+            f"tasmota/discovery/{idx}/sensors",
+            f"homeassistant/sensor/device_{idx}/config",
+        ):
+            await mqtt_client.async_subscribe(topic, listener, 0)
+    await mqtt_client.async_subscribe("homeassistant/+/+/+/config", listener, 0)
+
+    topics = []
+    for idx in range(device_count // 2):
+        for suffix in range(10):
+            topics.append(f"zigbee2mqtt/device_{idx}/set/{suffix}")
+            topics.append(f"tele/tasmota_{idx}/SENSOR{suffix}")
+    messages = []
+    for idx in range(messages_to_dispatch):
+        msg = MQTTMessage(topic=topics[idx % len(topics)].encode())
+        msg.payload = b'{"state": "ON"}'
+        messages.append(msg)
+
+    start = timer()
+
+    for msg in messages:
+        mqtt_client._mqtt_handle_message(msg)
+
+    runtime = timer() - start
+    print(f"Dispatched {messages_to_dispatch / runtime:.0f} messages/s")
+
+    return runtime
+
+
+@benchmark
+async def write_ha_state(hass):
+    """Write the state of 1000 sensors 100 times each."""
+    return await _write_ha_state(hass, cache_static_attributes=False)
+
+
+@benchmark
+async def write_ha_state_static_attributes(hass):
+    """Write the state of 1000 sensors with cached static attributes 100 times each."""
+    return await _write_ha_state(hass, cache_static_attributes=True)
+
+
+async def _write_ha_state(hass, cache_static_attributes):
+    # pylint: disable=import-outside-toplevel,protected-access
+    from homeassistant.components.sensor import SensorEntity
+
+    entity_count = 1000
+    writes_per_entity = 100
+
+    class BenchmarkSensor(SensorEntity):
+        """Sensor with typical attributes."""
+
+        _attr_device_class = "power"
+        _attr_icon = "mdi:flash"
+        _attr_unit_of_measurement = "W"
+        _attr_should_poll = False
+        _attr_state_class = "measurement"
+        _cache_static_attributes = cache_static_attributes
+
+    entities = []
+    for idx in range(entity_count):
+        entity = BenchmarkSensor()
+        entity.hass = hass
+        entity.entity_id = f"sensor.power_{idx}"
+        entity._attr_name = f"Power {idx}"
+        entities.append(entity)
+
+    start = timer()
+
+    for value in range(writes_per_entity):
+        for entity in entities:
+            entity._attr_state = value
+            entity.async_write_ha_state()
+
+    runtime = timer() - start
+    print(f"Wrote {entity_count * writes_per_entity / runtime:.0f} states/s")
+
+    return runtime
+
+
+@benchmark
+async def entity_service_call(hass):
+    """Call an entity service on 5 entities while the entity count grows."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import device_registry, entity_registry
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_component import EntityComponent
+
+    calls_per_count = 1000
+    target = {"entity_id": [f"switch.bench_{idx}" for idx in range(5)]}
+
+    class BenchmarkSwitch(Entity):
+        """Entity with a no-op service method."""
+
+        _attr_should_poll = False
+
+        def __init__(self, idx):
+            """Initialize the entity."""
+            self._attr_name = f"bench {idx}"
+
+        async def async_bench(self):
+            """Do nothing."""
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await device_registry.async_load(hass)
+        await entity_registry.async_load(hass)
+
+        component = EntityComponent(logging.getLogger(__name__), "switch", hass)
+        component.async_register_entity_service("bench", {}, "async_bench")
+        added = 0
+        total = 0.0
+
+        for entity_count in (100, 1000, 10000):
+            await component.async_add_entities(
+                [BenchmarkSwitch(idx) for idx in range(added, entity_count)]
+            )
+            added = entity_count
+
+            start = timer()
+
+            for _ in range(calls_per_count):
+                await hass.services.async_call("switch", "bench", target, blocking=True)
+
+            runtime = timer() - start
+            total += runtime
+            print(
+                f"{entity_count} entities: "
+                f"{runtime / calls_per_count * 1000:.3f}ms per call"
+            )
+
+    return total
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -420,6 +662,7 @@ def _create_state_changed_event_from_old_new(
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
     row.attributes = attributes_json
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -55,6 +55,7 @@ DATA_SETUP_TIME = "setup_time"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_PRELOADS = "integration_preloads"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
@@ -195,6 +196,9 @@ async def _async_setup_component(
         log_error(str(err), integration.documentation)
         return False
 
+    # Let a preload started during bootstrap finish the import in the executor
+    await _async_wait_preload(hass, domain)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
@@ -325,6 +329,8 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await _async_wait_preload(hass, integration.domain)
+
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -379,6 +385,66 @@ async def async_process_deps_reqs(
     processed.add(integration.domain)
 
 
+@core.callback
+def async_preload_integrations(
+    hass: core.HomeAssistant, integrations: Iterable[loader.Integration]
+) -> None:
+    """Import the components of integrations in the executor ahead of setup.
+
+    The import of an integration starts once the requirements of it and its
+    dependencies are installed. Imports run in parallel, at most
+    MAX_LOAD_CONCURRENTLY at a time, in the order the integrations are passed in.
+    """
+    preloads: dict[str, asyncio.Task[None]] = hass.data.setdefault(DATA_PRELOADS, {})
+    components = hass.data.setdefault(loader.DATA_COMPONENTS, {})
+    semaphore = asyncio.Semaphore(loader.MAX_LOAD_CONCURRENTLY)
+
+    for integration in integrations:
+        if (
+            integration.disabled
+            or integration.domain in components
+            or integration.domain in preloads
+        ):
+            continue
+        preloads[integration.domain] = hass.async_create_task(
+            _async_preload(hass, integration, semaphore)
+        )
+
+
+async def _async_preload(
+    hass: core.HomeAssistant,
+    integration: loader.Integration,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """Import the component of an integration once its requirements are installed.
+
+    Errors are reported when the integration is set up and imports it again.
+    """
+    try:
+        await requirements.async_get_integration_with_requirements(
+            hass, integration.domain
+        )
+    except HomeAssistantError as err:
+        _LOGGER.debug("Unable to preload %s: %s", integration.domain, err)
+        return
+
+    async with semaphore:
+        try:
+            await hass.async_add_executor_job(integration.get_component)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to preload %s: %s", integration.domain, err)
+
+
+async def _async_wait_preload(hass: core.HomeAssistant, domain: str) -> None:
+    """Wait for a pending preload of an integration to finish.
+
+    Importing the integration on the event loop while it is imported in the
+    executor would block the event loop until the preload is done.
+    """
+    if (preload := hass.data.get(DATA_PRELOADS, {}).get(domain)) is not None:
+        await preload
+
+
 @core.callback
 def async_when_setup(
     hass: core.HomeAssistant,
@@ -0,0 +1,41 @@
+"""Generate the index of integration manifests."""
+from __future__ import annotations
+
+import json
+
+from .model import Config, Integration
+
+
+def generate_and_validate(integrations: dict[str, Integration]) -> str:
+    """Validate and generate the manifest index."""
+    data = {
+        domain: integrations[domain].manifest
+        for domain in sorted(integrations)
+        if integrations[domain].manifest
+    }
+    return json.dumps(data, indent=2)
+
+
+def validate(integrations: dict[str, Integration], config: Config) -> None:
+    """Validate the manifest index."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.json is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: dict[str, Integration], config: Config) -> None:
+    """Generate the manifest index."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
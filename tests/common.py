@@ -1016,6 +1016,14 @@ def mock_storage(data=None):
         # To ensure that the data can be serialized
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    def mock_write_journal(store, path, changes):
+        """Mock version of write journal."""
+        _LOGGER.info("Writing journal to %s: %s", store.key, changes)
+        lines = store._encode_changes(changes).splitlines()
+        store._apply_changes(
+            data[store.key]["data"], [json.loads(line) for line in lines]
+        )
+
     async def mock_remove(store):
         """Remove data."""
         data.pop(store.key, None)
@@ -1028,6 +1036,10 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store._write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.JournaledStore._write_journal",
+        side_effect=mock_write_journal,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
@@ -112,11 +112,10 @@ async def test_chain_history(hass, values, missing=False):
         }
 
     with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        return_value=fake_states,
-    ), patch(
-        "homeassistant.components.recorder.history.get_last_state_changes",
-        return_value=fake_states,
+        "homeassistant.components.recorder.history.get_states_for_requests",
+        side_effect=lambda hass, requests: [
+            fake_states.get(request.entity_id, []) for request in requests
+        ],
     ):
         with assert_setup_component(1, "sensor"):
             assert await async_setup_component(hass, "sensor", config)
@@ -227,11 +226,10 @@ async def test_history_time(hass):
         ]
     }
     with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        return_value=fake_states,
-    ), patch(
-        "homeassistant.components.recorder.history.get_last_state_changes",
-        return_value=fake_states,
+        "homeassistant.components.recorder.history.get_states_for_requests",
+        side_effect=lambda hass, requests: [
+            fake_states.get(request.entity_id, []) for request in requests
+        ],
     ):
         with assert_setup_component(1, "sensor"):
             assert await async_setup_component(hass, "sensor", config)
@@ -242,6 +240,50 @@ async def test_history_time(hass):
         assert state.state == "18.0"
 
 
+async def test_history_count_and_time(hass):
+    """Test a state in both history windows is only loaded once."""
+    config = {
+        "sensor": {
+            "platform": "filter",
+            "name": "test",
+            "entity_id": "sensor.test_monitored",
+            "filters": [
+                {"filter": "throttle", "window_size": 2},
+                {"filter": "time_throttle", "window_size": "00:00:01"},
+            ],
+        },
+    }
+    await async_init_recorder_component(hass)
+
+    t_0 = dt_util.utcnow() - timedelta(seconds=30)
+    t_1 = dt_util.utcnow() - timedelta(minutes=1)
+    t_2 = dt_util.utcnow() - timedelta(minutes=3)
+
+    # The start state of the time window is moved to the start of the window
+    count_states = [
+        ha.State("sensor.test_monitored", 20.0, last_changed=t_2, last_updated=t_2),
+        ha.State("sensor.test_monitored", 10.0, last_changed=t_0, last_updated=t_0),
+    ]
+    time_states = [
+        ha.State("sensor.test_monitored", 20.0, last_changed=t_1, last_updated=t_1),
+        ha.State("sensor.test_monitored", 10.0, last_changed=t_0, last_updated=t_0),
+    ]
+    with patch(
+        "homeassistant.components.recorder.history.get_states_for_requests",
+        side_effect=lambda hass, requests: [
+            count_states if request.number_of_states else time_states
+            for request in requests
+        ],
+    ):
+        with assert_setup_component(1, "sensor"):
+            assert await async_setup_component(hass, "sensor", config)
+            await hass.async_block_till_done()
+
+        await hass.async_block_till_done()
+        state = hass.states.get("sensor.test")
+        assert state.state == "20.0"
+
+
 async def test_setup(hass):
     """Test if filter attributes are inherited."""
     config = {
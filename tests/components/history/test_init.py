@@ -1,5 +1,6 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 from datetime import timedelta
 import json
 from unittest.mock import patch, sentinel
@@ -10,6 +11,7 @@ from pytest import approx
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.statistics import PERIOD_HOUR
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
@@ -17,7 +19,11 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 
 from tests.common import init_recorder_component
-from tests.components.recorder.common import trigger_db_commit, wait_recording_done
+from tests.components.recorder.common import (
+    async_wait_recording_done,
+    trigger_db_commit,
+    wait_recording_done,
+)
 
 
 @pytest.mark.usefixtures("hass_history")
@@ -875,7 +881,7 @@ async def test_statistics_during_period(
     await hass.async_add_executor_job(trigger_db_commit, hass)
     await hass.async_block_till_done()
 
-    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period="hourly", start=now)
+    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period=PERIOD_HOUR, start=now)
     await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
 
     client = await hass_ws_client()
@@ -899,6 +905,7 @@ async def test_statistics_during_period(
             "type": "history/statistics_during_period",
             "start_time": now.isoformat(),
             "statistic_ids": ["sensor.test"],
+            "period": "hour",
         }
     )
     response = await client.receive_json()
@@ -918,6 +925,34 @@ async def test_statistics_during_period(
         ]
     }
 
+    # A short period is answered with the 5-minute statistics
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/statistics_during_period",
+            "start_time": now.isoformat(),
+            "statistic_ids": ["sensor.test"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": [
+            {
+                "statistic_id": "sensor.test",
+                "start": (now + timedelta(minutes=5 * i)).isoformat(),
+                "mean": approx(value),
+                "min": approx(value),
+                "max": approx(value),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+            for i in range(12)
+        ]
+    }
+
 
 async def test_statistics_during_period_bad_start_time(hass, hass_ws_client):
     """Test statistics_during_period."""
@@ -1008,7 +1043,7 @@ async def test_list_statistic_ids(hass, hass_ws_client, units, attributes, unit)
         {"statistic_id": "sensor.test", "unit_of_measurement": unit}
     ]
 
-    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period="hourly", start=now)
+    hass.data[recorder.DATA_INSTANCE].do_adhoc_statistics(period=PERIOD_HOUR, start=now)
     await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
     # Remove the state, statistics will now be fetched from the database
     hass.states.async_remove("sensor.test")
@@ -1042,3 +1077,185 @@ async def test_list_statistic_ids(hass, hass_ws_client, units, attributes, unit)
     response = await client.receive_json()
     assert response["success"]
     assert response["result"] == []
+
+
+async def test_history_stream(hass, hass_ws_client):
+    """Test streaming history followed by live state changes."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await async_wait_recording_done(hass, instance)
+
+    start_time = dt_util.utcnow()
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "a")
+    hass.states.async_set("sensor.other", "x")
+    await async_wait_recording_done(hass, instance)
+    hass.states.async_set("sensor.one", "2")
+
+    orig_window_message = history._history_window_message
+
+    def _window_message(*args):
+        hass.states.set("sensor.one", "held")
+        return orig_window_message(*args)
+
+    client = await hass_ws_client()
+    with patch.object(history, "_history_window_message", _window_message):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "start_time": start_time.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+    assert response["type"] == "event"
+    window = response["event"]
+    assert set(window["states"]) == {"sensor.one", "sensor.two"}
+    assert [state["state"] for state in window["states"]["sensor.two"]] == ["a"]
+    assert dt_util.parse_datetime(window["start_time"]) == start_time
+
+    response = await client.receive_json()
+    tail = response["event"]["states"]
+    assert list(tail) == ["sensor.one"]
+
+    # Every state is sent exactly once, either from history or from the tail
+    assert [
+        state["state"] for state in window["states"]["sensor.one"] + tail["sensor.one"]
+    ] == ["1", "2", "held"]
+
+    hass.states.async_set("sensor.other", "y")
+    hass.states.async_set("sensor.two", "b", {"changed": True})
+    hass.states.async_set("sensor.two", "b", {"changed": False})
+    hass.states.async_set("sensor.one", "3")
+    response = await client.receive_json()
+    assert list(response["event"]["states"]) == ["sensor.two"]
+    assert response["event"]["states"]["sensor.two"][0]["state"] == "b"
+    response = await client.receive_json()
+    assert response["event"]["states"]["sensor.one"][0]["state"] == "3"
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["success"]
+
+
+async def test_history_stream_sends_states_once(hass, hass_ws_client):
+    """Test a state change dispatched after subscribing is not sent twice."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    start_time = dt_util.utcnow()
+    hass.states.async_set("sensor.one", "1")
+    await async_wait_recording_done(hass, instance)
+
+    orig_get = hass.states.get
+
+    def _get(entity_id):
+        # Changed after end_time, but before the stream subscribed
+        hass.states.async_set(entity_id, "2")
+        return orig_get(entity_id)
+
+    client = await hass_ws_client()
+    with patch.object(hass.states, "get", _get):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "start_time": start_time.isoformat(),
+                "entity_ids": ["sensor.one"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+    response = await client.receive_json()
+    window = response["event"]["states"]
+    assert [state["state"] for state in window["sensor.one"]] == ["1"]
+
+    response = await client.receive_json()
+    tail = response["event"]["states"]
+    assert [state["state"] for state in tail["sensor.one"]] == ["2"]
+
+
+async def test_history_stream_windows(hass, hass_ws_client):
+    """Test history is streamed in time ordered windows."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    now = dt_util.utcnow()
+    hass.states.async_set("sensor.one", "1")
+    await async_wait_recording_done(hass, instance)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "start_time": (now - timedelta(days=2, hours=12)).isoformat(),
+            "entity_ids": ["sensor.one"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    end_times = []
+    for _ in range(3):
+        response = await client.receive_json()
+        event = response["event"]
+        end_times.append(dt_util.parse_datetime(event["end_time"]))
+    assert end_times == sorted(end_times)
+    assert event["states"]["sensor.one"][0]["state"] == "1"
+
+
+async def test_history_stream_commit_timeout(hass, hass_ws_client):
+    """Test the stream ends with an error when the recorder does not commit."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+
+    client = await hass_ws_client()
+    never_committed = asyncio.Event()
+    with patch.object(history, "STREAM_COMMIT_TIMEOUT", 0), patch.object(
+        instance, "async_wait_committed", side_effect=never_committed.wait
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "start_time": dt_util.utcnow().isoformat(),
+                "entity_ids": ["sensor.one"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "timeout"
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+
+
+async def test_history_stream_bad_start_time(hass, hass_ws_client):
+    """Test history stream with an invalid start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "start_time": "cats",
+            "entity_ids": ["sensor.one"],
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
@@ -1,6 +1,7 @@
 """Tests for Home Assistant View."""
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
+from aiohttp import ClientPayloadError
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -14,6 +15,7 @@ from homeassistant.components.http.view import (
     request_handler_factory,
 )
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
+from homeassistant.setup import async_setup_component
 
 
 @pytest.fixture
@@ -69,3 +71,56 @@ async def test_not_running(mock_request_with_stopping):
         Mock(requires_auth=False), AsyncMock(side_effect=Unauthorized)
     )(mock_request_with_stopping)
     assert response.status == 503
+
+
+@pytest.mark.parametrize("items", [[], [{"state": "on"}, [1, 2], "three"]])
+async def test_json_stream(hass, aiohttp_client, items):
+    """Test streaming a JSON list in chunks."""
+
+    class StreamView(HomeAssistantView):
+        url = "/api/stream"
+        name = "api:stream"
+        requires_auth = False
+
+        async def get(self, request):
+            return await self.json_stream(request, lambda: iter(items))
+
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_view(StreamView())
+    client = await aiohttp_client(hass.http.app)
+
+    with patch("homeassistant.components.http.view.STREAM_CHUNK_SIZE", 1):
+        resp = await client.get("/api/stream")
+
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == "application/json"
+    assert resp.headers["Transfer-Encoding"] == "chunked"
+    assert await resp.json() == items
+
+
+async def test_json_stream_error(hass, aiohttp_client, caplog):
+    """Test an error while streaming ends the response incomplete."""
+
+    def items():
+        yield {"state": "on"}
+        raise ValueError("Boom")
+
+    class StreamView(HomeAssistantView):
+        url = "/api/stream"
+        name = "api:stream"
+        requires_auth = False
+
+        async def get(self, request):
+            return await self.json_stream(request, items)
+
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_view(StreamView())
+    client = await aiohttp_client(hass.http.app)
+
+    with patch("homeassistant.components.http.view.STREAM_CHUNK_SIZE", 1):
+        resp = await client.get("/api/stream")
+
+    assert resp.status == 200
+    with pytest.raises(ClientPayloadError):
+        await resp.read()
+    assert "Error while streaming /api/stream" in caplog.text
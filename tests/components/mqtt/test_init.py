@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant.components import mqtt, websocket_api
 from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
+from homeassistant.components.mqtt.models import ReceiveMessage
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_SERVICE,
@@ -569,6 +570,120 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0][0].payload == "test-payload"
 
 
+def test_subscription_trie():
+    """Test matching, adding and removing subscriptions of the subscription trie."""
+    trie = mqtt.SubscriptionTrie()
+    subscriptions = {
+        topic: mqtt.Subscription(topic, None)
+        for topic in (
+            "test/state",
+            "test/+",
+            "test/#",
+            "+/state",
+            "#",
+            "test/+/state",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+    duplicate = mqtt.Subscription("test/state", None, 1)
+    trie.add(duplicate)
+
+    def matching(topic):
+        return sorted(subscription.topic for subscription in trie.match(topic))
+
+    assert matching("test/state") == sorted(
+        ["test/state", "test/state", "test/+", "test/#", "+/state", "#"]
+    )
+    assert matching("test") == ["#", "test/#"]
+    assert matching("test/other/state") == ["#", "test/#", "test/+/state"]
+    assert matching("other/topic") == ["#"]
+    assert matching("$SYS/broker") == ["$SYS/#"]
+
+    trie.remove(duplicate)
+    assert matching("test/state").count("test/state") == 1
+
+    for subscription in subscriptions.values():
+        trie.remove(subscription)
+    assert trie.match("test/state") == []
+    # Nodes without subscriptions are pruned
+    assert trie.children == {}
+
+
+async def test_handle_messages_in_batches(hass, mqtt_mock, calls, record_calls):
+    """Test messages queued by the paho thread are handled in one batch."""
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    mqtt_client = mqtt_mock()
+
+    def receive_messages():
+        for idx in range(3):
+            mqtt_client._mqtt_on_message(
+                None,
+                None,
+                ReceiveMessage("test-topic", f"payload{idx}".encode(), 0, False),
+            )
+
+    with patch.object(
+        mqtt_client,
+        "_async_handle_pending_messages",
+        wraps=mqtt_client._async_handle_pending_messages,
+    ) as handle_pending_messages:
+        await hass.async_add_executor_job(receive_messages)
+        await hass.async_block_till_done()
+
+    assert len(handle_pending_messages.mock_calls) == 1
+    assert [call[0].payload for call in calls] == ["payload0", "payload1", "payload2"]
+
+
+async def test_handle_messages_after_failing_subscriber(
+    hass, mqtt_mock, calls, record_calls, caplog
+):
+    """Test a failing subscriber doesn't keep the other messages queued."""
+
+    @callback
+    def failing_callback(msg):
+        if msg.payload == "payload0":
+            raise ValueError("Failing subscriber")
+
+    await mqtt.async_subscribe(hass, "test-topic", failing_callback)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    mqtt_client = mqtt_mock()
+
+    def receive_messages():
+        for idx in range(3):
+            mqtt_client._mqtt_on_message(
+                None,
+                None,
+                ReceiveMessage("test-topic", f"payload{idx}".encode(), 0, False),
+            )
+
+    await hass.async_add_executor_job(receive_messages)
+    await hass.async_block_till_done()
+
+    assert [call[0].payload for call in calls] == ["payload1", "payload2"]
+    assert not mqtt_client._pending_messages
+    assert "Error handling message on test-topic" in caplog.text
+
+
+async def test_decode_payload_once_per_encoding(hass, mqtt_mock, calls, record_calls):
+    """Test the payload is decoded once and shared by subscriptions."""
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+    payloads = sorted(
+        (call[0].payload for call in calls),
+        key=lambda payload: isinstance(payload, str),
+    )
+    assert payloads == [b"test-payload", "test-payload", "test-payload"]
+    assert payloads[1] is payloads[2]
+
+
 async def test_subscribe_special_characters(hass, mqtt_mock, calls, record_calls):
     """Test the subscription to topics with special characters."""
     topic = "/test-topic/$(.)[^]{-}"
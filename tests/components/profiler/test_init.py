@@ -8,6 +8,7 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_TEMPLATE_CACHE_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_MEMORY,
     SERVICE_START,
@@ -16,6 +17,7 @@ from homeassistant.components.profiler import (
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -192,3 +194,28 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_log_template_cache_stats(hass, caplog):
+    """Test we can log the compiled template cache statistics."""
+
+    await setup.async_setup_component(hass, "persistent_notification", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_TEMPLATE_CACHE_STATS)
+
+    Template("{{ 1 + 1 }}", hass).async_render()
+    Template("{{ 1 + 1 }}", hass).async_render()
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_TEMPLATE_CACHE_STATS, {})
+    await hass.async_block_till_done()
+
+    assert "Template cache [default]: 1 hits, 1 misses" in caplog.text
+    caplog.clear()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
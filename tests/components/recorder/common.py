@@ -1,12 +1,9 @@
 """Common test utils for working with recorder."""
-from datetime import timedelta
 
 from homeassistant import core as ha
 from homeassistant.components import recorder
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
-
-from tests.common import async_fire_time_changed, fire_time_changed
+from homeassistant.util.async_ import run_callback_threadsafe
 
 DEFAULT_PURGE_TASKS = 3
 
@@ -27,9 +24,7 @@ async def async_wait_recording_done_without_instance(hass: HomeAssistant) -> Non
 
 def trigger_db_commit(hass: HomeAssistant) -> None:
     """Force the recorder to commit."""
-    for _ in range(recorder.DEFAULT_COMMIT_INTERVAL):
-        # We only commit on time change
-        fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    run_callback_threadsafe(hass.loop, async_trigger_db_commit, hass).result()
 
 
 async def async_wait_recording_done(
@@ -63,8 +58,7 @@ async def async_wait_purge_done(
 @ha.callback
 def async_trigger_db_commit(hass: HomeAssistant) -> None:
     """Fore the recorder to commit. Async friendly."""
-    for _ in range(recorder.DEFAULT_COMMIT_INTERVAL):
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    hass.data[recorder.DATA_INSTANCE].queue.put(recorder.CommitTask())
 
 
 async def async_recorder_block_till_done(
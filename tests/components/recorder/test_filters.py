@@ -0,0 +1,90 @@
+"""Test the sql predicates for entity filters."""
+import pytest
+
+from homeassistant.components.recorder.filters import (
+    sqlalchemy_filter_from_entity_filter,
+)
+from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.helpers.entityfilter import generate_filter
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import wait_recording_done
+
+ENTITY_IDS = [
+    "light.kitchen",
+    "light.kitchen_window",
+    "light.kitchenxwindow",
+    "sensor.kitchen_temperature",
+    "sensor.outside_temperature",
+    "sensor.power",
+    "switch.garage",
+    "cover.bedroom_window",
+    "cover.garage_door",
+    "sun.sun",
+]
+
+
+@pytest.mark.parametrize(
+    "filter_args",
+    [
+        # Case 2
+        (["light"], ["sensor.power"], [], [], ["cover.*_window"], []),
+        # Case 3
+        ([], [], ["light"], ["sensor.power"], [], ["*_temperature"]),
+        # Case 4a
+        (["sensor"], ["switch.garage"], ["light"], ["sensor.power"], [], []),
+        (["light"], ["sun.sun"], ["sensor"], [], ["cover.*"], ["cover.garage_?oor"]),
+        # Case 4b
+        ([], ["sensor.power"], ["sensor"], ["light.kitchen"], [], []),
+        ([], ["light.kitchen"], [], ["sun.sun"], [], ["light.kitchen_*"]),
+        # Case 4c
+        ([], ["sun.sun", "light.kitchen"], [], ["switch.garage"], [], []),
+    ],
+)
+def test_sql_predicate_matches_entity_filter(hass_recorder, filter_args):
+    """Test the sql predicate selects the same entities as the filter."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    now = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        for entity_id in ENTITY_IDS:
+            session.add(
+                States(
+                    entity_id=entity_id,
+                    domain=entity_id.split(".")[0],
+                    state="on",
+                    last_changed=now,
+                    last_updated=now,
+                )
+            )
+
+    entity_filter = generate_filter(*filter_args)
+    predicate = sqlalchemy_filter_from_entity_filter(entity_filter)
+    assert predicate is not None
+
+    with session_scope(hass=hass) as session:
+        selected = {
+            entity_id
+            for (entity_id,) in session.query(States.entity_id).filter(predicate)
+        }
+
+    assert selected == {
+        entity_id for entity_id in ENTITY_IDS if entity_filter(entity_id)
+    }
+
+
+def test_sql_predicate_not_expressible():
+    """Test filters that can not be expressed in sql."""
+    assert sqlalchemy_filter_from_entity_filter(generate_filter([], [], [], [])) is None
+    assert (
+        sqlalchemy_filter_from_entity_filter(
+            generate_filter([], [], [], [], ["light.[ab]*"])
+        )
+        is None
+    )
+    assert (
+        sqlalchemy_filter_from_entity_filter(generate_filter(["Light"], [], [], []))
+        is None
+    )
+    assert sqlalchemy_filter_from_entity_filter(lambda entity_id: True) is None
@@ -7,6 +7,7 @@ from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -130,6 +131,62 @@ def test_get_last_state_changes(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_states_for_requests(hass_recorder):
+    """Test answering several state requests with one query."""
+    hass = hass_recorder()
+
+    def set_state(entity_id, state, **attributes):
+        """Set the state."""
+        hass.states.set(entity_id, state, attributes)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    start = dt_util.utcnow() - timedelta(minutes=2)
+    point = start + timedelta(minutes=1)
+    point2 = point + timedelta(minutes=1)
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=start):
+        sensor_1 = set_state("sensor.one", "1")
+        set_state("sensor.two", "a")
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=point):
+        sensor_2 = set_state("sensor.one", "2")
+        set_state("sensor.two", "b")
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=point + timedelta(seconds=30),
+    ):
+        # Only an attribute changes
+        sensor_2_attr = set_state("sensor.one", "2", unit="W")
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=point2):
+        sensor_3 = set_state("sensor.one", "3")
+        two_c = set_state("sensor.two", "c")
+
+    requests = [
+        history.StateRequest("sensor.one", number_of_states=2),
+        history.StateRequest("sensor.two", number_of_states=1),
+        history.StateRequest(
+            "sensor.one",
+            start_time=point + timedelta(seconds=40),
+            include_start_state=True,
+        ),
+        history.StateRequest("sensor.one", state_changes_only=False),
+        history.StateRequest("sensor.missing", number_of_states=5),
+        # Without a start time there is no start state to include
+        history.StateRequest("sensor.two", include_start_state=True),
+    ]
+    with patch.object(history, "MAX_STATE_REQUESTS_PER_QUERY", 2):
+        results = history.get_states_for_requests(hass, requests)
+
+    assert results[0] == [sensor_2, sensor_3]
+    assert results[1] == [two_c]
+    start_state = copy(sensor_2_attr)
+    start_state.last_changed = start_state.last_updated = point + timedelta(seconds=40)
+    assert results[2] == [start_state, sensor_3]
+    assert results[3] == [sensor_1, sensor_2, sensor_2_attr, sensor_3]
+    assert results[4] == []
+    assert [state.state for state in results[5]] == ["a", "b", "c"]
+
+
 def test_ensure_state_can_be_copied(hass_recorder):
     """Ensure a state can pass though copy().
 
@@ -173,6 +230,27 @@ def test_get_significant_states(hass_recorder):
     assert states == hist
 
 
+def test_get_significant_state_rows(hass_recorder):
+    """Test the raw rows match the significant states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    entity_ids = ["media_player.test", "thermostat.test"]
+    rows = history.get_significant_state_rows(hass, zero, four, entity_ids)
+    assert {
+        entity_id: [
+            (state, json.loads(attributes), process_timestamp(last_updated))
+            for state, attributes, last_updated in entity_rows
+        ]
+        for entity_id, entity_rows in rows.items()
+    } == {
+        entity_id: [
+            (state.state, dict(state.attributes), state.last_updated)
+            for state in states[entity_id]
+        ]
+        for entity_id in entity_ids
+    }
+
+
 def test_get_significant_states_minimal_response(hass_recorder):
     """Test that only significant states are returned.
 
@@ -307,6 +385,44 @@ def test_get_significant_states_are_ordered(hass_recorder):
     assert list(hist.keys()) == entity_ids
 
 
+def test_stream_significant_states(hass_recorder):
+    """Test streamed states match the significant states."""
+    hass = hass_recorder()
+    zero, four, _states = record_states(hass)
+    one_and_half = zero + timedelta(seconds=1.5)
+
+    for start_time, entity_ids, minimal_response in (
+        (zero, None, False),
+        (one_and_half, None, True),
+        (zero, ["thermostat.test", "media_player.test2"], False),
+        (one_and_half, ["media_player.test3", "media_player.test"], True),
+    ):
+        hist = history.get_significant_states(
+            hass, start_time, four, entity_ids, minimal_response=minimal_response
+        )
+        with session_scope(hass=hass) as session, patch.object(
+            history, "STREAM_BATCH_SIZE", 1
+        ), patch.object(
+            history,
+            "_significant_states_query",
+            wraps=history._significant_states_query,
+        ) as query_mock:
+            streamed = list(
+                history.stream_significant_states(
+                    hass,
+                    session,
+                    start_time,
+                    four,
+                    entity_ids,
+                    minimal_response=minimal_response,
+                )
+            )
+        assert len(query_mock.mock_calls) == 1
+        assert dict(streamed) == hist
+        if entity_ids is not None:
+            assert [entity_id for entity_id, _ in streamed] == list(hist)
+
+
 def test_get_significant_states_only(hass_recorder):
     """Test significant states when significant_states_only is set."""
     hass = hass_recorder()
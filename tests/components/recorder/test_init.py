@@ -10,6 +10,7 @@ from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
+    CONF_BULK_WRITE,
     CONF_DB_URL,
     CONFIG_SCHEMA,
     DOMAIN,
@@ -25,7 +26,13 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsRuns,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -40,6 +47,7 @@ from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
 
 from .common import (
+    async_recorder_block_till_done,
     async_wait_recording_done,
     async_wait_recording_done_without_instance,
     corrupt_db_file,
@@ -61,7 +69,9 @@ def _default_recorder(hass):
         hass,
         auto_purge=True,
         keep_days=7,
+        short_term_statistics_keep_days=7,
         commit_interval=1,
+        bulk_write=False,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
@@ -193,6 +203,47 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id > 0
 
 
+async def test_commit_and_keep_alive_intervals(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the recorder commits and sends keep alives on its own timers."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    with patch.object(
+        instance, "_commit_event_session_or_retry"
+    ) as commit_mock, patch.object(instance, "_send_keep_alive") as keep_alive_mock:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await async_recorder_block_till_done(hass, instance)
+        assert commit_mock.called
+        assert not keep_alive_mock.called
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=KEEPALIVE_TIME)
+        )
+        await async_recorder_block_till_done(hass, instance)
+        assert keep_alive_mock.called
+
+
+async def test_wait_committed(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test waiting until the states set so far are committed."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 1000}
+    )
+    await async_wait_recording_done(hass, instance)
+
+    hass.states.async_set("test.one", "on")
+    await instance.async_wait_committed()
+
+    def _get_states():
+        with session_scope(hass=hass) as session:
+            return [state.state for state in session.query(States)]
+
+    assert await hass.async_add_executor_job(_get_states) == ["on"]
+
+
 def test_saving_state_with_exception(hass, hass_recorder, caplog):
     """Test saving and restoring a state."""
     hass = hass_recorder()
@@ -694,44 +745,71 @@ def test_auto_statistics(hass_recorder):
     tz = dt_util.get_time_zone("Europe/Copenhagen")
     dt_util.set_default_time_zone(tz)
 
-    # Statistics is scheduled to happen at *:12am every hour. Exercise this behavior by
+    # Statistics is scheduled to happen every 5 minutes. Exercise this behavior by
     # firing time changed events and advancing the clock around this time. Pick an
     # arbitrary year in the future to avoid boundary conditions relative to the current
     # date.
     #
-    # The clock is started at 4:15am then advanced forward below
+    # The clock is started at 4:16am then advanced forward below
     now = dt_util.utcnow()
-    test_time = datetime(now.year + 2, 1, 1, 4, 15, 0, tzinfo=tz)
-    run_tasks_at_time(hass, test_time)
+    test_time = datetime(now.year + 2, 1, 1, 4, 16, 0, tzinfo=tz)
+
+    # The statistics are compiled up to the period before the test starts
+    wait_recording_done(hass)
+    with session_scope(hass=hass) as session:
+        session.add(
+            StatisticsRuns(start=dt_util.as_utc(test_time) - timedelta(minutes=6))
+        )
+
+    def compile_statistics_mock(instance, start):
+        with session_scope(hass=hass) as session:
+            session.add(StatisticsRuns(start=start))
+        return True
+
+    with patch(
+        "homeassistant.components.recorder.statistics.dt_util.utcnow",
+        side_effect=lambda: dt_util.as_utc(test_time),
+    ):
+        run_tasks_at_time(hass, test_time)
 
     with patch(
+        "homeassistant.components.recorder.statistics.dt_util.utcnow",
+        side_effect=lambda: dt_util.as_utc(test_time),
+    ), patch(
         "homeassistant.components.recorder.statistics.compile_statistics",
-        return_value=True,
+        side_effect=compile_statistics_mock,
     ) as compile_statistics:
-        # Advance one hour, and the statistics task should run
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
         compile_statistics.reset_mock()
 
-        # Advance one hour, and the statistics task should run again
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run again
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
         compile_statistics.reset_mock()
 
-        # Advance less than one full hour. The task should not run.
-        test_time = test_time + timedelta(minutes=50)
+        # Advance less than 5 minutes. The task should not run.
+        test_time = test_time + timedelta(minutes=3)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 0
 
-        # Advance to the next hour, and the statistics task should run again
-        test_time = test_time + timedelta(hours=1)
+        # Advance 5 minutes, and the statistics task should run again
+        test_time = test_time + timedelta(minutes=5)
         run_tasks_at_time(hass, test_time)
         assert len(compile_statistics.mock_calls) == 1
 
+        compile_statistics.reset_mock()
+
+        # Advance 20 minutes at once, and the missed periods are compiled too
+        test_time = test_time + timedelta(minutes=20)
+        run_tasks_at_time(hass, test_time)
+        assert len(compile_statistics.mock_calls) == 4
+
     dt_util.set_default_time_zone(original_tz)
 
 
@@ -785,6 +863,126 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
     assert "State is not JSON serializable" in caplog.text
 
 
+@pytest.mark.parametrize("bulk_write", [False, True])
+def test_saving_states_shares_attributes(hass_recorder, bulk_write):
+    """Test states with the same attributes share one attributes row."""
+    hass = hass_recorder({CONF_BULK_WRITE: bulk_write})
+
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+    hass.states.set("sensor.one", "1", attributes)
+    hass.states.set("sensor.two", "1", attributes)
+    hass.states.set("sensor.one", "2", attributes)
+    wait_recording_done(hass)
+    hass.states.set("sensor.one", "3", attributes)
+    hass.states.set("sensor.two", "2", {"friendly_name": "Other"})
+    hass.states.async_remove("sensor.one")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        state_attributes = {
+            attrs.attributes_id: attrs for attrs in session.query(StateAttributes)
+        }
+        assert len(state_attributes) == 3
+
+        states = list(session.query(States))
+        assert len(states) == 6
+        assert len({state.attributes_id for state in states[:4]}) == 1
+        for state in states:
+            assert state.attributes is None
+            dbattrs = state_attributes[state.attributes_id]
+            assert dbattrs.hash == StateAttributes.hash_shared_attrs(
+                dbattrs.shared_attrs
+            )
+        assert states[0].to_native().attributes == attributes
+        assert states[4].to_native().attributes == {"friendly_name": "Other"}
+        assert states[5].to_native().attributes == {}
+        attributes_id = states[0].attributes_id
+
+    # Attributes of a new session are found in the database
+    hass.data[DATA_INSTANCE]._state_attributes_ids.clear()
+    hass.states.set("sensor.three", "1", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 3
+        state = session.query(States).filter(States.entity_id == "sensor.three").one()
+        assert state.attributes_id == attributes_id
+
+
+def test_saving_states_with_bulk_write(hass_recorder):
+    """Test saving states and events with bulk write."""
+    hass = hass_recorder({CONF_BULK_WRITE: True})
+    assert hass.data[DATA_INSTANCE].bulk_write
+
+    hass.bus.fire("custom_event", {"some": "data"})
+    hass.states.set("test.one", "on", {"attr": 1})
+    hass.states.set("test.two", "on", {})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"attr": 2})
+    hass.states.async_remove("test.two")
+    wait_recording_done(hass)
+    hass.states.set("test.two", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        events = {
+            event.event_id: event
+            for event in session.query(Events).filter(
+                Events.event_type.in_(["custom_event", "state_changed"])
+            )
+        }
+        assert len(events) == 6
+        custom_event = next(
+            event for event in events.values() if event.event_type == "custom_event"
+        )
+        assert custom_event.to_native().data == {"some": "data"}
+
+        states = list(session.query(States))
+        assert len(states) == 5
+        assert [(state.entity_id, state.state) for state in states] == [
+            ("test.one", "on"),
+            ("test.two", "on"),
+            ("test.one", "off"),
+            ("test.two", None),
+            ("test.two", "on"),
+        ]
+        for state in states:
+            assert events[state.event_id].event_type == "state_changed"
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[2].to_native().attributes == {"attr": 2}
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id is None
+
+
+def test_bulk_write_recovers_after_exception(hass_recorder, caplog):
+    """Test bulk write continues with fresh ids after the session is reset."""
+    hass = hass_recorder({CONF_BULK_WRITE: True})
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with patch.object(
+        hass.data[DATA_INSTANCE].event_session,
+        "commit",
+        side_effect=SQLAlchemyError("forced to fail"),
+    ):
+        hass.states.set("test.one", "fail", {})
+        wait_recording_done(hass)
+
+    assert "SQLAlchemyError error processing event" in caplog.text
+
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert [state.state for state in states] == ["on", "off"]
+        assert states[1].state_id == states[0].state_id + 1
+        assert states[1].old_state_id is None
+
+
 def test_run_information(hass_recorder):
     """Ensure run_information returns expected data."""
     before_start_recording = dt_util.utcnow()
@@ -0,0 +1,54 @@
+"""Test the batched loading of recorded states."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import history, preload
+
+from tests.common import async_init_recorder_component
+from tests.components.recorder.common import async_wait_recording_done_without_instance
+
+
+async def test_requests_are_batched(hass):
+    """Test concurrent requests are answered with one call."""
+    await async_init_recorder_component(hass)
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "a")
+    await async_wait_recording_done_without_instance(hass)
+
+    with patch.object(
+        history, "get_states_for_requests", wraps=history.get_states_for_requests
+    ) as get_states_for_requests:
+        one, two, missing = await asyncio.gather(
+            preload.async_get_states(hass, "sensor.one", number_of_states=5),
+            preload.async_get_states(hass, "sensor.two", number_of_states=5),
+            preload.async_get_states(hass, "sensor.missing", number_of_states=5),
+        )
+
+    assert len(get_states_for_requests.mock_calls) == 1
+    assert [state.state for state in one] == ["1"]
+    assert [state.state for state in two] == ["a"]
+    assert missing == []
+
+
+async def test_errors_are_raised_to_all_requests(hass):
+    """Test a failed query is raised to every waiting request."""
+    with patch.object(
+        history, "get_states_for_requests", side_effect=RuntimeError("Boom")
+    ):
+        results = await asyncio.gather(
+            preload.async_get_states(hass, "sensor.one"),
+            preload.async_get_states(hass, "sensor.two"),
+            return_exceptions=True,
+        )
+
+    assert len(results) == 2
+    for result in results:
+        assert isinstance(result, RuntimeError)
+
+    with pytest.raises(RuntimeError):
+        with patch.object(
+            history, "get_states_for_requests", side_effect=RuntimeError("Boom")
+        ):
+            await preload.async_get_states(hass, "sensor.one")
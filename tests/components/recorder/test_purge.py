@@ -10,7 +10,16 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsMeta,
+    StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -154,6 +163,105 @@ async def test_purge_old_states_encounters_operational_error(
     assert "Error executing purge" in caplog.text
 
 
+async def test_purge_unused_state_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test shared attributes are deleted once no state uses them."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with recorder.session_scope(hass=hass) as session:
+        old_attrs = StateAttributes.from_shared_attrs('{"old":true}')
+        shared_attrs = StateAttributes.from_shared_attrs('{"shared":true}')
+        for timestamp, dbattrs in (
+            (eleven_days_ago, old_attrs),
+            (eleven_days_ago, old_attrs),
+            (eleven_days_ago, shared_attrs),
+            (utcnow, shared_attrs),
+        ):
+            event = Events(
+                event_type="state_changed",
+                event_data="{}",
+                origin="LOCAL",
+                created=timestamp,
+                time_fired=timestamp,
+            )
+            session.add(
+                States(
+                    entity_id="test.recorder2",
+                    domain="sensor",
+                    state="on",
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                    created=timestamp,
+                    event=event,
+                    state_attributes=dbattrs,
+                )
+            )
+        session.flush()
+        old_attributes_id = old_attrs.attributes_id
+        shared_attributes_id = shared_attrs.attributes_id
+
+    instance._state_attributes_ids['{"old":true}'] = old_attributes_id
+
+    with session_scope(hass=hass) as session:
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+
+        states = session.query(States)
+        assert states.count() == 1
+        assert states[0].attributes_id == shared_attributes_id
+        assert states[0].to_native().attributes == {"shared": True}
+
+        state_attributes = session.query(StateAttributes)
+        assert [attrs.attributes_id for attrs in state_attributes] == [
+            shared_attributes_id
+        ]
+
+    assert '{"old":true}' not in instance._state_attributes_ids
+
+
+async def test_purge_short_term_statistics(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test short term statistics are purged with their own retention."""
+    instance = await async_setup_recorder_instance(
+        hass, {"short_term_statistics_keep_days": 3}
+    )
+    await async_wait_recording_done(hass, instance)
+
+    utcnow = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        metadata = StatisticsMeta.from_meta("recorder", "sensor.test", "W", True, False)
+        session.add(metadata)
+        session.flush()
+        for days in (5, 4, 2, 1):
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    metadata.id,
+                    utcnow - timedelta(days=days),
+                    {"mean": 1.0, "min": 1.0, "max": 1.0},
+                )
+            )
+
+    with session_scope(hass=hass) as session:
+        # States and events are kept for 10 days, short term statistics for 3
+        purge_before = utcnow - timedelta(days=10)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+
+        statistics = session.query(StatisticsShortTerm)
+        assert statistics.count() == 2
+        assert all(
+            process_timestamp(statistic.start) >= utcnow - timedelta(days=3)
+            for statistic in statistics
+        )
+
+
 async def test_purge_old_events(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -203,6 +311,29 @@ async def test_purge_old_recorder_runs(
         assert recorder_runs.count() == 1
 
 
+async def test_purge_old_statistics_runs(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old statistics runs keeps the last run."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    now = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        session.query(StatisticsRuns).delete()
+        for days in (20, 15, 12):
+            session.add(StatisticsRuns(start=now - timedelta(days=days)))
+
+    with session_scope(hass=hass) as session:
+        finished = purge_old_data(instance, now - timedelta(days=14), repack=False)
+        assert finished
+        assert session.query(StatisticsRuns).count() == 1
+
+        while not purge_old_data(instance, now, repack=False):
+            pass
+        assert session.query(StatisticsRuns).count() == 1
+
+
 async def test_purge_method(
     hass: HomeAssistant,
     async_setup_recorder_instance: SetupRecorderInstanceT,
@@ -7,11 +7,22 @@ from pytest import approx
 
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.models import (
+    StatisticsMeta,
+    StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp_to_utc_isoformat,
+)
 from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
     get_last_statistics,
+    get_latest_statistics,
+    get_missing_periods,
+    get_start_time,
     statistics_during_period,
 )
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import TEMP_CELSIUS
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -35,8 +46,8 @@ def test_compile_hourly_statistics(hass_recorder):
     stats = get_last_statistics(hass, 0, "sensor.test1")
     assert stats == {}
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=four)
     wait_recording_done(hass)
     expected_1 = {
         "statistic_id": "sensor.test1",
@@ -93,6 +104,102 @@ def test_compile_hourly_statistics(hass_recorder):
     stats = get_last_statistics(hass, 1, "sensor.test3")
     assert stats == {}
 
+    # Test get_latest_statistics
+    stats = get_latest_statistics(hass, ["sensor.test1", "sensor.test2"])
+    assert stats == {
+        "sensor.test1": [{**expected_2, "statistic_id": "sensor.test1"}],
+        "sensor.test2": [{**expected_2, "statistic_id": "sensor.test2"}],
+    }
+
+    stats = get_latest_statistics(hass, ["sensor.test3"])
+    assert stats == {}
+
+
+def test_compile_periodic_statistics(hass_recorder):
+    """Test the 5-minute statistics are summarized when the hour is complete."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states(hass, zero, four)
+    assert dict(states) == dict(hist)
+
+    hour_start = (zero + timedelta(minutes=1)).replace(
+        minute=0, second=0, microsecond=0
+    )
+    for i in range(11):
+        recorder.do_adhoc_statistics(start=hour_start + timedelta(minutes=5 * i))
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, hour_start, period=PERIOD_5MINUTE)
+    assert stats["sensor.test1"]
+    assert statistics_during_period(hass, hour_start) == {}
+
+    recorder.do_adhoc_statistics(start=hour_start + timedelta(minutes=55))
+    wait_recording_done(hass)
+
+    short_term = statistics_during_period(hass, hour_start, period=PERIOD_5MINUTE)
+    stats = statistics_during_period(hass, hour_start)
+    for statistic_id in ("sensor.test1", "sensor.test2"):
+        # The 5-minute means are weighted by the seconds they cover
+        with session_scope(hass=hass) as session:
+            weighted = [
+                (row.mean * row.mean_duration, row.mean_duration)
+                for row in session.query(StatisticsShortTerm)
+                .join(StatisticsMeta)
+                .filter(StatisticsMeta.statistic_id == statistic_id)
+            ]
+        assert stats[statistic_id] == [
+            {
+                "statistic_id": statistic_id,
+                "start": process_timestamp_to_utc_isoformat(hour_start),
+                "mean": approx(
+                    sum(i[0] for i in weighted) / sum(i[1] for i in weighted)
+                ),
+                "min": approx(min(stat["min"] for stat in short_term[statistic_id])),
+                "max": approx(max(stat["max"] for stat in short_term[statistic_id])),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+
+
+def test_missing_periods(hass_recorder):
+    """Test finding the periods that are not compiled yet."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    last_period = get_start_time()
+
+    with patch(
+        "homeassistant.components.recorder.statistics.get_start_time",
+        return_value=last_period,
+    ), session_scope(hass=hass) as session:
+        session.query(StatisticsRuns).delete()
+        # Without any run only the last period is compiled
+        assert get_missing_periods(session, last_period - timedelta(days=1)) == [
+            last_period
+        ]
+
+        session.add(StatisticsRuns(start=last_period - timedelta(minutes=20)))
+        session.flush()
+        assert get_missing_periods(session, last_period - timedelta(days=1)) == [
+            last_period - timedelta(minutes=15),
+            last_period - timedelta(minutes=10),
+            last_period - timedelta(minutes=5),
+            last_period,
+        ]
+        # Periods before oldest are not compiled
+        assert get_missing_periods(session, last_period - timedelta(minutes=7)) == [
+            last_period - timedelta(minutes=10),
+            last_period - timedelta(minutes=5),
+            last_period,
+        ]
+
+        session.add(StatisticsRuns(start=last_period))
+        session.flush()
+        assert get_missing_periods(session, last_period - timedelta(days=1)) == []
+
 
 def test_rename_entity(hass_recorder):
     """Test statistics is migrated when entity_id is changed."""
@@ -119,7 +226,7 @@ def test_rename_entity(hass_recorder):
     stats = get_last_statistics(hass, 0, "sensor.test1")
     assert stats == {}
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
     wait_recording_done(hass)
     expected_1 = {
         "statistic_id": "sensor.test1",
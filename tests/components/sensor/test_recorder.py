@@ -10,6 +10,7 @@ from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
 from homeassistant.components.recorder.statistics import (
+    PERIOD_HOUR,
     list_statistic_ids,
     statistics_during_period,
 )
@@ -75,7 +76,7 @@ def test_compile_hourly_statistics(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -125,7 +126,7 @@ def test_compile_hourly_statistics_unsupported(hass_recorder, caplog, attributes
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -182,11 +183,11 @@ def test_compile_hourly_energy_statistics(
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero + timedelta(hours=1))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero + timedelta(hours=2))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -269,11 +270,11 @@ def test_compile_hourly_energy_statistics_unsupported(hass_recorder, caplog):
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero + timedelta(hours=1))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero + timedelta(hours=2))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -350,11 +351,11 @@ def test_compile_hourly_energy_statistics_multiple(hass_recorder, caplog):
     )
     assert dict(states)["sensor.test1"] == dict(hist)["sensor.test1"]
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=1))
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero + timedelta(hours=1))
     wait_recording_done(hass)
-    recorder.do_adhoc_statistics(period="hourly", start=zero + timedelta(hours=2))
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero + timedelta(hours=2))
     wait_recording_done(hass)
     statistic_ids = list_statistic_ids(hass)
     assert statistic_ids == [
@@ -497,7 +498,7 @@ def test_compile_hourly_statistics_unchanged(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=four)
     wait_recording_done(hass)
     stats = statistics_during_period(hass, four)
     assert stats == {
@@ -529,7 +530,7 @@ def test_compile_hourly_statistics_partially_unavailable(hass_recorder, caplog):
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
     wait_recording_done(hass)
     stats = statistics_during_period(hass, zero)
     assert stats == {
@@ -586,7 +587,7 @@ def test_compile_hourly_statistics_unavailable(
     hist = history.get_significant_states(hass, zero, four)
     assert dict(states) == dict(hist)
 
-    recorder.do_adhoc_statistics(period="hourly", start=four)
+    recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=four)
     wait_recording_done(hass)
     stats = statistics_during_period(hass, four)
     assert stats == {
@@ -616,7 +617,7 @@ def test_compile_hourly_statistics_fails(hass_recorder, caplog):
         "homeassistant.components.sensor.recorder.compile_statistics",
         side_effect=Exception,
     ):
-        recorder.do_adhoc_statistics(period="hourly", start=zero)
+        recorder.do_adhoc_statistics(period=PERIOD_HOUR, start=zero)
         wait_recording_done(hass)
     assert "Error while processing event StatisticsTask" in caplog.text
 
@@ -0,0 +1,58 @@
+"""Test the incrementally updated statistics."""
+from collections import deque
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.rolling import RollingStatistics
+
+
+@pytest.mark.parametrize("method", ["exclusive", "inclusive"])
+def test_matches_statistics_module(method):
+    """Test the results match the statistics module over a sliding window."""
+    rng = random.Random(42)
+    rolling = RollingStatistics()
+    window = deque()
+
+    for _ in range(500):
+        if len(window) == 50 or (window and rng.random() < 0.2):
+            rolling.remove(window.popleft())
+        value = round(rng.uniform(-1000, 1000), rng.randint(0, 3))
+        window.append(value)
+        rolling.add(value)
+
+        assert len(rolling) == len(window)
+        assert rolling.mean == pytest.approx(statistics.mean(window))
+        assert rolling.median == statistics.median(window)
+        assert rolling.total == pytest.approx(sum(window))
+        assert rolling.min == min(window)
+        assert rolling.max == max(window)
+        if len(window) > 1:
+            assert rolling.variance == pytest.approx(statistics.variance(window))
+            assert rolling.stdev == pytest.approx(statistics.stdev(window))
+            assert rolling.quantiles(4, method) == pytest.approx(
+                statistics.quantiles(window, n=4, method=method)
+            )
+
+
+def test_not_enough_data_points():
+    """Test errors are raised like the statistics module."""
+    rolling = RollingStatistics()
+
+    with pytest.raises(statistics.StatisticsError):
+        rolling.mean
+    with pytest.raises(statistics.StatisticsError):
+        rolling.median
+
+    rolling.add(5.0)
+    assert rolling.mean == 5.0
+    assert rolling.median == 5.0
+    with pytest.raises(statistics.StatisticsError):
+        rolling.variance
+    with pytest.raises(statistics.StatisticsError):
+        rolling.quantiles(4, "exclusive")
+
+    rolling.remove(5.0)
+    assert len(rolling) == 0
+    assert rolling.total == 0.0
@@ -7,7 +7,7 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import const, messages
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -18,7 +18,7 @@ from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.loader import async_get_integration
+from homeassistant.loader import DATA_IMPORT_TIME, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
@@ -600,6 +600,134 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe_entities sends compressed states and diffs."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.other": True}}}
+    )
+    hass.states.async_set("light.not_permitted", "off")
+    hass.states.async_set("light.permitted", "off", {"color": "red", "brightness": 5})
+    state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red", "brightness": 5},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"color": "blue"},
+                    "c": state.context.id,
+                    "lc": state.last_changed.timestamp(),
+                },
+                "-": {"a": ["brightness"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.permitted", "on", {"color": "green"})
+    state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"color": "green"},
+                    "c": state.context.id,
+                    "lu": state.last_updated.timestamp(),
+                }
+            }
+        }
+    }
+
+    hass.states.async_set("light.other", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.other"]
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribe_entities only sends the requested entities."""
+    hass.states.async_set("light.wanted", "off")
+    hass.states.async_set("light.unwanted", "off")
+    init_count = sum(hass.bus.async_listeners().values())
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.wanted"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.wanted"]
+
+    hass.states.async_set("light.unwanted", "on")
+    hass.states.async_set("light.wanted", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"light.wanted": {"+": ANY}}}
+    assert msg["event"]["c"]["light.wanted"]["+"]["s"] == "on"
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_state_diff_message_serialized_once(hass):
+    """Test the diff of a state change is shared across subscriptions."""
+    hass.states.async_set("light.kitchen", "off")
+    events = []
+    hass.bus.async_listen("state_changed", events.append)
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.websocket_api.messages.message_to_json",
+        wraps=messages.message_to_json,
+    ) as mock_to_json:
+        first = messages.cached_state_diff_message(1, events[0])
+        second = messages.cached_state_diff_message(2, events[0])
+
+    assert len(mock_to_json.mock_calls) == 1
+    assert first.replace('"id": 1', '"id": 2', 1) == second
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -1179,6 +1307,7 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": 1.5, "august.lock": 0.25}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1186,6 +1315,6 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.75},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": 0},
     ]
@@ -6,6 +6,7 @@ from aiohttp import WSMsgType
 import pytest
 
 from homeassistant.components.websocket_api import const, http
+from homeassistant.components.websocket_api.auth import TYPE_AUTH, TYPE_AUTH_OK
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -63,6 +64,7 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     msg = await websocket_client.receive()
     assert msg.type == WSMsgType.close
 
+    assert "Client is falling behind with 6 pending messages" in caplog.text
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
@@ -80,3 +82,46 @@ async def test_non_json_message(hass, websocket_client, caplog):
         f"Unable to serialize to JSON. Bad data found at $.result[0](State: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
         in caplog.text
     )
+
+
+async def test_coalesce_messages(hass, no_auth_websocket_client, hass_access_token):
+    """Test pending messages are sent in one frame when the client supports it."""
+    await no_auth_websocket_client.send_json(
+        {
+            "type": TYPE_AUTH,
+            "access_token": hass_access_token,
+            "supported_features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    auth_ok = await no_auth_websocket_client.receive_json()
+    assert auth_ok["type"] == TYPE_AUTH_OK
+
+    await no_auth_websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    msg = await no_auth_websocket_client.receive_json()
+    assert isinstance(msg, list)
+    assert [event["event"]["data"]["idx"] for event in msg] == [0, 1, 2]
+
+
+async def test_no_coalesce_messages(hass, websocket_client):
+    """Test messages are sent in separate frames by default."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    for idx in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["data"]["idx"] == idx
@@ -389,6 +389,34 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_reverse_indexes(registry):
+    """Test devices are indexed by area and config entry."""
+    entry = registry.async_get_or_create(
+        config_entry_id="123",
+        identifiers={("bridgeid", "0123")},
+        manufacturer="manufacturer",
+        model="model",
+    )
+    registry.async_get_or_create(
+        config_entry_id="456", identifiers={("bridgeid", "0123")}
+    )
+    registry.async_update_device(entry.id, area_id="kitchen")
+
+    assert registry.async_device_ids_for_area("kitchen") == [entry.id]
+    assert registry.async_device_ids_for_config_entry("123") == [entry.id]
+    assert registry.async_device_ids_for_config_entry("456") == [entry.id]
+
+    registry.async_clear_config_entry("123")
+    assert registry.async_device_ids_for_config_entry("123") == []
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        registry.async_get(entry.id)
+    ]
+
+    registry.async_remove_device(entry.id)
+    assert registry.async_device_ids_for_area("kitchen") == []
+    assert registry.async_device_ids_for_config_entry("456") == []
+
+
 async def test_deleted_device_removing_area_id(registry):
     """Make sure we can clear area id of deleted device."""
     entry = registry.async_get_or_create(
@@ -652,6 +652,54 @@ async def test_capability_attrs(hass):
     assert state.attributes["always"] == "there"
 
 
+async def test_cached_static_attributes(hass):
+    """Test static attributes are only assembled again when invalidated."""
+
+    class CachedEntity(entity.Entity):
+        """Entity caching its static attributes."""
+
+        _attr_icon = "mdi:one"
+        _attr_name = "Cached"
+        _cache_static_attributes = True
+
+        @property
+        def state_attributes(self):
+            """Return the dynamic state attributes."""
+            return {"value": self._attr_state}
+
+    ent = CachedEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state = 1
+    ent.async_write_ha_state()
+
+    ent._attr_icon = "mdi:two"
+    ent._attr_state = 2
+    ent.async_write_ha_state()
+
+    state = hass.states.get("hello.world")
+    assert state.state == "2"
+    assert state.attributes == {
+        "value": 2,
+        "friendly_name": "Cached",
+        "icon": "mdi:one",
+    }
+
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["icon"] == "mdi:two"
+
+    # A registry update changes the registry entry and is picked up
+    ent.registry_entry = entity_registry.RegistryEntry(
+        entity_id="hello.world",
+        unique_id="hello",
+        platform="test",
+        name="From registry",
+    )
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["friendly_name"] == "From registry"
+
+
 async def test_warn_slow_write_state(hass, caplog):
     """Check that we log a warning if reading properties takes too long."""
     mock_entity = entity.Entity()
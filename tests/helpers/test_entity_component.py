@@ -493,6 +493,35 @@ async def test_register_entity_service(hass):
     assert len(calls) == 2
 
 
+async def test_entity_index(hass):
+    """Test entities of all platforms are indexed by entity id."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({})
+    await component.async_add_entities([MockEntity(entity_id=f"{DOMAIN}.one")])
+
+    mock_entity_platform(
+        hass,
+        f"{DOMAIN}.platform",
+        MockPlatform(
+            async_setup_platform=AsyncMock(
+                side_effect=lambda hass, config, add_entities, discovery_info: (
+                    add_entities([MockEntity(entity_id=f"{DOMAIN}.two")])
+                )
+            )
+        ),
+    )
+    await component.async_setup_platform("platform", {})
+    await hass.async_block_till_done()
+
+    assert component.get_entity(f"{DOMAIN}.one").entity_id == f"{DOMAIN}.one"
+    assert component.get_entity(f"{DOMAIN}.two").entity_id == f"{DOMAIN}.two"
+    assert component.get_entity(f"{DOMAIN}.three") is None
+
+    await component.async_remove_entity(f"{DOMAIN}.two")
+    assert component.get_entity(f"{DOMAIN}.two") is None
+    assert list(component._entities) == [f"{DOMAIN}.one"]
+
+
 async def test_platforms_shutdown_on_stop(hass):
     """Test that we shutdown platforms on stop."""
     platform1_setup = Mock(side_effect=[PlatformNotReady, PlatformNotReady, None])
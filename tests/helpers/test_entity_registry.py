@@ -199,6 +199,30 @@ async def test_loading_saving_data(hass, registry):
     assert new_entry2.original_icon == "hass:original-icon"
 
 
+async def test_saving_journaled_changes(hass, hass_storage):
+    """Test changes after the first save are journaled and loaded again."""
+    registry = er.EntityRegistry(hass)
+    await registry.async_load()
+    registry.async_get_or_create("light", "hue", "1234")
+    registry.async_get_or_create("light", "hue", "5678")
+    await flush_store(registry._store)
+
+    with patch.object(registry, "_data_to_save") as mock_data_to_save:
+        registry.async_update_entity("light.hue_1234", new_entity_id="light.kitchen")
+        registry.async_remove("light.hue_5678")
+        await flush_store(registry._store)
+
+    assert not mock_data_to_save.called
+    assert [
+        entity["entity_id"]
+        for entity in hass_storage[er.STORAGE_KEY]["data"]["entities"]
+    ] == ["light.kitchen"]
+
+    registry2 = er.EntityRegistry(hass)
+    await registry2.async_load()
+    assert list(registry2.entities) == ["light.kitchen"]
+
+
 def test_generate_entity_considers_registered_entities(registry):
     """Test that we don't create entity id that are already registered."""
     entry = registry.async_get_or_create("light", "hue", "1234")
@@ -352,6 +376,38 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_reverse_indexes(registry):
+    """Test entries are indexed by area, device and config entry."""
+    entry = registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        config_entry=MockConfigEntry(entry_id="mock-id-1"),
+        device_id="dev1",
+    )
+    registry.async_update_entity(entry.entity_id, area_id="kitchen")
+
+    assert registry.async_entity_ids_for_area("kitchen") == [entry.entity_id]
+    assert registry.async_entity_ids_for_device("dev1") == [entry.entity_id]
+    assert registry.async_entity_ids_for_config_entry("mock-id-1") == [entry.entity_id]
+
+    registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", area_id="bedroom"
+    )
+    assert registry.async_entity_ids_for_area("kitchen") == []
+    assert registry.async_entity_ids_for_area("bedroom") == ["light.renamed"]
+    assert registry.async_entity_ids_for_device("dev1") == ["light.renamed"]
+    assert er.async_entries_for_area(registry, "bedroom") == [
+        registry.async_get("light.renamed")
+    ]
+
+    registry.async_remove("light.renamed")
+    assert registry.async_entity_ids_for_area("bedroom") == []
+    assert registry.async_entity_ids_for_device("dev1") == []
+    assert registry.async_entity_ids_for_config_entry("mock-id-1") == []
+    assert registry._area_index == {}
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_migration(hass):
     """Test migration from old data to new."""
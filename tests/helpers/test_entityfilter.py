@@ -248,3 +248,28 @@ def test_filter_schema_include_exclude():
     }
     filt = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_filter_memoized():
+    """Test decisions are memoized and the args exposed."""
+    testfilter = generate_filter(
+        ["light"], ["sensor.power"], [], ["light.hall"], ["cover.*_window"], []
+    )
+
+    assert testfilter("light.kitchen")
+    assert testfilter("light.kitchen")
+    assert testfilter("light.hall") is False
+    assert testfilter("cover.bedroom_window")
+    assert testfilter.cache_info().hits == 1
+    assert testfilter.spec.include_domains == frozenset({"light"})
+    assert testfilter.spec.include_entity_globs == frozenset({"cover.*_window"})
+
+
+def test_filter_globs_combined():
+    """Test multiple globs are matched as a single pattern."""
+    testfilter = generate_filter([], [], [], [], ["cover.*_window", "light.?ab"], [])
+
+    assert testfilter("cover.bedroom_window")
+    assert testfilter("light.lab")
+    assert testfilter("light.labs") is False
+    assert testfilter("cover.window") is False
@@ -10,12 +10,13 @@ import jinja2
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import ATTR_SECONDS, EVENT_TIMER_OUT_OF_SYNC, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_TIME_PATTERN_SCHEDULER,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
@@ -41,7 +42,7 @@ from homeassistant.helpers.template import Template
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.common import async_fire_time_changed
+from tests.common import async_capture_events, async_fire_time_changed
 
 DEFAULT_TIME_ZONE = dt_util.DEFAULT_TIME_ZONE
 
@@ -2673,6 +2674,167 @@ async def test_async_track_time_change(hass):
     assert len(wildcard_runs) == 3
 
 
+async def test_time_pattern_listeners_share_timer(hass):
+    """Test time pattern listeners that are due together share one timer."""
+    first_runs = []
+    second_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    def active_timers():
+        return [
+            handle
+            for handle in hass.loop._scheduled
+            if isinstance(handle, asyncio.TimerHandle) and not handle.cancelled()
+        ]
+
+    timers = len(active_timers())
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub_first = async_track_utc_time_change(
+            hass, callback(lambda x: first_runs.append(x)), second=0
+        )
+        unsub_second = async_track_utc_time_change(
+            hass, callback(lambda x: second_runs.append(x)), second=[0, 30]
+        )
+
+    assert len(active_timers()) == timers + 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 1
+    assert len(second_runs) == 1
+    assert len(active_timers()) == timers + 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 30, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 1
+    assert len(second_runs) == 2
+
+    unsub_second()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 1, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(first_runs) == 2
+    assert len(second_runs) == 2
+
+    unsub_first()
+    assert len(active_timers()) == timers
+
+
+async def test_time_pattern_listener_removed(hass):
+    """Test removing the earliest time pattern listener rearms the timer."""
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        async_track_utc_time_change(hass, callback(lambda x: None), minute=5)
+        unsubs = [
+            async_track_utc_time_change(hass, callback(lambda x: None), second=0)
+            for _ in range(10)
+        ]
+
+    scheduler = hass.data[TRACK_TIME_PATTERN_SCHEDULER]
+    assert scheduler._timer_due == datetime(
+        now.year + 1, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC
+    )
+
+    for unsub in unsubs:
+        unsub()
+
+    assert scheduler._timer_due == datetime(
+        now.year + 1, 5, 24, 12, 5, 0, tzinfo=dt_util.UTC
+    )
+    # The entries of the removed listeners don't pile up
+    assert len(scheduler._heap) <= 2
+
+
+async def test_time_pattern_timer_out_of_sync(hass):
+    """Test the time pattern timer reports running more than a second late."""
+    out_of_sync = async_capture_events(hass, EVENT_TIMER_OUT_OF_SYNC)
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        async_track_utc_time_change(hass, callback(lambda x: None), second=0)
+
+    scheduler = hass.data[TRACK_TIME_PATTERN_SCHEDULER]
+
+    with patch.object(hass.loop, "time", return_value=scheduler._timer_target + 0.5):
+        async_fire_time_changed(
+            hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999, tzinfo=dt_util.UTC)
+        )
+    await hass.async_block_till_done()
+    assert len(out_of_sync) == 0
+
+    with patch.object(hass.loop, "time", return_value=scheduler._timer_target + 2.5):
+        async_fire_time_changed(
+            hass, datetime(now.year + 1, 5, 24, 12, 1, 0, 999, tzinfo=dt_util.UTC)
+        )
+    await hass.async_block_till_done()
+    assert len(out_of_sync) == 1
+    assert out_of_sync[0].data[ATTR_SECONDS] == pytest.approx(2.5)
+
+
+async def test_time_pattern_listener_error(hass, caplog):
+    """Test a failing time pattern listener does not stop the others."""
+    specific_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    @callback
+    def failing_listener(now):
+        raise ValueError
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub_failing = async_track_utc_time_change(hass, failing_listener, second=0)
+        unsub = async_track_utc_time_change(
+            hass, callback(lambda x: specific_runs.append(x)), second=0
+        )
+
+    for minute in range(2):
+        async_fire_time_changed(
+            hass,
+            datetime(now.year + 1, 5, 24, 12, minute, 0, 999999, tzinfo=dt_util.UTC),
+        )
+        await hass.async_block_till_done()
+
+    assert len(specific_runs) == 2
+    assert "Error while processing time pattern change" in caplog.text
+
+    unsub_failing()
+    unsub()
+
+
 async def test_periodic_task_minute(hass):
     """Test periodic tasks per minute."""
     specific_runs = []
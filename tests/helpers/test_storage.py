@@ -14,7 +14,7 @@ from homeassistant.core import CoreState
 from homeassistant.helpers import storage
 from homeassistant.util import dt
 
-from tests.common import async_fire_time_changed
+from tests.common import async_fire_time_changed, flush_store
 
 MOCK_VERSION = 1
 MOCK_KEY = "storage-test"
@@ -279,3 +279,107 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_journaled_store_writes_changes(hass, hass_storage):
+    """Test a journaled store only writes changed items between full writes."""
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY, "id")
+    data_func = Mock(return_value={"items": [{"id": "a", "value": 1}]})
+
+    # The first write is a full write
+    store.async_record_change("items", "a", {"id": "a", "value": 1})
+    store.async_delay_save(data_func, 1)
+    await flush_store(store)
+    assert data_func.call_count == 1
+    assert hass_storage[MOCK_KEY]["data"] == {"items": [{"id": "a", "value": 1}]}
+
+    store.async_record_change("items", "b", {"id": "b", "value": 2})
+    store.async_record_change("items", "a", None)
+    store.async_delay_save(data_func, 1)
+    await flush_store(store)
+    assert data_func.call_count == 1
+    assert hass_storage[MOCK_KEY]["data"] == {"items": [{"id": "b", "value": 2}]}
+
+    # Fold the journal into the store once it grows too large
+    with patch("homeassistant.helpers.storage.JOURNAL_COMPACT_SIZE", 3):
+        store.async_record_change("items", "c", {"id": "c", "value": 3})
+        store.async_record_change("items", "d", {"id": "d", "value": 4})
+        store.async_delay_save(data_func, 1)
+        await flush_store(store)
+
+    assert data_func.call_count == 2
+
+
+async def test_journaled_store_loads_journal(hass, tmp_path, caplog):
+    """Test a journaled store applies the journal when loading."""
+    hass.config.config_dir = str(tmp_path)
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY, "id")
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    with open(store.path, "w") as fil:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "key": MOCK_KEY,
+                "data": {"items": [{"id": "a", "value": 1}, {"id": "b", "value": 2}]},
+            },
+            fil,
+        )
+
+    with open(store.journal_path, "w") as fil:
+        fil.write(
+            store._encode_changes(
+                [
+                    (("items", "a"), {"id": "a", "value": 3}),
+                    (("items", "b"), None),
+                    (("other", "c"), {"id": "c"}),
+                ]
+            )
+        )
+    data = store._load_data(store.path)
+    assert data["data"] == {
+        "items": [{"id": "a", "value": 3}],
+        "other": [{"id": "c"}],
+    }
+    assert not store._compact
+
+    # A line cut short by a crash is ignored and forces a full write
+    with open(store.journal_path, "a") as fil:
+        fil.write('{"collection": "items", "id": "d", "it')
+    data = store._load_data(store.path)
+    assert data["data"]["items"] == [{"id": "a", "value": 3}]
+    assert store._compact
+    assert "Ignoring invalid journal line" in caplog.text
+
+    await store.async_save(data["data"])
+    assert not (tmp_path / storage.STORAGE_DIR / f"{MOCK_KEY}.journal").exists()
+
+
+async def test_journaled_store_ignores_stale_journal(hass, hass_storage, tmp_path):
+    """Test a journal left behind by a full write is not applied again."""
+    hass.config.config_dir = str(tmp_path)
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY, "id")
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    journal = store._encode_changes([(("items", "a"), {"id": "a", "value": 1})])
+
+    # Every full write starts a new generation
+    store._write_compacted(
+        store.path, {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"items": []}}
+    )
+    assert hass_storage[MOCK_KEY]["journal_generation"] == 1
+
+    # A crash after writing the store file left the journal of generation 0
+    with open(store.path, "w") as fil:
+        json.dump(hass_storage[MOCK_KEY], fil)
+    with open(store.journal_path, "w") as fil:
+        fil.write(journal)
+
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY, "id")
+    data = store._load_data(store.path)
+    assert data["data"] == {"items": []}
+    assert store._compact
+
+    # Changes of the current generation are applied
+    with open(store.journal_path, "a") as fil:
+        fil.write(store._encode_changes([(("items", "b"), {"id": "b"})]))
+    data = store._load_data(store.path)
+    assert data["data"] == {"items": [{"id": "b"}]}
@@ -11,6 +11,7 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     LENGTH_METERS,
     MASS_GRAMS,
     PRESSURE_PA,
@@ -1776,6 +1777,82 @@ def test_closest_function_to_coord(hass):
     assert tpl.async_render() == "test_domain.closest_zone"
 
 
+async def test_async_render_to_info_cache(hass):
+    """Test identical templates share a render until their states change."""
+    hass.states.async_set("sensor.a", "1")
+    hass.states.async_set("sensor.b", "2")
+    template_str = "{{ states('sensor.a') | int + states('sensor.b') | int }}"
+
+    first = template.Template(template_str, hass)
+    second = template.Template(template_str, hass)
+
+    renders = []
+    orig_render = template.Template.async_render
+
+    def counting_render(self, *args, **kwargs):
+        renders.append(self)
+        return orig_render(self, *args, **kwargs)
+
+    with patch.object(template.Template, "async_render", counting_render):
+        first_info = first.async_render_to_info()
+        second_info = second.async_render_to_info()
+        assert len(renders) == 1
+        assert_result_info(second_info, 3, ["sensor.a", "sensor.b"])
+        assert second_info.template is second
+        assert first_info.template is first
+
+        hass.states.async_set("sensor.c", "3")
+        assert_result_info(first.async_render_to_info(), 3, ["sensor.a", "sensor.b"])
+        assert len(renders) == 1
+
+        hass.states.async_set("sensor.b", "5")
+        assert_result_info(second.async_render_to_info(), 6, ["sensor.a", "sensor.b"])
+        assert_result_info(first.async_render_to_info(), 6, ["sensor.a", "sensor.b"])
+        assert len(renders) == 2
+
+        # Renders with variables are not shared
+        first.async_render_to_info({"offset": 1})
+        second.async_render_to_info({"offset": 1})
+        assert len(renders) == 4
+
+        # Renders that depend on time are not shared
+        now_template_str = "{{ now() }} {{ states('sensor.a') }}"
+        template.Template(now_template_str, hass).async_render_to_info()
+        template.Template(now_template_str, hass).async_render_to_info()
+        assert len(renders) == 6
+
+
+async def test_async_render_to_info_cache_volatile(hass):
+    """Test renders that call volatile functions are not shared."""
+    hass.states.async_set("sensor.device_temp", "20")
+
+    renders = []
+    orig_render = template.Template.async_render
+
+    def counting_render(self, *args, **kwargs):
+        renders.append(self)
+        return orig_render(self, *args, **kwargs)
+
+    with patch.object(template.Template, "async_render", counting_render):
+        # Only the functions that are called decide, not the template text
+        template_str = "{{ states('sensor.device_temp') }} device_id closest"
+        template.Template(template_str, hass).async_render_to_info()
+        template.Template(template_str, hass).async_render_to_info()
+        assert len(renders) == 1
+
+        for template_str in (
+            "{{ lipsum(n=1) }}",
+            "{{ [1, 2, 3] | random }}",
+            "{{ device_id('sensor.device_temp') }}",
+            "{{ distance(states.sensor.device_temp) }}",
+        ):
+            renders.clear()
+            info = template.Template(template_str, hass).async_render_to_info()
+            assert info.is_volatile
+            template.Template(template_str, hass).async_render_to_info()
+            assert len(renders) == 2
+
+
 def test_async_render_to_info_with_branching(hass):
     """Test async_render_to_info function by domain."""
     hass.states.async_set("light.a", "off")
@@ -2315,6 +2392,7 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
+@patch("homeassistant.helpers.template.TEMPLATE_CACHE_SIZE", 0)
 async def test_cache_garbage_collection():
     """Test caching a template."""
     template_string = (
@@ -2346,6 +2424,98 @@ async def test_cache_garbage_collection():
     )  # pylint: disable=protected-access
 
 
+async def test_cache_keeps_recently_used():
+    """Test recently used templates stay compiled without a reference."""
+    env = template.TemplateEnvironment(None)
+    env.compile("{{ 1 }}")
+    assert env.cache_stats()["misses"] == 1
+
+    env.compile("{{ 1 }}")
+    stats = env.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["compile_time"] > 0
+
+    with patch("homeassistant.helpers.template.TEMPLATE_CACHE_SIZE", 2):
+        env.compile("{{ 2 }}")
+        env.compile("{{ 1 }}")
+        env.compile("{{ 3 }}")
+        assert list(env.template_lru) == ["{{ 1 }}", "{{ 3 }}"]
+        assert "{{ 2 }}" not in env.template_cache
+
+    assert env.cache_stats()["misses"] == 3
+
+
+async def test_template_cache_stats(hass):
+    """Test template cache statistics are reported per environment."""
+    assert template.async_template_cache_stats(hass) == {}
+
+    template.Template("{{ 1 }}", hass).async_render()
+    template.Template("{{ 1 }}", hass).async_render()
+
+    stats = template.async_template_cache_stats(hass)
+    assert set(stats) == {"default"}
+    assert stats["default"]["hits"] == 1
+    assert stats["default"]["misses"] == 1
+
+    template.Template("{{ 1 }}", hass).async_render(limited=True)
+
+    stats = template.async_template_cache_stats(hass)
+    assert set(stats) == {"default", "limited"}
+
+
+async def test_bytecode_cache(hass, tmp_path):
+    """Test compiled templates are reused across restarts."""
+    hass.config.config_dir = str(tmp_path)
+    cache_file = tmp_path / ".storage" / template.BYTECODE_CACHE_FILE
+
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    assert limited_env.from_string("{{ 2 + 2 }}").render() == "4"
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert cache_file.exists()
+
+    # Simulate a restart
+    hass.data.pop("template.environment")
+    await template.async_load_bytecode_cache(hass)
+
+    with patch("jinja2.Environment.compile") as mock_compile:
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+        limited_env = template.TemplateEnvironment(hass, limited=True)
+        assert limited_env.from_string("{{ 2 + 2 }}").render() == "4"
+
+    assert not mock_compile.called
+
+    # Code is cached per environment
+    default_env = template.TemplateEnvironment(hass)
+    assert default_env.from_string("{{ 2 + 2 }}").render() == "4"
+    assert default_env.compile_time > 0
+
+    # A cache written by another version is ignored
+    hass.data.pop("template.environment")
+    with patch("homeassistant.helpers.template.__version__", "0.0.0"):
+        await template.async_load_bytecode_cache(hass)
+
+    template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+    assert template.async_template_cache_stats(hass)["default"]["compile_time"] > 0
+
+
+async def test_bytecode_cache_corrupt(hass, tmp_path, caplog):
+    """Test a corrupt bytecode cache is ignored."""
+    hass.config.config_dir = str(tmp_path)
+    cache_file = tmp_path / ".storage" / template.BYTECODE_CACHE_FILE
+    cache_file.parent.mkdir()
+    cache = template._BytecodeCache(str(cache_file))
+    cache_file.write_bytes(cache._header + b"\xff")
+
+    await template.async_load_bytecode_cache(hass)
+    assert "Ignoring corrupt template cache" in caplog.text
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+
 def test_is_template_string():
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
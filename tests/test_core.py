@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -14,7 +15,6 @@ import voluptuous as vol
 from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
-    ATTR_SECONDS,
     CONF_UNIT_SYSTEM,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
@@ -27,7 +27,6 @@ from homeassistant.const import (
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
     EVENT_TIME_CHANGED,
-    EVENT_TIMER_OUT_OF_SYNC,
     MATCH_ALL,
     __version__,
 )
@@ -38,6 +37,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -431,6 +431,134 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_entity_listener(hass):
+    """Test listening for events about specific entities."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_entity(
+        "test", ["light.kitchen", "light.bowl"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.ceiling"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.bowl"})
+    hass.bus.async_fire("test", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+
+    assert [call.data["entity_id"] for call in calls] == [
+        "light.kitchen",
+        "light.bowl",
+    ]
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+
+
+async def test_eventbus_domain_listener(hass, caplog):
+    """Test listening for events about entities of domains."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def all_listener(event):
+        """Mock listener for all domains."""
+        all_calls.append(event)
+
+    @ha.callback
+    def failing_listener(event):
+        """Mock listener that raises."""
+        raise ValueError
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data.get("filtered")
+
+    unsub = hass.bus.async_listen_domain(
+        "test", ["light"], listener, event_filter=filter
+    )
+    unsub_all = hass.bus.async_listen_domain("test", [MATCH_ALL], all_listener)
+    unsub_failing = hass.bus.async_listen_domain("test", ["light"], failing_listener)
+    assert hass.bus.async_listeners()["test"] == 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bowl", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "switch.kitchen"})
+    await hass.async_block_till_done()
+
+    assert [call.data["entity_id"] for call in calls] == ["light.kitchen"]
+    assert [call.data["entity_id"] for call in all_calls] == [
+        "light.kitchen",
+        "light.bowl",
+        "switch.kitchen",
+    ]
+    assert "Error while processing test for light.kitchen" in caplog.text
+
+    unsub()
+    unsub_all()
+    unsub_failing()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_time_changed_not_sent_to_match_all(hass):
+    """Test the time changed event only goes to its own listeners."""
+    all_events = async_capture_events(hass, MATCH_ALL)
+    time_events = async_capture_events(hass, EVENT_TIME_CHANGED)
+
+    hass.bus.async_fire(EVENT_TIME_CHANGED, {"now": dt_util.utcnow()})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(time_events) == 1
+    assert [event.event_type for event in all_events] == ["test"]
+
+
+async def test_eventbus_match_all_listener_added_later(hass):
+    """Test a MATCH_ALL listener added after an event type was fired."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+    unsub = hass.bus.async_listen(MATCH_ALL, listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+
+    unsub()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 4
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1046,10 +1174,10 @@ async def test_bad_timezone_raises_value_error(hass):
         await hass.config.async_update(time_zone="not_a_timezone")
 
 
-@patch("homeassistant.core.monotonic")
-def test_create_timer(mock_monotonic, loop):
+def test_create_timer(loop):
     """Test create timer."""
     hass = MagicMock()
+    hass.bus.async_listeners.return_value = {EVENT_TIME_CHANGED: 1}
     funcs = []
     orig_callback = ha.callback
 
@@ -1057,28 +1185,26 @@ def test_create_timer(mock_monotonic, loop):
         funcs.append(func)
         return orig_callback(func)
 
-    mock_monotonic.side_effect = 10.2, 10.8, 11.3
-
     with patch.object(ha, "callback", mock_callback), patch(
         "homeassistant.core.dt_util.utcnow",
         return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
     ):
         ha._async_create_timer(hass)
 
-    assert len(funcs) == 2
-    fire_time_event, stop_timer = funcs
+    assert len(funcs) == 3
+    fire_time_event, listeners_updated, stop_timer = funcs
+    assert hass.bus._time_changed_listeners_updated is listeners_updated
 
     assert len(hass.loop.call_later.mock_calls) == 1
-    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+    delay, callback = hass.loop.call_later.mock_calls[0][1]
     assert abs(delay - 0.666667) < 0.001
     assert callback is fire_time_event
-    assert abs(target - 10.866667) < 0.001
 
     with patch(
         "homeassistant.core.dt_util.utcnow",
         return_value=datetime(2018, 12, 31, 3, 4, 6, 100000),
     ):
-        callback(target)
+        callback()
 
     assert len(hass.bus.async_listen_once.mock_calls) == 1
     assert len(hass.bus.async_fire.mock_calls) == 1
@@ -1088,20 +1214,19 @@ def test_create_timer(mock_monotonic, loop):
     assert event_type == EVENT_HOMEASSISTANT_STOP
     assert callback is stop_timer
 
-    delay, callback, target = hass.loop.call_later.mock_calls[1][1]
+    delay, callback = hass.loop.call_later.mock_calls[1][1]
     assert abs(delay - 0.9) < 0.001
     assert callback is fire_time_event
-    assert abs(target - 12.2) < 0.001
 
     event_type, event_data = hass.bus.async_fire.mock_calls[0][1]
     assert event_type == EVENT_TIME_CHANGED
     assert event_data[ATTR_NOW] == datetime(2018, 12, 31, 3, 4, 6, 100000)
 
 
-@patch("homeassistant.core.monotonic")
-def test_timer_out_of_sync(mock_monotonic, loop):
-    """Test create timer."""
+def test_timer_ticks_only_with_listeners(loop):
+    """Test the timer only ticks while EVENT_TIME_CHANGED has listeners."""
     hass = MagicMock()
+    hass.bus.async_listeners.return_value = {}
     funcs = []
     orig_callback = ha.callback
 
@@ -1109,46 +1234,39 @@ def test_timer_out_of_sync(mock_monotonic, loop):
         funcs.append(func)
         return orig_callback(func)
 
-    mock_monotonic.side_effect = 10.2, 13.3, 13.4
-
-    with patch.object(ha, "callback", mock_callback), patch(
-        "homeassistant.core.dt_util.utcnow",
-        return_value=datetime(2018, 12, 31, 3, 4, 5, 333333),
-    ):
+    with patch.object(ha, "callback", mock_callback):
         ha._async_create_timer(hass)
 
-    delay, callback, target = hass.loop.call_later.mock_calls[0][1]
+    _, listeners_updated, _ = funcs
+    assert hass.loop.call_later.call_count == 0
 
-    with patch(
-        "homeassistant.core.dt_util.utcnow",
-        return_value=datetime(2018, 12, 31, 3, 4, 8, 200000),
-    ):
-        callback(target)
+    listeners_updated(True)
+    assert hass.loop.call_later.call_count == 1
 
-        _, event_0_args, event_0_kwargs = hass.bus.async_fire.mock_calls[0]
-        event_context_0 = event_0_kwargs["context"]
+    # Already ticking
+    listeners_updated(True)
+    assert hass.loop.call_later.call_count == 1
 
-        event_type_0, _ = event_0_args
-        assert event_type_0 == EVENT_TIME_CHANGED
+    listeners_updated(False)
+    assert hass.loop.call_later.return_value.cancel.call_count == 1
 
-        _, event_1_args, event_1_kwargs = hass.bus.async_fire.mock_calls[1]
-        event_type_1, event_data_1 = event_1_args
-        event_context_1 = event_1_kwargs["context"]
+    listeners_updated(True)
+    assert hass.loop.call_later.call_count == 2
 
-        assert event_type_1 == EVENT_TIMER_OUT_OF_SYNC
-        assert abs(event_data_1[ATTR_SECONDS] - 2.433333) < 0.001
 
-        assert event_context_0 == event_context_1
+async def test_bus_reports_time_changed_listeners(hass):
+    """Test the bus reports when EVENT_TIME_CHANGED listeners come and go."""
+    updates = []
+    hass.bus._time_changed_listeners_updated = updates.append
 
-        assert len(funcs) == 2
-        fire_time_event, _ = funcs
+    unsub_1 = hass.bus.async_listen(EVENT_TIME_CHANGED, ha.callback(lambda e: None))
+    unsub_2 = hass.bus.async_listen(EVENT_TIME_CHANGED, ha.callback(lambda e: None))
+    hass.bus.async_listen(EVENT_STATE_CHANGED, ha.callback(lambda e: None))
+    assert updates == [True, True]
 
-    assert len(hass.loop.call_later.mock_calls) == 2
-
-    delay, callback, target = hass.loop.call_later.mock_calls[1][1]
-    assert abs(delay - 0.8) < 0.001
-    assert callback is fire_time_event
-    assert abs(target - 14.2) < 0.001
+    unsub_1()
+    unsub_2()
+    assert updates == [True, True, True, False]
 
 
 async def test_hass_start_starts_the_timer(loop):
@@ -1574,3 +1692,35 @@ async def test_state_change_events_match_state_time(hass):
     state = hass.states.get("light.bedroom")
 
     assert state.last_updated == events[0].time_fired
+
+
+async def test_state_attributes_shared_between_states(hass):
+    """Test unchanged attributes and their JSON are shared with the new state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    old_state = hass.states.get("light.bowl")
+    attributes_json = old_state.attributes_json()
+    assert attributes_json == '{"brightness":100}'
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    new_state = hass.states.get("light.bowl")
+    assert new_state.attributes is old_state.attributes
+    assert new_state.attributes_json() is attributes_json
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes_json() == '{"brightness":50}'
+
+
+def test_state_as_dict_json():
+    """Test the JSON representation of a state matches as_dict."""
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog", "when": datetime(1984, 12, 8, 12, 0, 0)},
+    )
+    assert json.loads(state.as_dict_json()) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
+    assert state.as_dict_json() is state.as_dict_json()
+
+    with pytest.raises(ValueError):
+        ha.State("happy.happy", "on", {"nan": float("nan")}).attributes_json()
@@ -1,4 +1,5 @@
 """Test to verify that we can load components."""
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -481,3 +482,59 @@ async def test_custom_integration_missing(hass, caplog):
 
         with pytest.raises(loader.IntegrationNotFound):
             await loader.async_get_integration(hass, "test1")
+
+
+async def test_get_builtin_integration_from_index(hass):
+    """Test built-in integrations are created from the generated manifest index."""
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "http")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.http"
+    assert integration.file_path == pathlib.Path(http.__file__).parent
+    assert integration.manifest["domain"] == "http"
+    assert integration.is_built_in
+
+
+async def test_custom_components_index(hass, hass_storage, enable_custom_integrations):
+    """Test custom component manifests are indexed and only read when changed."""
+    integrations = await loader._async_get_custom_components(hass)
+    assert "test_package" in integrations
+
+    index = hass_storage[loader.CUSTOM_COMPONENTS_INDEX_KEY]["data"]
+    entry = next(
+        value
+        for path, value in index.items()
+        if path.endswith("test_package/manifest.json")
+    )
+    assert entry["manifest"]["domain"] == "test_package"
+
+    with patch("pathlib.Path.read_text") as mock_read:
+        integrations = await loader._async_get_custom_components(hass)
+
+    assert not mock_read.called
+    assert integrations["test_package"].domain == "test_package"
+
+
+async def test_get_component_records_import_time(hass):
+    """Test importing a component and platform records the import time."""
+    integration = await loader.async_get_integration(hass, "http")
+    integration.get_component()
+    integration.get_platform("view")
+
+    import_time = hass.data[loader.DATA_IMPORT_TIME]
+    assert import_time.keys() == {"http", "http.view"}
+    assert all(seconds >= 0 for seconds in import_time.values())
+
+
+async def test_import_retried_after_deadlock(hass):
+    """Test an import that deadlocked with a preload is retried."""
+    integration = await loader.async_get_integration(hass, "http")
+
+    with patch(
+        "importlib.import_module",
+        side_effect=[RuntimeError("deadlock detected by _ModuleLock('http')"), http],
+    ) as mock_import:
+        assert integration.get_component() is http
+
+    assert mock_import.call_count == 2
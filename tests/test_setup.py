@@ -9,7 +9,8 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 import voluptuous as vol
 
-from homeassistant import config_entries, setup
+from homeassistant import config_entries, loader, setup
+from homeassistant.components import http
 import homeassistant.config as config_util
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
 from homeassistant.core import callback
@@ -18,6 +19,7 @@ from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
     PLATFORM_SCHEMA_BASE,
 )
+from homeassistant.requirements import RequirementsNotFound
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -708,3 +710,39 @@ async def test_async_start_setup_platforms(hass):
     assert "august" not in hass.data[setup.DATA_SETUP_STARTED]
     assert isinstance(hass.data[setup.DATA_SETUP_TIME]["august"], datetime.timedelta)
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
+
+
+async def test_preload_integrations(hass):
+    """Test preloading imports a component after its requirements."""
+    integration = await loader.async_get_integration(hass, "http")
+    components = hass.data.setdefault(loader.DATA_COMPONENTS, {})
+    imported_before_requirements = []
+
+    async def mock_get_integration_with_requirements(hass, domain):
+        imported_before_requirements.append(domain in components)
+        return integration
+
+    with patch(
+        "homeassistant.requirements.async_get_integration_with_requirements",
+        side_effect=mock_get_integration_with_requirements,
+    ):
+        setup.async_preload_integrations(hass, [integration])
+        await hass.data[setup.DATA_PRELOADS]["http"]
+
+    assert imported_before_requirements == [False]
+    assert components["http"] is http
+
+
+async def test_preload_integrations_requirements_failed(hass, caplog):
+    """Test a component is not preloaded when its requirements fail."""
+    integration = await loader.async_get_integration(hass, "http")
+
+    with patch(
+        "homeassistant.requirements.async_get_integration_with_requirements",
+        side_effect=RequirementsNotFound("http", ["broken==1.0"]),
+    ), patch.object(integration, "get_component") as mock_get_component:
+        setup.async_preload_integrations(hass, [integration])
+        await hass.data[setup.DATA_PRELOADS]["http"]
+
+    assert not mock_get_component.called
+    assert "Unable to preload http" in caplog.text